@@ -1,1653 +1,66 @@
+#!/usr/bin/env python3
+# coding: utf-8
+# -*- coding: utf-8 -*-
+
+"""The recorded movements of the wiimote the motion classifier is trained with (see classifier.py). Every record of
+activity.npy holds the 31 Fourier magnitudes of one recording (see features.py) and its label, 0 = resting and 1 and
+2 = the trained movements. The file is memory mapped, so importing this module costs nothing and the data is read
+when it is used.
+The data used to be Python literals in this module (TrainingData.featureVector and TrainingData.trainingDataTest). A
+module in that format is converted once with: python3 activity.py convert old_activity.py"""
+
+import os
+import sys
 import numpy as np
 
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "activity.npy")
+NUM_FEATURES = 31
+
+
+def recordType(numFeatures=NUM_FEATURES):
+    """the record of one recording: its Fourier magnitudes and its label"""
+    return np.dtype([("features", "f8", (numFeatures,)), ("label", "i8")])
+
 
-class TrainingData():
+def load(path=DATA_FILE, mmap=True):
+    """the features with the shape (recordings, 31) and the labels of the recordings, by default memory mapped read
+    only"""
+    records = np.load(path, mmap_mode="r" if mmap else None)
+    if records.dtype.names != recordType().names:
+        raise ValueError("'%s' is not a training data file" % path)
+    return records["features"], records["label"]
 
-    featureVector = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2]
 
+def save(features, labels, path=DATA_FILE):
+    """the features and labels are written to path"""
+    features = np.asarray(features, dtype=float)
+    records = np.zeros(len(features), dtype=recordType(features.shape[1]))
+    records["features"] = features
+    records["label"] = labels
+    np.save(path, records)
 
 
-    trainingDataTest = [np.array([  7.37459262,   5.01211704,   8.58247536,  21.57060951,
-        11.98996482,   4.41400147,   2.51829041,   1.8800857 ,
-        19.4810308 ,   7.5530502 ,   6.33504727,   9.27822943,
-         6.27271163,   3.14292165,   7.13660519,   6.04166667,
-         7.13660519,   3.14292165,   6.27271163,   9.27822943,
-         6.33504727,   7.5530502 ,  19.4810308 ,   1.8800857 ,
-         2.51829041,   4.41400147,  11.98996482,  21.57060951,
-         8.58247536,   5.01211704,   7.37459262]), np.array([ 12.66405286,  10.07321047,  13.30954191,  24.51656074,
-         6.35191249,   4.33641916,   8.60652827,   6.81377409,
-        13.50356365,   1.88510393,   6.3228358 ,   5.79135667,
-         5.45447747,   7.77362382,   1.76883096,   0.10416667,
-         1.76883096,   7.77362382,   5.45447747,   5.79135667,
-         6.3228358 ,   1.88510393,  13.50356365,   6.81377409,
-         8.60652827,   4.33641916,   6.35191249,  24.51656074,
-        13.30954191,  10.07321047,  12.66405286]), np.array([ 11.35955342,   8.73990213,  11.97890219,  23.20395503,
-         7.59354148,   3.13535639,   8.54640663,   7.2865756 ,
-        13.68317886,   2.72713699,   7.65230295,   6.61313761,
-         6.62904996,   9.10695628,   1.39846116,   1.4375    ,
-         1.39846116,   9.10695628,   6.62904996,   6.61313761,
-         7.65230295,   2.72713699,  13.68317886,   7.2865756 ,
-         8.54640663,   3.13535639,   7.59354148,  23.20395503,
-        11.97890219,   8.73990213,  11.35955342]), np.array([  7.04902269,   5.01516576,   8.95671572,  19.80609249,
-         9.61390384,   5.67807113,  12.82058354,  11.32666777,
-         9.37119239,   2.32115693,   6.06457273,   2.31014192,
-         2.44433512,   5.38494465,   4.57788828,   2.875     ,
-         4.57788828,   5.38494465,   2.44433512,   2.31014192,
-         6.06457273,   2.32115693,   9.37119239,  11.32666777,
-        12.82058354,   5.67807113,   9.61390384,  19.80609249,
-         8.95671572,   5.01516576,   7.04902269]), np.array([  8.42000803,   5.7678136 ,   9.10090689,  19.93386292,
-        10.08837777,   4.60133916,  12.47456849,  11.78927851,
-         9.17599575,   3.56171388,   7.21642268,   1.50023363,
-         2.0504473 ,   4.9124785 ,   5.95640776,   4.26041667,
-         5.95640776,   4.9124785 ,   2.0504473 ,   1.50023363,
-         7.21642268,   3.56171388,   9.17599575,  11.78927851,
-        12.47456849,   4.60133916,  10.08837777,  19.93386292,
-         9.10090689,   5.7678136 ,   8.42000803]), np.array([  6.94971576,   5.5335144 ,   9.83253386,  20.93323202,
-         8.5436042 ,   4.27868769,  11.03961665,  10.35616807,
-        10.70253619,   3.93266144,   8.66079881,   2.64408843,
-         3.22512   ,   5.4120591 ,   7.52195297,   5.83333333,
-         7.52195297,   5.4120591 ,   3.22512   ,   2.64408843,
-         8.66079881,   3.93266144,  10.70253619,  10.35616807,
-        11.03961665,   4.27868769,   8.5436042 ,  20.93323202,
-         9.83253386,   5.5335144 ,   6.94971576]), np.array([  6.20542455,   5.94228652,  10.68373125,  21.85829048,
-         7.90840468,   3.42812321,  10.50715746,  10.79583353,
-        10.35793763,   4.60860704,   8.50713096,   1.76594627,
-         2.29924748,   4.74986574,   6.63665182,   4.90625   ,
-         6.63665182,   4.74986574,   2.29924748,   1.76594627,
-         8.50713096,   4.60860704,  10.35793763,  10.79583353,
-        10.50715746,   3.42812321,   7.90840468,  21.85829048,
-        10.68373125,   5.94228652,   6.20542455]), np.array([  6.37482131,   5.73716198,  10.42859036,  21.66331124,
-         7.84326219,   3.62827646,  10.32224984,  10.57227523,
-        10.58267221,   4.83923465,   8.70758818,   1.68595349,
-         2.0977921 ,   4.51663146,   6.41166908,   4.64583333,
-         6.41166908,   4.51663146,   2.0977921 ,   1.68595349,
-         8.70758818,   4.83923465,  10.58267221,  10.57227523,
-        10.32224984,   3.62827646,   7.84326219,  21.66331124,
-        10.42859036,   5.73716198,   6.37482131]), np.array([ 11.30786043,   1.9869801 ,   7.45955603,  22.30154026,
-         2.79388313,   6.6576465 ,   6.01677821,  15.14176355,
-         7.96382983,   8.53623582,   3.05236992,   5.96792497,
-         7.48028301,  11.17448038,  12.20716586,  11.3125    ,
-        12.20716586,  11.17448038,   7.48028301,   5.96792497,
-         3.05236992,   8.53623582,   7.96382983,  15.14176355,
-         6.01677821,   6.6576465 ,   2.79388313,  22.30154026,
-         7.45955603,   1.9869801 ,  11.30786043]), np.array([ 11.63638581,   2.12589049,   7.67412766,  22.66911454,
-         2.39509785,   6.60355768,   6.38990544,  15.40060044,
-         7.54916279,   8.1817172 ,   2.90908985,   5.75942053,
-         7.21015921,  10.77582707,  11.84655273,  10.88541667,
-        11.84655273,  10.77582707,   7.21015921,   5.75942053,
-         2.90908985,   8.1817172 ,   7.54916279,  15.40060044,
-         6.38990544,   6.60355768,   2.39509785,  22.66911454,
-         7.67412766,   2.12589049,  11.63638581]), np.array([ 11.30434818,   2.17298401,   7.19491608,  22.15558409,
-         2.85313198,   7.11314293,   6.06648078,  15.82294753,
-         7.33629325,   8.31037194,   2.40966682,   5.94180166,
-         7.19097036,  10.39974262,  11.47164434,  10.35416667,
-        11.47164434,  10.39974262,   7.19097036,   5.94180166,
-         2.40966682,   8.31037194,   7.33629325,  15.82294753,
-         6.06648078,   7.11314293,   2.85313198,  22.15558409,
-         7.19491608,   2.17298401,  11.30434818]), np.array([ 11.71426323,   1.82612892,   8.05327525,  22.60009317,
-         2.89148525,   6.61215611,   5.51064587,  15.32123121,
-         8.07525259,   9.16960386,   1.76363939,   6.74870606,
-         7.70543287,  10.11430709,  11.02852692,   9.48958333,
-        11.02852692,  10.11430709,   7.70543287,   6.74870606,
-         1.76363939,   9.16960386,   8.07525259,  15.32123121,
-         5.51064587,   6.61215611,   2.89148525,  22.60009317,
-         8.05327525,   1.82612892,  11.71426323]), np.array([ 11.5295447 ,   2.23017564,   7.59459681,  22.74743152,
-         2.33600805,   6.27905933,   6.07156284,  14.81673346,
-         8.49030683,   9.47890311,   2.02611504,   7.30900451,
-         8.29480007,  10.191787  ,  10.8577606 ,   8.875     ,
-        10.8577606 ,  10.191787  ,   8.29480007,   7.30900451,
-         2.02611504,   9.47890311,   8.49030683,  14.81673346,
-         6.07156284,   6.27905933,   2.33600805,  22.74743152,
-         7.59459681,   2.23017564,  11.5295447 ]), np.array([ 11.59442667,   4.67812039,   7.44430614,  24.95479068,
-         1.18294962,   3.79891631,   6.08547488,  13.50965768,
-        10.14005372,  11.13856581,   0.4948682 ,   6.79139201,
-         5.94655265,   9.13291011,  11.28830414,  11.39583333,
-        11.28830414,   9.13291011,   5.94655265,   6.79139201,
-         0.4948682 ,  11.13856581,  10.14005372,  13.50965768,
-         6.08547488,   3.79891631,   1.18294962,  24.95479068,
-         7.44430614,   4.67812039,  11.59442667]), np.array([ 11.52837815,   4.47541836,   7.31209714,  24.756236  ,
-         0.97933284,   3.83778767,   6.27704138,  13.32397132,
-        10.3108655 ,  11.32955175,   0.63169803,   6.93623948,
-         5.84238645,   8.9994469 ,  11.30822918,  11.60416667,
-        11.30822918,   8.9994469 ,   5.84238645,   6.93623948,
-         0.63169803,  11.32955175,  10.3108655 ,  13.32397132,
-         6.27704138,   3.83778767,   0.97933284,  24.756236  ,
-         7.31209714,   4.47541836,  11.52837815]), np.array([ 10.05950029,   3.37700966,   2.53061104,  22.7089478 ,
-         5.04434717,   3.37375191,  10.59575529,  11.85977185,
-        13.62885898,  12.7652954 ,   5.83611058,   1.2180288 ,
-         7.83852713,  14.29804232,  13.12950168,   5.88541667,
-        13.12950168,  14.29804232,   7.83852713,   1.2180288 ,
-         5.83611058,  12.7652954 ,  13.62885898,  11.85977185,
-        10.59575529,   3.37375191,   5.04434717,  22.7089478 ,
-         2.53061104,   3.37700966,  10.05950029]), np.array([ 10.21430468,   7.59169813,   2.46746477,  25.27315973,
-         8.66178039,   4.68836996,  10.134253  ,  16.3165737 ,
-        10.2847484 ,   8.33244974,   4.53327306,   5.41180005,
-         8.44190011,   9.86648443,  10.65990856,  10.34375   ,
-        10.65990856,   9.86648443,   8.44190011,   5.41180005,
-         4.53327306,   8.33244974,  10.2847484 ,  16.3165737 ,
-        10.134253  ,   4.68836996,   8.66178039,  25.27315973,
-         2.46746477,   7.59169813,  10.21430468]), np.array([ 10.23387866,   7.8585003 ,   2.60957088,  25.54269532,
-         8.70275787,   4.59962956,   9.87673351,  16.32487092,
-        10.12098119,   8.40619965,   4.28868548,   5.25658602,
-         8.21611483,  10.10178293,  10.8190136 ,  10.07291667,
-        10.8190136 ,  10.10178293,   8.21611483,   5.25658602,
-         4.28868548,   8.40619965,  10.12098119,  16.32487092,
-         9.87673351,   4.59962956,   8.70275787,  25.54269532,
-         2.60957088,   7.8585003 ,  10.23387866]), np.array([ 10.27313161,   7.59597078,   2.62569403,  25.30205862,
-         8.93263173,   4.91103381,  10.03445029,  16.63713856,
-         9.83947599,   8.16638887,   4.02123913,   5.32629462,
-         7.90361901,  10.29797015,  11.05254377,   9.76041667,
-        11.05254377,  10.29797015,   7.90361901,   5.32629462,
-         4.02123913,   8.16638887,   9.83947599,  16.63713856,
-        10.03445029,   4.91103381,   8.93263173,  25.30205862,
-         2.62569403,   7.59597078,  10.27313161]), np.array([ 11.08167663,   6.6964738 ,   4.17520645,  25.2023489 ,
-        10.85134565,   6.06766444,   8.68094422,  16.82772442,
-         9.52598761,   9.96172753,   4.52239397,   3.76415554,
-         9.60779351,   9.90066029,   9.396264  ,  11.72916667,
-         9.396264  ,   9.90066029,   9.60779351,   3.76415554,
-         4.52239397,   9.96172753,   9.52598761,  16.82772442,
-         8.68094422,   6.06766444,  10.85134565,  25.2023489 ,
-         4.17520645,   6.6964738 ,  11.08167663]), np.array([  9.70299765,   7.01267059,   1.79048594,  23.58377132,
-        10.19593756,   7.3678172 ,  10.87021323,  19.20859601,
-         7.15019112,  10.27721826,   3.96180388,   1.3586309 ,
-        10.98719369,  10.82857727,   7.27742128,  14.13541667,
-         7.27742128,  10.82857727,  10.98719369,   1.3586309 ,
-         3.96180388,  10.27721826,   7.15019112,  19.20859601,
-        10.87021323,   7.3678172 ,  10.19593756,  23.58377132,
-         1.79048594,   7.01267059,   9.70299765]), np.array([  9.54229762,   6.99513386,   1.62503568,  23.33467792,
-        10.37977041,   7.60532352,  10.82749674,  19.24408335,
-         7.24673116,  10.4785972 ,   4.16453468,   1.5517583 ,
-        10.96149525,  10.6348987 ,   7.51097505,  13.88541667,
-         7.51097505,  10.6348987 ,  10.96149525,   1.5517583 ,
-         4.16453468,  10.4785972 ,   7.24673116,  19.24408335,
-        10.82749674,   7.60532352,  10.37977041,  23.33467792,
-         1.62503568,   6.99513386,   9.54229762]), np.array([  7.35906121,   6.31606435,   3.4633776 ,  20.99683258,
-        13.49406854,   8.47906759,   7.64292393,  16.09877888,
-        10.02863679,   7.94007527,   1.67162393,   3.32974946,
-         9.84740896,  13.71298606,   4.39574296,  17.07291667,
-         4.39574296,  13.71298606,   9.84740896,   3.32974946,
-         1.67162393,   7.94007527,  10.02863679,  16.09877888,
-         7.64292393,   8.47906759,  13.49406854,  20.99683258,
-         3.4633776 ,   6.31606435,   7.35906121]), np.array([  5.70999929,   5.92114763,   6.20536358,  21.20961537,
-        14.78620778,   6.99507449,   7.46218027,  15.84409242,
-         8.71677345,   7.40378698,   2.34401791,   1.09076083,
-        11.97127138,  11.00795561,   7.13983461,  14.32291667,
-         7.13983461,  11.00795561,  11.97127138,   1.09076083,
-         2.34401791,   7.40378698,   8.71677345,  15.84409242,
-         7.46218027,   6.99507449,  14.78620778,  21.20961537,
-         6.20536358,   5.92114763,   5.70999929]), np.array([  8.66855369,   8.02350261,   3.88024594,  18.23476901,
-        16.72669081,  10.9008647 ,   3.58097962,  11.93795447,
-        12.20482919,   4.03493868,   4.43128875,   4.43325944,
-        15.87676462,   8.07564742,  11.01958327,  10.41666667,
-        11.01958327,   8.07564742,  15.87676462,   4.43325944,
-         4.43128875,   4.03493868,  12.20482919,  11.93795447,
-         3.58097962,  10.9008647 ,  16.72669081,  18.23476901,
-         3.88024594,   8.02350261,   8.66855369]), np.array([  9.39591466,   8.74216828,   4.18405091,  17.46400877,
-        17.49706036,  11.20994703,   3.38703884,  11.95610098,
-        11.79660842,   4.74428607,   4.472842  ,   3.8000907 ,
-        15.23432889,   8.34205988,  10.28331364,  11.1875    ,
-        10.28331364,   8.34205988,  15.23432889,   3.8000907 ,
-         4.472842  ,   4.74428607,  11.79660842,  11.95610098,
-         3.38703884,  11.20994703,  17.49706036,  17.46400877,
-         4.18405091,   8.74216828,   9.39591466]), np.array([  2.85198682,   2.03507151,   3.62085036,  22.67408524,
-        15.07704822,  16.49180332,   3.71588929,   5.25082665,
-        17.40882008,   8.32472517,  10.93272737,   7.3113727 ,
-        14.17252037,  10.73831294,   5.48622441,  17.91666667,
-         5.48622441,  10.73831294,  14.17252037,   7.3113727 ,
-        10.93272737,   8.32472517,  17.40882008,   5.25082665,
-         3.71588929,  16.49180332,  15.07704822,  22.67408524,
-         3.62085036,   2.03507151,   2.85198682]), np.array([  2.4587197 ,   1.70481186,   3.79982165,  22.75841796,
-        15.37538978,  16.81726084,   3.69172448,   5.31769558,
-        17.16159944,   8.42016543,  10.65466616,   6.91779185,
-        13.9262217 ,  10.62988214,   5.59187344,  17.51041667,
-         5.59187344,  10.62988214,  13.9262217 ,   6.91779185,
-        10.65466616,   8.42016543,  17.16159944,   5.31769558,
-         3.69172448,  16.81726084,  15.37538978,  22.75841796,
-         3.79982165,   1.70481186,   2.4587197 ]), np.array([  1.68086769,   1.5042536 ,   3.81436024,  22.34815443,
-        16.13447405,  16.64758804,   2.92856971,   6.0849206 ,
-        16.65103869,   7.6464072 ,  10.49512135,   7.34236024,
-        14.66458445,  10.54857601,   5.56685561,  18.29166667,
-         5.56685561,  10.54857601,  14.66458445,   7.34236024,
-        10.49512135,   7.6464072 ,  16.65103869,   6.0849206 ,
-         2.92856971,  16.64758804,  16.13447405,  22.34815443,
-         3.81436024,   1.5042536 ,   1.68086769]), np.array([  0.62220992,   3.16280357,   3.45057966,  20.14406708,
-        17.06418191,  14.41718239,   2.8465424 ,   6.11025187,
-        18.68676299,   9.03071734,  12.61269447,   8.03951984,
-        12.47726861,  11.74100186,   5.50400248,  16.01041667,
-         5.50400248,  11.74100186,  12.47726861,   8.03951984,
-        12.61269447,   9.03071734,  18.68676299,   6.11025187,
-         2.8465424 ,  14.41718239,  17.06418191,  20.14406708,
-         3.45057966,   3.16280357,   0.62220992]), np.array([  3.12197412,   5.65984908,   3.32156889,  18.00408464,
-        16.01647693,  13.12275843,   5.32583408,   3.69286627,
-        19.44156705,  10.30864459,  10.70468618,   5.73906968,
-        14.16395808,   9.68699925,   6.08112431,  18.51041667,
-         6.08112431,   9.68699925,  14.16395808,   5.73906968,
-        10.70468618,  10.30864459,  19.44156705,   3.69286627,
-         5.32583408,  13.12275843,  16.01647693,  18.00408464,
-         3.32156889,   5.65984908,   3.12197412]), np.array([  1.57619945,   4.19397591,   4.04221477,  18.40114653,
-        17.58339141,  12.13361165,   5.40290739,   4.48189113,
-        21.02377998,  11.86897926,  11.11359187,   4.23639808,
-        14.59629613,   8.15946202,   7.15116442,  20.11458333,
-         7.15116442,   8.15946202,  14.59629613,   4.23639808,
-        11.11359187,  11.86897926,  21.02377998,   4.48189113,
-         5.40290739,  12.13361165,  17.58339141,  18.40114653,
-         4.04221477,   4.19397591,   1.57619945]), np.array([  2.20209784,   3.31097528,   7.28733882,  17.07526106,
-        20.10713222,   8.90110279,   8.74665617,   2.81627833,
-        21.16507876,  11.75848726,   7.92992735,   6.26734743,
-        15.79851699,  11.49980182,   4.66145118,  16.77083333,
-         4.66145118,  11.49980182,  15.79851699,   6.26734743,
-         7.92992735,  11.75848726,  21.16507876,   2.81627833,
-         8.74665617,   8.90110279,  20.10713222,  17.07526106,
-         7.28733882,   3.31097528,   2.20209784]), np.array([  2.8784052 ,   3.74235136,   7.92284702,  16.46396071,
-        20.07073321,   8.86600679,   8.90589736,   2.12999821,
-        20.47957319,  11.10009606,   8.50182501,   6.234639  ,
-        15.20329174,  10.8788882 ,   5.1857694 ,  17.45833333,
-         5.1857694 ,  10.8788882 ,  15.20329174,   6.234639  ,
-         8.50182501,  11.10009606,  20.47957319,   2.12999821,
-         8.90589736,   8.86600679,  20.07073321,  16.46396071,
-         7.92284702,   3.74235136,   2.8784052 ]), np.array([  3.02413537,   3.87561756,   8.00695627,  16.32472598,
-        19.94679658,   9.00022159,   8.77597988,   2.14492295,
-        20.5194865 ,  11.1938817 ,   8.49964584,   6.13160972,
-        15.34891641,  10.97570112,   5.05571094,  17.3125    ,
-         5.05571094,  10.97570112,  15.34891641,   6.13160972,
-         8.49964584,  11.1938817 ,  20.5194865 ,   2.14492295,
-         8.77597988,   9.00022159,  19.94679658,  16.32472598,
-         8.00695627,   3.87561756,   3.02413537]), np.array([  3.35953088,   4.21931764,   8.02570783,  16.16821759,
-        19.63409983,   9.24789844,   8.56629468,   2.48591955,
-        20.8254642 ,  11.35507379,   8.21731167,   6.47534577,
-        15.07507438,  10.86647212,   5.38695095,  17.65625   ,
-         5.38695095,  10.86647212,  15.07507438,   6.47534577,
-         8.21731167,  11.35507379,  20.8254642 ,   2.48591955,
-         8.56629468,   9.24789844,  19.63409983,  16.16821759,
-         8.02570783,   4.21931764,   3.35953088]), np.array([  7.71202094,   8.57579198,   7.01558701,  18.10884541,
-        19.44557906,   8.74267386,  12.0622957 ,   4.88800349,
-        18.38498199,   6.8887498 ,  12.53666971,   4.53973728,
-        17.06243044,  11.40923917,   0.93425421,  13.14583333,
-         0.93425421,  11.40923917,  17.06243044,   4.53973728,
-        12.53666971,   6.8887498 ,  18.38498199,   4.88800349,
-        12.0622957 ,   8.74267386,  19.44557906,  18.10884541,
-         7.01558701,   8.57579198,   7.71202094]), np.array([  2.78739785,   4.66345395,  12.10826751,  11.36299411,
-        13.76899191,  15.21780425,   8.894251  ,  10.39460685,
-        24.29858326,   8.7428626 ,  16.36335064,  10.68174123,
-        18.38850394,  12.96348699,   6.11660965,   6.11458333,
-         6.11660965,  12.96348699,  18.38850394,  10.68174123,
-        16.36335064,   8.7428626 ,  24.29858326,  10.39460685,
-         8.894251  ,  15.21780425,  13.76899191,  11.36299411,
-        12.10826751,   4.66345395,   2.78739785]), np.array([  3.26273018,   5.29077089,  13.4603793 ,  10.14299325,
-        12.44855934,  16.1140816 ,  10.18391963,  11.01396387,
-        23.46625463,   7.4594522 ,  16.70175173,   9.49612176,
-        18.71357778,  12.88964564,   4.80623102,   7.46875   ,
-         4.80623102,  12.88964564,  18.71357778,   9.49612176,
-        16.70175173,   7.4594522 ,  23.46625463,  11.01396387,
-        10.18391963,  16.1140816 ,  12.44855934,  10.14299325,
-        13.4603793 ,   5.29077089,   3.26273018]), np.array([  6.17472071,   8.40112991,  16.36292463,   9.67209527,
-        11.70941449,  15.02956604,  12.18720664,   8.21943649,
-        21.30197265,   8.34726594,  13.43302388,  10.873815  ,
-        16.23262261,  12.00679681,   8.02951925,   4.01041667,
-         8.02951925,  12.00679681,  16.23262261,  10.873815  ,
-        13.43302388,   8.34726594,  21.30197265,   8.21943649,
-        12.18720664,  15.02956604,  11.70941449,   9.67209527,
-        16.36292463,   8.40112991,   6.17472071]), np.array([  1.91716989,   0.91874362,  14.61018939,   6.57979122,
-         7.39382206,  22.48880359,  17.73451391,  14.43932243,
-        14.73127981,   6.66190494,   8.43629477,  11.77468456,
-         9.1295079 ,  10.58556818,  15.12713216,   3.53125   ,
-        15.12713216,  10.58556818,   9.1295079 ,  11.77468456,
-         8.43629477,   6.66190494,  14.73127981,  14.43932243,
-        17.73451391,  22.48880359,   7.39382206,   6.57979122,
-        14.61018939,   0.91874362,   1.91716989]), np.array([  1.76473266,   2.9157032 ,  13.49477733,   8.1872274 ,
-         9.47383792,  21.49889136,  16.26654623,  15.48261864,
-        15.77091387,   5.20661288,   9.7713025 ,  11.2464073 ,
-         6.96519384,  10.29409265,  17.12873219,   5.71875   ,
-        17.12873219,  10.29409265,   6.96519384,  11.2464073 ,
-         9.7713025 ,   5.20661288,  15.77091387,  15.48261864,
-        16.26654623,  21.49889136,   9.47383792,   8.1872274 ,
-        13.49477733,   2.9157032 ,   1.76473266]), np.array([  4.76926683,   5.98726906,  10.69590083,  11.52985839,
-        12.23234602,  23.92678475,  18.58474133,  18.41961232,
-        12.67903283,   8.53530325,   6.4714803 ,  14.09726705,
-         9.69200789,  12.06792576,  14.44370229,   2.35416667,
-        14.44370229,  12.06792576,   9.69200789,  14.09726705,
-         6.4714803 ,   8.53530325,  12.67903283,  18.41961232,
-        18.58474133,  23.92678475,  12.23234602,  11.52985839,
-        10.69590083,   5.98726906,   4.76926683]), np.array([  4.92513435,   6.10979606,  10.54017839,  11.62984194,
-        12.24322378,  24.06665657,  18.71107541,  18.35033835,
-        12.63998821,   8.49363877,   6.52626715,  13.9477272 ,
-         9.62278932,  11.93098511,  14.54007712,   2.51041667,
-        14.54007712,  11.93098511,   9.62278932,  13.9477272 ,
-         6.52626715,   8.49363877,  12.63998821,  18.35033835,
-        18.71107541,  24.06665657,  12.24322378,  11.62984194,
-        10.54017839,   6.10979606,   4.92513435]), np.array([  6.44689829,   6.99406441,   9.23089966,  11.59929136,
-        11.07871775,  24.01154574,  18.12579604,  16.98859018,
-        14.16951532,   7.33746975,   7.51156835,  14.73001585,
-         9.53452447,  13.45359802,  13.91008937,   0.97916667,
-        13.91008937,  13.45359802,   9.53452447,  14.73001585,
-         7.51156835,   7.33746975,  14.16951532,  16.98859018,
-        18.12579604,  24.01154574,  11.07871775,  11.59929136,
-         9.23089966,   6.99406441,   6.44689829]), np.array([  7.23851304,   7.29147294,   8.94654972,  11.06152688,
-        10.27943851,  23.25206079,  17.31349485,  17.39471366,
-        14.06882287,   8.10261354,   6.70540519,  14.91841388,
-        10.00040762,  12.66789518,  14.07913605,   1.80208333,
-        14.07913605,  12.66789518,  10.00040762,  14.91841388,
-         6.70540519,   8.10261354,  14.06882287,  17.39471366,
-        17.31349485,  23.25206079,  10.27943851,  11.06152688,
-         8.94654972,   7.29147294,   7.23851304]), np.array([  7.09863717,   7.2884179 ,   8.90477594,  11.216991  ,
-        10.3325141 ,  23.36382118,  17.31916571,  17.26062726,
-        14.21861697,   8.10957134,   6.64977212,  15.05363207,
-        10.14755649,  12.54920939,  14.08613086,   1.95833333,
-        14.08613086,  12.54920939,  10.14755649,  15.05363207,
-         6.64977212,   8.10957134,  14.21861697,  17.26062726,
-        17.31916571,  23.36382118,  10.3325141 ,  11.216991  ,
-         8.90477594,   7.2884179 ,   7.09863717]), np.array([  4.61355078,   9.61835116,   6.41182517,  14.63523696,
-         8.58668621,  22.17444122,  13.35478553,  19.69934884,
-        12.83474768,  11.9531106 ,   5.38229712,  11.13226139,
-         6.24219982,  14.85960418,  15.23862686,   2.15625   ,
-        15.23862686,  14.85960418,   6.24219982,  11.13226139,
-         5.38229712,  11.9531106 ,  12.83474768,  19.69934884,
-        13.35478553,  22.17444122,   8.58668621,  14.63523696,
-         6.41182517,   9.61835116,   4.61355078]), np.array([  6.42765182,   6.16954281,   9.94050938,  14.07122627,
-        12.33050756,  26.03287707,  15.63299453,  16.95690322,
-        16.52249125,  14.75928611,   3.18856057,  10.16051433,
-         5.28322975,  16.5263162 ,  17.78235352,   6.07291667,
-        17.78235352,  16.5263162 ,   5.28322975,  10.16051433,
-         3.18856057,  14.75928611,  16.52249125,  16.95690322,
-        15.63299453,  26.03287707,  12.33050756,  14.07122627,
-         9.94050938,   6.16954281,   6.42765182]), np.array([  6.58053648,   5.90650569,  10.2040827 ,  14.26255663,
-        12.53283415,  26.17589481,  15.4711272 ,  17.16558262,
-        16.3949739 ,  14.83687171,   3.43445296,   9.98439795,
-         5.11448884,  16.48609233,  17.5565115 ,   5.80208333,
-        17.5565115 ,  16.48609233,   5.11448884,   9.98439795,
-         3.43445296,  14.83687171,  16.3949739 ,  17.16558262,
-        15.4711272 ,  26.17589481,  12.53283415,  14.26255663,
-        10.2040827 ,   5.90650569,   6.58053648]), np.array([  6.41071721,   6.34994414,   9.90325992,  13.81464778,
-        12.59913648,  26.43771597,  15.87803926,  16.88536847,
-        16.74582006,  15.28289306,   3.82006491,   9.53828377,
-         4.69293257,  16.60333449,  17.14352884,   5.35416667,
-        17.14352884,  16.60333449,   4.69293257,   9.53828377,
-         3.82006491,  15.28289306,  16.74582006,  16.88536847,
-        15.87803926,  26.43771597,  12.59913648,  13.81464778,
-         9.90325992,   6.34994414,   6.41071721]), np.array([  7.6131486 ,   3.92968113,  10.80043147,  16.23087262,
-         9.76260915,  23.33250793,  16.89756484,  14.49785215,
-        19.28905376,  17.01286078,   5.19516119,   7.36264311,
-         1.7281876 ,  18.76621552,  14.01859134,   2.14583333,
-        14.01859134,  18.76621552,   1.7281876 ,   7.36264311,
-         5.19516119,  17.01286078,  19.28905376,  14.49785215,
-        16.89756484,  23.33250793,   9.76260915,  16.23087262,
-        10.80043147,   3.92968113,   7.6131486 ]), np.array([  7.12197807,   6.23198151,  12.11782601,  16.1897676 ,
-        13.54929427,  24.15865425,  12.98167795,  17.62975827,
-        18.07545368,  15.38218542,   5.7987007 ,   9.0449985 ,
-         3.86482943,  22.57784669,   9.98607054,   1.89583333,
-         9.98607054,  22.57784669,   3.86482943,   9.0449985 ,
-         5.7987007 ,  15.38218542,  18.07545368,  17.62975827,
-        12.98167795,  24.15865425,  13.54929427,  16.1897676 ,
-        12.11782601,   6.23198151,   7.12197807]), np.array([  7.86931551,   7.21543409,  13.63218422,  17.54330067,
-        14.1221827 ,  22.87252672,  13.24010073,  16.72303618,
-        19.76294405,  17.06285065,   6.732664  ,   7.37796887,
-         2.21096182,  20.89690452,  11.66376329,   0.20833333,
-        11.66376329,  20.89690452,   2.21096182,   7.37796887,
-         6.732664  ,  17.06285065,  19.76294405,  16.72303618,
-        13.24010073,  22.87252672,  14.1221827 ,  17.54330067,
-        13.63218422,   7.21543409,   7.86931551]), np.array([  7.20913398,   6.95392182,  12.62547314,  16.53895712,
-        14.70525499,  23.79571812,  12.21950489,  17.61369934,
-        19.98399279,  17.55600367,   7.74852404,   6.56906139,
-         1.72223367,  19.99915186,  12.64367447,   0.8125    ,
-        12.64367447,  19.99915186,   1.72223367,   6.56906139,
-         7.74852404,  17.55600367,  19.98399279,  17.61369934,
-        12.21950489,  23.79571812,  14.70525499,  16.53895712,
-        12.62547314,   6.95392182,   7.20913398]), np.array([  6.4098153 ,   7.26582667,  11.83721663,  15.93084253,
-        15.82906785,  23.77844612,  12.07579906,  17.10674843,
-        21.00747592,  18.25733228,   7.27959268,   6.75632493,
-         1.71869328,  20.71649464,  11.65120303,   0.3125    ,
-        11.65120303,  20.71649464,   1.71869328,   6.75632493,
-         7.27959268,  18.25733228,  21.00747592,  17.10674843,
-        12.07579906,  23.77844612,  15.82906785,  15.93084253,
-        11.83721663,   7.26582667,   6.4098153 ]), np.array([  4.33810926,   9.66826974,  11.77040066,  16.95838401,
-        17.65200422,  20.93690818,  15.10493709,  14.3386391 ,
-        19.37839812,  15.30503941,   6.02376945,   8.77251667,
-         3.93321498,  19.95570155,  14.17010354,   2.8125    ,
-        14.17010354,  19.95570155,   3.93321498,   8.77251667,
-         6.02376945,  15.30503941,  19.37839812,  14.3386391 ,
-        15.10493709,  20.93690818,  17.65200422,  16.95838401,
-        11.77040066,   9.66826974,   4.33810926]), np.array([  3.66346502,  10.95991247,  12.65635909,  18.19182141,
-        17.32883609,  19.96784395,  15.68346519,  15.04585728,
-        18.37399417,  15.39606569,   7.24915345,   7.46292306,
-         2.64361297,  19.70824402,  13.25079842,   1.5       ,
-        13.25079842,  19.70824402,   2.64361297,   7.46292306,
-         7.24915345,  15.39606569,  18.37399417,  15.04585728,
-        15.68346519,  19.96784395,  17.32883609,  18.19182141,
-        12.65635909,  10.95991247,   3.66346502]), np.array([  9.55355092,   4.40461263,   5.94689168,  12.25231746,
-        23.99657134,  18.62182281,  21.56396177,  10.10200793,
-        13.4863489 ,   9.85390067,  13.52476638,   6.03527577,
-         5.55828164,  17.12059863,  11.3329825 ,   5.52083333,
-        11.3329825 ,  17.12059863,   5.55828164,   6.03527577,
-        13.52476638,   9.85390067,  13.4863489 ,  10.10200793,
-        21.56396177,  18.62182281,  23.99657134,  12.25231746,
-         5.94689168,   4.40461263,   9.55355092]), np.array([ 11.14642759,   3.75795238,   4.36678699,  12.22125555,
-        25.23199277,  17.14408143,  22.60487764,  11.49472441,
-        12.41362938,  11.38709273,  13.20525156,   4.61991384,
-         4.01544672,  18.05635534,  11.11019056,   3.91666667,
-        11.11019056,  18.05635534,   4.01544672,   4.61991384,
-        13.20525156,  11.38709273,  12.41362938,  11.49472441,
-        22.60487764,  17.14408143,  25.23199277,  12.22125555,
-         4.36678699,   3.75795238,  11.14642759]), np.array([ 12.94271118,   4.42868657,   3.3553049 ,  13.60734331,
-        25.14830505,  15.88725215,  21.57561939,  12.43527077,
-        14.03003184,  11.3216563 ,  11.92359142,   6.39095699,
-         5.30813961,  16.51549842,  11.71117181,   5.71875   ,
-        11.71117181,  16.51549842,   5.30813961,   6.39095699,
-        11.92359142,  11.3216563 ,  14.03003184,  12.43527077,
-        21.57561939,  15.88725215,  25.14830505,  13.60734331,
-         3.3553049 ,   4.42868657,  12.94271118]), np.array([ 13.09333326,   4.55860533,   3.39012924,  13.76217537,
-        25.01761339,  15.95529905,  21.43045825,  12.30772256,
-        14.06682933,  11.17498153,  12.07810069,   6.30046388,
-         5.25842291,  16.66924389,  11.62237824,   5.5625    ,
-        11.62237824,  16.66924389,   5.25842291,   6.30046388,
-        12.07810069,  11.17498153,  14.06682933,  12.30772256,
-        21.43045825,  15.95529905,  25.01761339,  13.76217537,
-         3.39012924,   4.55860533,  13.09333326]), np.array([ 14.5170416 ,   6.11115735,   4.67785987,  14.76883061,
-        23.57680142,  17.5254372 ,  21.77323774,  11.46623307,
-        12.49585061,  12.29796149,  11.4956459 ,   6.21810627,
-         5.05617878,  15.13598484,  12.79297683,   7.13541667,
-        12.79297683,  15.13598484,   5.05617878,   6.21810627,
-        11.4956459 ,  12.29796149,  12.49585061,  11.46623307,
-        21.77323774,  17.5254372 ,  23.57680142,  14.76883061,
-         4.67785987,   6.11115735,  14.5170416 ]), np.array([ 12.83565652,   4.08915888,   2.56587533,  15.02413113,
-        24.0135621 ,  16.94402169,  19.65229853,   9.6644495 ,
-        12.37166178,  11.76723234,  12.91593013,   5.09148998,
-         4.31062053,  13.47585761,  14.69935354,   9.26041667,
-        14.69935354,  13.47585761,   4.31062053,   5.09148998,
-        12.91593013,  11.76723234,  12.37166178,   9.6644495 ,
-        19.65229853,  16.94402169,  24.0135621 ,  15.02413113,
-         2.56587533,   4.08915888,  12.83565652]), np.array([ 10.98857916,   2.94248594,   2.40702087,  18.09520337,
-        21.79054089,  19.97768441,  19.50891996,   8.14519392,
-         8.87019518,  15.26977164,   9.4468473 ,   8.50083148,
-         7.19406177,  15.38770672,  11.24813779,   5.6875    ,
-        11.24813779,  15.38770672,   7.19406177,   8.50083148,
-         9.4468473 ,  15.26977164,   8.87019518,   8.14519392,
-        19.50891996,  19.97768441,  21.79054089,  18.09520337,
-         2.40702087,   2.94248594,  10.98857916]), np.array([ 11.25163087,   2.49079238,   1.41543188,  17.11330843,
-        22.82159747,  19.18055047,  18.48909755,   7.1500003 ,
-         8.48883293,  15.84746455,   9.18932084,   9.39421157,
-         8.21842826,  15.69761931,  10.22299272,   4.65625   ,
-        10.22299272,  15.69761931,   8.21842826,   9.39421157,
-         9.18932084,  15.84746455,   8.48883293,   7.1500003 ,
-        18.48909755,  19.18055047,  22.82159747,  17.11330843,
-         1.41543188,   2.49079238,  11.25163087]), np.array([ 11.24106958,   2.5565298 ,   1.51717543,  17.1603353 ,
-        22.76554388,  19.14888572,  18.5250201 ,   7.17983438,
-         8.57942244,  15.79270913,   9.26311996,   9.42457366,
-         8.29855797,  15.69213686,  10.11918083,   4.55208333,
-        10.11918083,  15.69213686,   8.29855797,   9.42457366,
-         9.26311996,  15.79270913,   8.57942244,   7.17983438,
-        18.5250201 ,  19.14888572,  22.76554388,  17.1603353 ,
-         1.51717543,   2.5565298 ,  11.24106958]), np.array([ 11.19924775,   2.07368471,   1.19424776,  17.34247949,
-        22.54437931,  19.70934634,  19.00653072,   7.71939662,
-         8.95609205,  15.23747079,   9.8148042 ,   9.1761737 ,
-         8.47794833,  15.45987054,   9.5797385 ,   3.98958333,
-         9.5797385 ,  15.45987054,   8.47794833,   9.1761737 ,
-         9.8148042 ,  15.23747079,   8.95609205,   7.71939662,
-        19.00653072,  19.70934634,  22.54437931,  17.34247949,
-         1.19424776,   2.07368471,  11.19924775]), np.array([ 11.70897963,   3.69892708,   1.87338393,  15.86909837,
-        24.16070625,  19.01055123,  17.94841687,   7.44121202,
-         8.11538748,  14.95017792,  10.5626527 ,   7.65460259,
-         8.25499599,  14.32290492,   8.16609267,   2.34375   ,
-         8.16609267,  14.32290492,   8.25499599,   7.65460259,
-        10.5626527 ,  14.95017792,   8.11538748,   7.44121202,
-        17.94841687,  19.01055123,  24.16070625,  15.86909837,
-         1.87338393,   3.69892708,  11.70897963]), np.array([ 11.07468483,   2.51861473,   1.91923552,  17.06694841,
-        23.30581415,  18.15466621,  17.15905111,   6.19406393,
-         6.91287281,  16.05032156,  10.09458306,   6.49718499,
-         7.58977472,  13.21224423,   7.33383427,   1.09375   ,
-         7.33383427,  13.21224423,   7.58977472,   6.49718499,
-        10.09458306,  16.05032156,   6.91287281,   6.19406393,
-        17.15905111,  18.15466621,  23.30581415,  17.06694841,
-         1.91923552,   2.51861473,  11.07468483]), np.array([ 11.22030128,   2.68299   ,   1.73658008,  16.95702335,
-        23.25061762,  18.3711212 ,  17.364775  ,   6.21522443,
-         6.94037621,  16.22594467,   9.8734171 ,   6.41933331,
-         7.38823708,  12.9843677 ,   7.2328701 ,   0.86458333,
-         7.2328701 ,  12.9843677 ,   7.38823708,   6.41933331,
-         9.8734171 ,  16.22594467,   6.94037621,   6.21522443,
-        17.364775  ,  18.3711212 ,  23.25061762,  16.95702335,
-         1.73658008,   2.68299   ,  11.22030128]), np.array([ 10.89096785,   2.53181004,   2.1620104 ,  16.83944475,
-        23.65217793,  18.35041286,  17.47821252,   6.63985494,
-         7.36674426,  16.10473773,   9.55465905,   6.61834255,
-         6.96281314,  12.57516098,   7.14100907,   0.4375    ,
-         7.14100907,  12.57516098,   6.96281314,   6.61834255,
-         9.55465905,  16.10473773,   7.36674426,   6.63985494,
-        17.47821252,  18.35041286,  23.65217793,  16.83944475,
-         2.1620104 ,   2.53181004,  10.89096785]), np.array([ 11.88738845,   2.65664282,   1.30187936,  17.82521532,
-        22.75790517,  17.33396615,  16.35748032,   6.61864213,
-         7.72502117,  14.988094  ,   9.79046197,   7.70793789,
-         6.12891501,  11.72776066,   7.23872295,   0.6875    ,
-         7.23872295,  11.72776066,   6.12891501,   7.70793789,
-         9.79046197,  14.988094  ,   7.72502117,   6.61864213,
-        16.35748032,  17.33396615,  22.75790517,  17.82521532,
-         1.30187936,   2.65664282,  11.88738845]), np.array([ 4.78206043,  2.83649835,  1.54022381,  1.75471854,  1.50106143,
-        1.1004887 ,  0.8169143 ,  0.68504929,  0.72617375,  0.53238878,
-        0.4843362 ,  0.43570982,  0.50634896,  0.39324595,  0.58372974,
-        0.15625   ,  0.58372974,  0.39324595,  0.50634896,  0.43570982,
-        0.4843362 ,  0.53238878,  0.72617375,  0.68504929,  0.8169143 ,
-        1.1004887 ,  1.50106143,  1.75471854,  1.54022381,  2.83649835,
-        4.78206043]), np.array([ 4.37594728,  1.95367855,  1.60561408,  1.47386281,  1.65736521,
-        0.99749763,  0.76302719,  0.94694318,  0.82846519,  0.52640437,
-        0.71437197,  0.67895136,  0.59594742,  0.6643937 ,  0.84870999,
-        0.89583333,  0.84870999,  0.6643937 ,  0.59594742,  0.67895136,
-        0.71437197,  0.52640437,  0.82846519,  0.94694318,  0.76302719,
-        0.99749763,  1.65736521,  1.47386281,  1.60561408,  1.95367855,
-        4.37594728]), np.array([ 4.03771276,  1.136642  ,  1.68437918,  1.10992373,  1.45359084,
-        0.7698905 ,  0.72123843,  0.78533653,  0.52698494,  0.7889936 ,
-        0.49115298,  0.45483116,  0.37549174,  0.33425483,  0.34211109,
-        0.        ,  0.34211109,  0.33425483,  0.37549174,  0.45483116,
-        0.49115298,  0.7889936 ,  0.52698494,  0.78533653,  0.72123843,
-        0.7698905 ,  1.45359084,  1.10992373,  1.68437918,  1.136642  ,
-        4.03771276]), np.array([ 3.8057691 ,  0.58015732,  1.65111648,  0.77505515,  1.05787061,
-        0.48884567,  0.52587769,  0.33088292,  0.13624274,  0.42704592,
-        0.08816622,  0.12051507,  0.20111963,  0.26577849,  0.62659239,
-        0.57291667,  0.62659239,  0.26577849,  0.20111963,  0.12051507,
-        0.08816622,  0.42704592,  0.13624274,  0.33088292,  0.52587769,
-        0.48884567,  1.05787061,  0.77505515,  1.65111648,  0.58015732,
-        3.8057691 ]), np.array([ 3.63470593,  0.22734371,  1.52244607,  0.4783244 ,  0.70371992,
-        0.19695097,  0.2246393 ,  0.1682864 ,  0.22535666,  0.24943547,
-        0.2875396 ,  0.30216097,  0.19140671,  0.23680047,  0.32420887,
-        0.21875   ,  0.32420887,  0.23680047,  0.19140671,  0.30216097,
-        0.2875396 ,  0.24943547,  0.22535666,  0.1682864 ,  0.2246393 ,
-        0.19695097,  0.70371992,  0.4783244 ,  1.52244607,  0.22734371,
-        3.63470593]), np.array([ 3.57193455,  0.14741515,  1.44549834,  0.37421471,  0.65054369,
-        0.09601876,  0.14137606,  0.26781167,  0.21302096,  0.34707725,
-        0.22763601,  0.21333125,  0.08918538,  0.15043832,  0.41478922,
-        0.32291667,  0.41478922,  0.15043832,  0.08918538,  0.21333125,
-        0.22763601,  0.34707725,  0.21302096,  0.26781167,  0.14137606,
-        0.09601876,  0.65054369,  0.37421471,  1.44549834,  0.14741515,
-        3.57193455]), np.array([ 3.48811649,  0.1599038 ,  1.33280542,  0.30795429,  0.71384483,
-        0.1470933 ,  0.22934652,  0.26557393,  0.0991029 ,  0.2878301 ,
-        0.19455468,  0.25387467,  0.18493845,  0.26050881,  0.30525268,
-        0.20833333,  0.30525268,  0.26050881,  0.18493845,  0.25387467,
-        0.19455468,  0.2878301 ,  0.0991029 ,  0.26557393,  0.22934652,
-        0.1470933 ,  0.71384483,  0.30795429,  1.33280542,  0.1599038 ,
-        3.48811649]), np.array([ 3.61212548,  0.10519628,  1.46824973,  0.29730601,  0.56839548,
-        0.06783346,  0.173773  ,  0.40957507,  0.14509236,  0.40522165,
-        0.10655199,  0.26626553,  0.29335736,  0.40481821,  0.16262541,
-        0.0625    ,  0.16262541,  0.40481821,  0.29335736,  0.26626553,
-        0.10655199,  0.40522165,  0.14509236,  0.40957507,  0.173773  ,
-        0.06783346,  0.56839548,  0.29730601,  1.46824973,  0.10519628,
-        3.61212548]), np.array([ 3.79883655,  0.20778783,  1.59154753,  0.24453202,  0.50285507,
-        0.26495863,  0.36947797,  0.47701055,  0.12465173,  0.2767159 ,
-        0.29839027,  0.3912732 ,  0.27606807,  0.25117256,  0.36015865,
-        0.26041667,  0.36015865,  0.25117256,  0.27606807,  0.3912732 ,
-        0.29839027,  0.2767159 ,  0.12465173,  0.47701055,  0.36947797,
-        0.26495863,  0.50285507,  0.24453202,  1.59154753,  0.20778783,
-        3.79883655]), np.array([ 4.06743613,  0.43029451,  1.64948762,  0.22423479,  0.72548   ,
-        0.45210766,  0.51840064,  0.28431967,  0.17742522,  0.22608284,
-        0.23234367,  0.1261269 ,  0.19017457,  0.41651069,  0.10150901,
-        0.01041667,  0.10150901,  0.41651069,  0.19017457,  0.1261269 ,
-        0.23234367,  0.22608284,  0.17742522,  0.28431967,  0.51840064,
-        0.45210766,  0.72548   ,  0.22423479,  1.64948762,  0.43029451,
-        4.06743613]), np.array([ 4.52469716,  0.82104368,  1.57954604,  0.46161399,  1.1499909 ,
-        0.58792662,  0.47874665,  0.24847626,  0.39125393,  0.63748322,
-        0.24363178,  0.52272426,  0.53946633,  0.42549921,  0.53563821,
-        0.44791667,  0.53563821,  0.42549921,  0.53946633,  0.52272426,
-        0.24363178,  0.63748322,  0.39125393,  0.24847626,  0.47874665,
-        0.58792662,  1.1499909 ,  0.46161399,  1.57954604,  0.82104368,
-        4.52469716]), np.array([ 5.03979366,  1.25744939,  1.3526454 ,  0.7981037 ,  1.39635558,
-        0.58828713,  0.30049499,  0.69846061,  0.45294776,  0.52867445,
-        0.50945183,  0.50878661,  0.12917844,  0.29435587,  0.17488362,
-        0.08333333,  0.17488362,  0.29435587,  0.12917844,  0.50878661,
-        0.50945183,  0.52867445,  0.45294776,  0.69846061,  0.30049499,
-        0.58828713,  1.39635558,  0.7981037 ,  1.3526454 ,  1.25744939,
-        5.03979366]), np.array([ 5.15366069,  1.34183534,  1.26065534,  0.83183562,  1.36199134,
-        0.51571986,  0.21601464,  0.67185481,  0.35433019,  0.40470809,
-        0.40505792,  0.38961454,  0.11338549,  0.28975578,  0.17828468,
-        0.04166667,  0.17828468,  0.28975578,  0.11338549,  0.38961454,
-        0.40505792,  0.40470809,  0.35433019,  0.67185481,  0.21601464,
-        0.51571986,  1.36199134,  0.83183562,  1.26065534,  1.34183534,
-        5.15366069]), np.array([ 5.47264968,  1.52836576,  0.88493586,  0.75363504,  1.00942817,
-        0.1427985 ,  0.19680404,  0.293336  ,  0.35684142,  0.68752847,
-        0.53824947,  0.75688588,  0.41871278,  0.33399023,  0.39277811,
-        0.34375   ,  0.39277811,  0.33399023,  0.41871278,  0.75688588,
-        0.53824947,  0.68752847,  0.35684142,  0.293336  ,  0.19680404,
-        0.1427985 ,  1.00942817,  0.75363504,  0.88493586,  1.52836576,
-        5.47264968]), np.array([ 5.61613303,  1.5846245 ,  0.6998397 ,  0.63663495,  0.84047959,
-        0.25525199,  0.34736565,  0.39774756,  0.5171667 ,  0.74089322,
-        0.61936649,  0.67158972,  0.23891913,  0.32257635,  0.2083788 ,
-        0.14583333,  0.2083788 ,  0.32257635,  0.23891913,  0.67158972,
-        0.61936649,  0.74089322,  0.5171667 ,  0.39774756,  0.34736565,
-        0.25525199,  0.84047959,  0.63663495,  0.6998397 ,  1.5846245 ,
-        5.61613303]), np.array([ 5.63452113,  1.58355714,  0.68341029,  0.60660309,  0.84160277,
-        0.28179211,  0.33953758,  0.42042575,  0.49761039,  0.70964546,
-        0.58812034,  0.65805088,  0.25275989,  0.3048558 ,  0.23823519,
-        0.17708333,  0.23823519,  0.3048558 ,  0.25275989,  0.65805088,
-        0.58812034,  0.70964546,  0.49761039,  0.42042575,  0.33953758,
-        0.28179211,  0.84160277,  0.60660309,  0.68341029,  1.58355714,
-        5.63452113]), np.array([ 5.57880735,  1.64307524,  0.68938381,  0.72843708,  0.72835069,
-        0.3284819 ,  0.47494664,  0.52083333,  0.5958828 ,  0.67123999,
-        0.52307642,  0.53337003,  0.2777869 ,  0.20957958,  0.37335163,
-        0.3125    ,  0.37335163,  0.20957958,  0.2777869 ,  0.53337003,
-        0.52307642,  0.67123999,  0.5958828 ,  0.52083333,  0.47494664,
-        0.3284819 ,  0.72835069,  0.72843708,  0.68938381,  1.64307524,
-        5.57880735]), np.array([ 5.57880735,  1.64307524,  0.68938381,  0.72843708,  0.72835069,
-        0.3284819 ,  0.47494664,  0.52083333,  0.5958828 ,  0.67123999,
-        0.52307642,  0.53337003,  0.2777869 ,  0.20957958,  0.37335163,
-        0.3125    ,  0.37335163,  0.20957958,  0.2777869 ,  0.53337003,
-        0.52307642,  0.67123999,  0.5958828 ,  0.52083333,  0.47494664,
-        0.3284819 ,  0.72835069,  0.72843708,  0.68938381,  1.64307524,
-        5.57880735]), np.array([ 5.58010666,  1.59328218,  0.73466157,  0.75068571,  0.7422927 ,
-        0.32059024,  0.52360524,  0.56336739,  0.62258347,  0.62873449,
-        0.47099322,  0.55790138,  0.31540972,  0.26070566,  0.32470505,
-        0.26041667,  0.32470505,  0.26070566,  0.31540972,  0.55790138,
-        0.47099322,  0.62873449,  0.62258347,  0.56336739,  0.52360524,
-        0.32059024,  0.7422927 ,  0.75068571,  0.73466157,  1.59328218,
-        5.58010666]), np.array([ 5.57500548,  1.562162  ,  0.76579051,  0.78048202,  0.72313158,
-        0.34880484,  0.54041086,  0.5812836 ,  0.59365449,  0.62183257,
-        0.48898722,  0.56654156,  0.28439112,  0.2303159 ,  0.35111376,
-        0.29166667,  0.35111376,  0.2303159 ,  0.28439112,  0.56654156,
-        0.48898722,  0.62183257,  0.59365449,  0.5812836 ,  0.54041086,
-        0.34880484,  0.72313158,  0.78048202,  0.76579051,  1.562162  ,
-        5.57500548]), np.array([ 5.56055971,  1.52542006,  0.7987373 ,  0.81756911,  0.68152946,
-        0.38026608,  0.5119004 ,  0.54823739,  0.58674437,  0.66276295,
-        0.50448222,  0.52990519,  0.3222453 ,  0.26483842,  0.32145675,
-        0.25      ,  0.32145675,  0.26483842,  0.3222453 ,  0.52990519,
-        0.50448222,  0.66276295,  0.58674437,  0.54823739,  0.5119004 ,
-        0.38026608,  0.68152946,  0.81756911,  0.7987373 ,  1.52542006,
-        5.56055971]), np.array([ 5.51768297,  1.47440648,  0.83018345,  0.84777964,  0.64330188,
-        0.36563527,  0.44191191,  0.50021697,  0.66992522,  0.62139152,
-        0.42257485,  0.61061406,  0.28534371,  0.22605452,  0.37193284,
-        0.33333333,  0.37193284,  0.22605452,  0.28534371,  0.61061406,
-        0.42257485,  0.62139152,  0.66992522,  0.50021697,  0.44191191,
-        0.36563527,  0.64330188,  0.84777964,  0.83018345,  1.47440648,
-        5.51768297]), np.array([ 5.6947174 ,  1.55793537,  0.90765871,  0.97235348,  0.55057248,
-        0.61791393,  0.40968085,  0.30918379,  0.7771383 ,  0.81629968,
-        0.29964279,  0.77927087,  0.43254706,  0.35590885,  0.55396811,
-        0.59375   ,  0.55396811,  0.35590885,  0.43254706,  0.77927087,
-        0.29964279,  0.81629968,  0.7771383 ,  0.30918379,  0.40968085,
-        0.61791393,  0.55057248,  0.97235348,  0.90765871,  1.55793537,
-        5.6947174 ]), np.array([ 5.8753473 ,  1.57628285,  1.10111777,  1.18868546,  0.3646065 ,
-        0.76077275,  0.22291   ,  0.17179607,  0.94528798,  0.6425048 ,
-        0.19851923,  0.79781329,  0.21611835,  0.15962738,  0.43257115,
-        0.375     ,  0.43257115,  0.15962738,  0.21611835,  0.79781329,
-        0.19851923,  0.6425048 ,  0.94528798,  0.17179607,  0.22291   ,
-        0.76077275,  0.3646065 ,  1.18868546,  1.10111777,  1.57628285,
-        5.8753473 ]), np.array([ 5.72170049,  1.62388304,  0.93671414,  1.06091305,  0.52663806,
-        0.83300948,  0.37205701,  0.04166667,  1.07244681,  0.717975  ,
-        0.10545837,  0.94298486,  0.08744257,  0.05068837,  0.4326419 ,
-        0.20833333,  0.4326419 ,  0.05068837,  0.08744257,  0.94298486,
-        0.10545837,  0.717975  ,  1.07244681,  0.04166667,  0.37205701,
-        0.83300948,  0.52663806,  1.06091305,  0.93671414,  1.62388304,
-        5.72170049]), np.array([ 5.3349505 ,  1.91123208,  0.70762514,  1.11773654,  0.77054837,
-        1.22590912,  0.50013582,  0.35416667,  1.29604714,  0.33667312,
-        0.48773926,  0.58017456,  0.38878074,  0.40408122,  0.46200937,
-        0.60416667,  0.46200937,  0.40408122,  0.38878074,  0.58017456,
-        0.48773926,  0.33667312,  1.29604714,  0.35416667,  0.50013582,
-        1.22590912,  0.77054837,  1.11773654,  0.70762514,  1.91123208,
-        5.3349505 ]), np.array([ 4.92884976,  2.30330368,  0.87850898,  1.49230601,  0.83659432,
-        1.39820992,  0.41940751,  0.53895556,  0.969328  ,  0.52563413,
-        0.38153805,  0.78741855,  0.31428234,  0.10810657,  0.50768132,
-        0.19791667,  0.50768132,  0.10810657,  0.31428234,  0.78741855,
-        0.38153805,  0.52563413,  0.969328  ,  0.53895556,  0.41940751,
-        1.39820992,  0.83659432,  1.49230601,  0.87850898,  2.30330368,
-        4.92884976]), np.array([ 4.30370847,  2.9329802 ,  1.49455855,  2.08398744,  0.72711654,
-        1.16185667,  0.3217323 ,  0.49410588,  0.83269826,  0.93755293,
-        0.30696494,  1.01608581,  0.39608041,  0.58656453,  0.48158134,
-        0.83333333,  0.48158134,  0.58656453,  0.39608041,  1.01608581,
-        0.30696494,  0.93755293,  0.83269826,  0.49410588,  0.3217323 ,
-        1.16185667,  0.72711654,  2.08398744,  1.49455855,  2.9329802 ,
-        4.30370847]), np.array([ 3.55607366,  3.67262851,  2.27508609,  2.56536221,  0.64048454,
-        0.42090479,  0.74845379,  0.50270535,  1.63093323,  0.54259232,
-        0.83546264,  0.21417244,  0.69333872,  0.44570475,  0.74208082,
-        0.01041667,  0.74208082,  0.44570475,  0.69333872,  0.21417244,
-        0.83546264,  0.54259232,  1.63093323,  0.50270535,  0.74845379,
-        0.42090479,  0.64048454,  2.56536221,  2.27508609,  3.67262851,
-        3.55607366]), np.array([ 3.31753659,  3.89795108,  2.49282616,  2.57710077,  0.58609686,
-        0.18159032,  0.75002579,  0.4178369 ,  1.54555309,  0.25882291,
-        0.60627985,  0.52150079,  0.38305003,  0.19054708,  0.47436676,
-        0.32291667,  0.47436676,  0.19054708,  0.38305003,  0.52150079,
-        0.60627985,  0.25882291,  1.54555309,  0.4178369 ,  0.75002579,
-        0.18159032,  0.58609686,  2.57710077,  2.49282616,  3.89795108,
-        3.31753659]), np.array([ 3.16843171,  4.01596993,  2.5642267 ,  2.42029996,  0.41562867,
-        0.40700317,  0.52182753,  0.15934436,  1.30694513,  0.50055227,
-        0.57963714,  0.41379701,  0.60050112,  0.43106393,  0.71414475,
-        0.0625    ,  0.71414475,  0.43106393,  0.60050112,  0.41379701,
-        0.57963714,  0.50055227,  1.30694513,  0.15934436,  0.52182753,
-        0.40700317,  0.41562867,  2.42029996,  2.5642267 ,  4.01596993,
-        3.16843171]), np.array([ 3.06337884,  4.06308712,  2.50008132,  2.10349807,  0.09882691,
-        0.66627667,  0.36443249,  0.33088292,  1.52349039,  0.56098339,
-        0.85106583,  0.34294838,  0.51775604,  0.11991714,  0.39587142,
-        0.38541667,  0.39587142,  0.11991714,  0.51775604,  0.34294838,
-        0.85106583,  0.56098339,  1.52349039,  0.33088292,  0.36443249,
-        0.66627667,  0.09882691,  2.10349807,  2.50008132,  4.06308712,
-        3.06337884]), np.array([ 3.05679416,  4.04487575,  2.43884384,  2.02552579,  0.05514052,
-        0.66510844,  0.45372791,  0.38414769,  1.57511717,  0.46769679,
-        0.77122652,  0.40033251,  0.46917391,  0.1920897 ,  0.48958191,
-        0.29166667,  0.48958191,  0.1920897 ,  0.46917391,  0.40033251,
-        0.77122652,  0.46769679,  1.57511717,  0.38414769,  0.45372791,
-        0.66510844,  0.05514052,  2.02552579,  2.43884384,  4.04487575,
-        3.05679416]), np.array([ 3.11621344,  3.88328884,  2.14069421,  1.99216783,  0.36413659,
-        0.40724617,  0.65774337,  0.25086655,  1.2948105 ,  0.63105093,
-        0.83393922,  0.08848636,  0.75643357,  0.24668645,  0.18915973,
-        0.60416667,  0.18915973,  0.24668645,  0.75643357,  0.08848636,
-        0.83393922,  0.63105093,  1.2948105 ,  0.25086655,  0.65774337,
-        0.40724617,  0.36413659,  1.99216783,  2.14069421,  3.88328884,
-        3.11621344]), np.array([ 2.95153264,  4.25239911,  2.58594818,  1.71049169,  0.37632087,
-        0.84952198,  0.95554782,  0.70863964,  1.50042974,  0.61934989,
-        0.69232975,  0.39142206,  1.20395454,  0.69921615,  0.32839168,
-        1.0625    ,  0.32839168,  0.69921615,  1.20395454,  0.39142206,
-        0.69232975,  0.61934989,  1.50042974,  0.70863964,  0.95554782,
-        0.84952198,  0.37632087,  1.71049169,  2.58594818,  4.25239911,
-        2.95153264]), np.array([ 2.71859485,  4.84502011,  3.03554013,  1.12970475,  0.97934882,
-        1.14091329,  1.46710447,  0.94464867,  0.97683492,  1.1398154 ,
-        1.24270913,  0.37590144,  0.87227667,  0.21551255,  0.28480023,
-        0.45833333,  0.28480023,  0.21551255,  0.87227667,  0.37590144,
-        1.24270913,  1.1398154 ,  0.97683492,  0.94464867,  1.46710447,
-        1.14091329,  0.97934882,  1.12970475,  3.03554013,  4.84502011,
-        2.71859485]), np.array([ 2.43664847,  5.67304902,  3.39631142,  0.51333188,  1.59257316,
-        1.10615251,  1.50613796,  0.63950189,  0.9633898 ,  0.82016069,
-        0.78407027,  0.47157659,  1.03454782,  0.85170386,  0.58896182,
-        1.30208333,  0.58896182,  0.85170386,  1.03454782,  0.47157659,
-        0.78407027,  0.82016069,  0.9633898 ,  0.63950189,  1.50613796,
-        1.10615251,  1.59257316,  0.51333188,  3.39631142,  5.67304902,
-        2.43664847]), np.array([ 2.30729724,  6.06369104,  3.41275131,  0.81857339,  1.67368478,
-        0.82720128,  1.13403378,  0.21474508,  1.36044207,  0.41438937,
-        0.54868634,  0.31982812,  1.11640326,  0.55922847,  0.13087911,
-        0.84375   ,  0.13087911,  0.55922847,  1.11640326,  0.31982812,
-        0.54868634,  0.41438937,  1.36044207,  0.21474508,  1.13403378,
-        0.82720128,  1.67368478,  0.81857339,  3.41275131,  6.06369104,
-        2.30729724]), np.array([ 2.22764319,  6.2111996 ,  3.30764901,  1.05518759,  1.53704712,
-        0.588155  ,  0.95286824,  0.19654127,  1.23501946,  0.63662148,
-        0.77618769,  0.15263649,  0.9277384 ,  0.61137495,  0.36746178,
-        1.08333333,  0.36746178,  0.61137495,  0.9277384 ,  0.15263649,
-        0.77618769,  0.63662148,  1.23501946,  0.19654127,  0.95286824,
-        0.588155  ,  1.53704712,  1.05518759,  3.30764901,  6.2111996 ,
-        2.22764319]), np.array([ 2.13847779,  6.27312897,  3.13308157,  1.19237631,  1.32895618,
-        0.56018732,  1.08358322,  0.38919879,  1.07899797,  0.65227111,
-        0.6338403 ,  0.35063314,  1.13413355,  0.64124072,  0.17812375,
-        0.875     ,  0.17812375,  0.64124072,  1.13413355,  0.35063314,
-        0.6338403 ,  0.65227111,  1.07899797,  0.38919879,  1.08358322,
-        0.56018732,  1.32895618,  1.19237631,  3.13308157,  6.27312897,
-        2.13847779]), np.array([ 1.98970296,  6.25804208,  2.84142105,  1.22788207,  1.17798652,
-        0.84052034,  1.33978284,  0.41926275,  1.33151855,  0.36700315,
-        0.60186339,  0.19238109,  0.88328521,  0.5052645 ,  0.43251893,
-        1.16666667,  0.43251893,  0.5052645 ,  0.88328521,  0.19238109,
-        0.60186339,  0.36700315,  1.33151855,  0.41926275,  1.33978284,
-        0.84052034,  1.17798652,  1.22788207,  2.84142105,  6.25804208,
-        1.98970296]), np.array([ 1.87907272,  6.18375151,  2.6867932 ,  1.14210628,  1.28458237,
-        0.96159892,  1.30662486,  0.26516504,  1.39330057,  0.50566266,
-        0.75312731,  0.14679272,  0.9665833 ,  0.63474301,  0.28327632,
-        0.97916667,  0.28327632,  0.63474301,  0.9665833 ,  0.14679272,
-        0.75312731,  0.50566266,  1.39330057,  0.26516504,  1.30662486,
-        0.96159892,  1.28458237,  1.14210628,  2.6867932 ,  6.18375151,
-        1.87907272]), np.array([ 1.82095929,  6.12506096,  2.65849214,  1.06523193,  1.36768365,
-        0.93238639,  1.22364223,  0.21449229,  1.3117989 ,  0.52938531,
-        0.67816757,  0.19610718,  0.97346117,  0.555753  ,  0.33411539,
-        1.0625    ,  0.33411539,  0.555753  ,  0.97346117,  0.19610718,
-        0.67816757,  0.52938531,  1.3117989 ,  0.21449229,  1.22364223,
-        0.93238639,  1.36768365,  1.06523193,  2.65849214,  6.12506096,
-        1.82095929]), np.array([ 2.02087573,  6.34628258,  2.60785095,  1.29120557,  1.26657067,
-        1.17141821,  1.31264384,  0.11646187,  1.33825598,  0.76890562,
-        0.6938219 ,  0.43563291,  1.14483018,  0.3166018 ,  0.50444498,
-        1.30208333,  0.50444498,  0.3166018 ,  1.14483018,  0.43563291,
-        0.6938219 ,  0.76890562,  1.33825598,  0.11646187,  1.31264384,
-        1.17141821,  1.26657067,  1.29120557,  2.60785095,  6.34628258,
-        2.02087573]), np.array([ 2.85780212,  7.22126894,  2.10506393,  1.86395632,  1.9173196 ,
-        1.74226391,  0.82376047,  0.7725909 ,  0.46327457,  0.90462359,
-        0.3259345 ,  0.65139954,  0.29086429,  1.1658716 ,  0.63192639,
-        0.42708333,  0.63192639,  1.1658716 ,  0.29086429,  0.65139954,
-        0.3259345 ,  0.90462359,  0.46327457,  0.7725909 ,  0.82376047,
-        1.74226391,  1.9173196 ,  1.86395632,  2.10506393,  7.22126894,
-        2.85780212]), np.array([ 3.11790624,  7.46202009,  1.88516306,  1.91352392,  2.15783067,
-        1.69504431,  0.56334436,  0.79849033,  0.57174122,  0.65880539,
-        0.46084283,  0.40810686,  0.54976684,  0.94819684,  0.40611761,
-        0.6875    ,  0.40611761,  0.94819684,  0.54976684,  0.40810686,
-        0.46084283,  0.65880539,  0.57174122,  0.79849033,  0.56334436,
-        1.69504431,  2.15783067,  1.91352392,  1.88516306,  7.46202009,
-        3.11790624]), np.array([ 3.03552705,  7.40283868,  1.9684904 ,  1.95673357,  2.14124345,
-        1.7751604 ,  0.58553223,  0.87920616,  0.52023255,  0.66437219,
-        0.54244704,  0.38999554,  0.61737787,  0.9092573 ,  0.33385066,
-        0.77083333,  0.33385066,  0.9092573 ,  0.61737787,  0.38999554,
-        0.54244704,  0.66437219,  0.52023255,  0.87920616,  0.58553223,
-        1.7751604 ,  2.14124345,  1.95673357,  1.9684904 ,  7.40283868,
-        3.03552705]), np.array([ 3.02574358,  7.39885483,  1.97722703,  1.966896  ,  2.14873103,
-        1.78160648,  0.57659645,  0.88173253,  0.5298084 ,  0.65431959,
-        0.53846465,  0.38361719,  0.6134159 ,  0.90987281,  0.34353079,
-        0.76041667,  0.34353079,  0.90987281,  0.6134159 ,  0.38361719,
-        0.53846465,  0.65431959,  0.5298084 ,  0.88173253,  0.57659645,
-        1.78160648,  2.14873103,  1.966896  ,  1.97722703,  7.39885483,
-        3.02574358]), np.array([ 1.22484214,  0.24750184,  0.58197279,  0.43611259,  0.05578777,
-        0.19208472,  0.23360469,  0.04419417,  0.34405263,  0.00462308,
-        0.16084156,  0.11178901,  0.0594027 ,  0.07157888,  0.2746029 ,
-        0.04166667,  0.2746029 ,  0.07157888,  0.0594027 ,  0.11178901,
-        0.16084156,  0.00462308,  0.34405263,  0.04419417,  0.23360469,
-        0.19208472,  0.05578777,  0.43611259,  0.58197279,  0.24750184,
-        1.22484214]), np.array([ 1.19384313,  0.25615005,  0.54704124,  0.41841811,  0.08824056,
-        0.24067408,  0.19317706,  0.03755783,  0.31521629,  0.05662002,
-        0.13254256,  0.16288704,  0.10005667,  0.02067494,  0.29779788,
-        0.09375   ,  0.29779788,  0.02067494,  0.10005667,  0.16288704,
-        0.13254256,  0.05662002,  0.31521629,  0.03755783,  0.19317706,
-        0.24067408,  0.08824056,  0.41841811,  0.54704124,  0.25615005,
-        1.19384313]), np.array([ 1.21680324,  0.23825108,  0.57712747,  0.40446007,  0.09502427,
-        0.24065749,  0.21950264,  0.06588078,  0.3394174 ,  0.07404644,
-        0.15158769,  0.18292255,  0.13119031,  0.02229898,  0.31965773,
-        0.125     ,  0.31965773,  0.02229898,  0.13119031,  0.18292255,
-        0.15158769,  0.07404644,  0.3394174 ,  0.06588078,  0.21950264,
-        0.24065749,  0.09502427,  0.40446007,  0.57712747,  0.23825108,
-        1.21680324]), np.array([ 1.26174851,  0.19822313,  0.62674009,  0.35611882,  0.14639464,
-        0.29044562,  0.20836955,  0.09603692,  0.30218535,  0.10577357,
-        0.10040174,  0.19128733,  0.09573322,  0.03180533,  0.27704897,
-        0.07291667,  0.27704897,  0.03180533,  0.09573322,  0.19128733,
-        0.10040174,  0.10577357,  0.30218535,  0.09603692,  0.20836955,
-        0.29044562,  0.14639464,  0.35611882,  0.62674009,  0.19822313,
-        1.26174851]), np.array([ 1.32116835,  0.14214453,  0.66805625,  0.29891309,  0.19347927,
-        0.33258642,  0.14633032,  0.07291667,  0.26975587,  0.05785514,
-        0.13568069,  0.13919384,  0.11302637,  0.04104487,  0.33400846,
-        0.13541667,  0.33400846,  0.04104487,  0.11302637,  0.13919384,
-        0.13568069,  0.05785514,  0.26975587,  0.07291667,  0.14633032,
-        0.33258642,  0.19347927,  0.29891309,  0.66805625,  0.14214453,
-        1.32116835]), np.array([  1.39365594e+00,   7.09708113e-02,   6.84096346e-01,
-         2.83755960e-01,   2.05756658e-01,   3.13937938e-01,
-         1.39941273e-01,   4.01943669e-14,   3.40842967e-01,
-         6.22926098e-02,   1.64891459e-01,   2.11935327e-01,
-         1.36215141e-01,   3.21355027e-02,   2.62722772e-01,
-         6.25000000e-02,   2.62722772e-01,   3.21355027e-02,
-         1.36215141e-01,   2.11935327e-01,   1.64891459e-01,
-         6.22926098e-02,   3.40842967e-01,   4.01943669e-14,
-         1.39941273e-01,   3.13937938e-01,   2.05756658e-01,
-         2.83755960e-01,   6.84096346e-01,   7.09708113e-02,
-         1.39365594e+00]), np.array([ 1.48704496,  0.02371884,  0.66109397,  0.35156259,  0.16811802,
-        0.22414236,  0.23367428,  0.09375   ,  0.3537659 ,  0.13433785,
-        0.0712928 ,  0.16501031,  0.06092552,  0.06709436,  0.35640892,
-        0.15625   ,  0.35640892,  0.06709436,  0.06092552,  0.16501031,
-        0.0712928 ,  0.13433785,  0.3537659 ,  0.09375   ,  0.23367428,
-        0.22414236,  0.16811802,  0.35156259,  0.66109397,  0.02371884,
-        1.48704496]), np.array([ 1.59744066,  0.13808721,  0.58723687,  0.46552096,  0.07889669,
-        0.16959384,  0.28098536,  0.14804865,  0.23965586,  0.09344154,
-        0.16149899,  0.14979834,  0.17196334,  0.04966193,  0.24409912,
-        0.04166667,  0.24409912,  0.04966193,  0.17196334,  0.14979834,
-        0.16149899,  0.09344154,  0.23965586,  0.14804865,  0.28098536,
-        0.16959384,  0.07889669,  0.46552096,  0.58723687,  0.13808721,
-        1.59744066]), np.array([ 1.70098106,  0.2472195 ,  0.48138674,  0.54601047,  0.03636912,
-        0.27159763,  0.219176  ,  0.11646187,  0.27435776,  0.03055766,
-        0.17931827,  0.23069038,  0.08424266,  0.06613959,  0.35124316,
-        0.15625   ,  0.35124316,  0.06613959,  0.08424266,  0.23069038,
-        0.17931827,  0.03055766,  0.27435776,  0.11646187,  0.219176  ,
-        0.27159763,  0.03636912,  0.54601047,  0.48138674,  0.2472195 ,
-        1.70098106]), np.array([ 1.81258113,  0.36591318,  0.34815777,  0.57182362,  0.15411961,
-        0.3777244 ,  0.08847395,  0.02946278,  0.38716336,  0.147706  ,
-        0.04673224,  0.1012785 ,  0.15338152,  0.07371706,  0.24088392,
-        0.02083333,  0.24088392,  0.07371706,  0.15338152,  0.1012785 ,
-        0.04673224,  0.147706  ,  0.38716336,  0.02946278,  0.08847395,
-        0.3777244 ,  0.15411961,  0.57182362,  0.34815777,  0.36591318,
-        1.81258113]), np.array([ 1.89598449,  0.4534599 ,  0.28074137,  0.52923857,  0.22303263,
-        0.37722695,  0.15958287,  0.09603692,  0.32775162,  0.12684721,
-        0.15585096,  0.17574821,  0.15127154,  0.04323362,  0.32046763,
-        0.13541667,  0.32046763,  0.04323362,  0.15127154,  0.17574821,
-        0.15585096,  0.12684721,  0.32775162,  0.09603692,  0.15958287,
-        0.37722695,  0.22303263,  0.52923857,  0.28074137,  0.4534599 ,
-        1.89598449]), np.array([ 1.99322068,  0.55286041,  0.33682253,  0.39953838,  0.25787345,
-        0.25622524,  0.29069524,  0.16470196,  0.21719032,  0.03501893,
-        0.1692116 ,  0.20959035,  0.09294806,  0.11350917,  0.24870961,
-        0.02083333,  0.24870961,  0.11350917,  0.09294806,  0.20959035,
-        0.1692116 ,  0.03501893,  0.21719032,  0.16470196,  0.29069524,
-        0.25622524,  0.25787345,  0.39953838,  0.33682253,  0.55286041,
-        1.99322068]), np.array([ 2.01376049,  0.57080583,  0.37574865,  0.3580697 ,  0.2428456 ,
-        0.21703891,  0.28494564,  0.14508738,  0.25660768,  0.05748312,
-        0.12755039,  0.1687309 ,  0.11023288,  0.07559727,  0.25285851,
-        0.02083333,  0.25285851,  0.07559727,  0.11023288,  0.1687309 ,
-        0.12755039,  0.05748312,  0.25660768,  0.14508738,  0.28494564,
-        0.21703891,  0.2428456 ,  0.3580697 ,  0.37574865,  0.57080583,
-        2.01376049]), np.array([ 2.03114543,  0.5776031 ,  0.42646762,  0.32772673,  0.19368089,
-        0.2224579 ,  0.23339974,  0.09827064,  0.26720145,  0.02907863,
-        0.16299694,  0.21453208,  0.06460389,  0.11479108,  0.25888994,
-        0.03125   ,  0.25888994,  0.11479108,  0.06460389,  0.21453208,
-        0.16299694,  0.02907863,  0.26720145,  0.09827064,  0.23339974,
-        0.2224579 ,  0.19368089,  0.32772673,  0.42646762,  0.5776031 ,
-        2.03114543]), np.array([ 2.04781421,  0.56488962,  0.49612249,  0.36056144,  0.12806726,
-        0.31524395,  0.21918016,  0.1679637 ,  0.17424535,  0.06663504,
-        0.19664755,  0.20249048,  0.15822121,  0.09681121,  0.23733204,
-        0.0625    ,  0.23733204,  0.09681121,  0.15822121,  0.20249048,
-        0.19664755,  0.06663504,  0.17424535,  0.1679637 ,  0.21918016,
-        0.31524395,  0.12806726,  0.36056144,  0.49612249,  0.56488962,
-        2.04781421]), np.array([ 2.0490785 ,  0.54082487,  0.51885162,  0.42063494,  0.16482737,
-        0.35018361,  0.28121038,  0.20623948,  0.18715671,  0.07878835,
-        0.13415569,  0.15913261,  0.11014483,  0.07586588,  0.25935096,
-        0.        ,  0.25935096,  0.07586588,  0.11014483,  0.15913261,
-        0.13415569,  0.07878835,  0.18715671,  0.20623948,  0.28121038,
-        0.35018361,  0.16482737,  0.42063494,  0.51885162,  0.54082487,
-        2.0490785 ]), np.array([ 2.0373917 ,  0.48885503,  0.51221793,  0.49443665,  0.24701557,
-        0.31802348,  0.31635359,  0.15866194,  0.26116613,  0.01845823,
-        0.19235094,  0.24183421,  0.14604276,  0.13107253,  0.21748642,
-        0.08333333,  0.21748642,  0.13107253,  0.14604276,  0.24183421,
-        0.19235094,  0.01845823,  0.26116613,  0.15866194,  0.31635359,
-        0.31802348,  0.24701557,  0.49443665,  0.51221793,  0.48885503,
-        2.0373917 ]), np.array([ 1.99424518,  0.36708802,  0.44498924,  0.56645315,  0.34535181,
-        0.16377991,  0.22911413,  0.06336211,  0.21660218,  0.13780447,
-        0.25247149,  0.15620475,  0.19888936,  0.0359178 ,  0.32867763,
-        0.07291667,  0.32867763,  0.0359178 ,  0.19888936,  0.15620475,
-        0.25247149,  0.13780447,  0.21660218,  0.06336211,  0.22911413,
-        0.16377991,  0.34535181,  0.56645315,  0.44498924,  0.36708802,
-        1.99424518]), np.array([ 1.91507008,  0.19441596,  0.31380314,  0.56757415,  0.38339052,
-        0.17536212,  0.03574655,  0.27103358,  0.03293119,  0.20166186,
-        0.05157924,  0.17835146,  0.04679711,  0.19472666,  0.15857407,
-        0.13541667,  0.15857407,  0.19472666,  0.04679711,  0.17835146,
-        0.05157924,  0.20166186,  0.03293119,  0.27103358,  0.03574655,
-        0.17536212,  0.38339052,  0.56757415,  0.31380314,  0.19441596,
-        1.91507008]), np.array([ 1.85912691,  0.10450886,  0.22326158,  0.51217876,  0.34122889,
-        0.28658121,  0.14286123,  0.29017476,  0.14751021,  0.1144196 ,
-        0.1249125 ,  0.21509689,  0.13499848,  0.08702034,  0.25545416,
-        0.02083333,  0.25545416,  0.08702034,  0.13499848,  0.21509689,
-        0.1249125 ,  0.1144196 ,  0.14751021,  0.29017476,  0.14286123,
-        0.28658121,  0.34122889,  0.51217876,  0.22326158,  0.10450886,
-        1.85912691]), np.array([ 1.74153844,  0.1232616 ,  0.05174109,  0.33608004,  0.17148202,
-        0.37981008,  0.28265889,  0.12715162,  0.22204577,  0.16398659,
-        0.21616812,  0.04301805,  0.07486375,  0.2599337 ,  0.07766071,
-        0.21875   ,  0.07766071,  0.2599337 ,  0.07486375,  0.04301805,
-        0.21616812,  0.16398659,  0.22204577,  0.12715162,  0.28265889,
-        0.37981008,  0.17148202,  0.33608004,  0.05174109,  0.1232616 ,
-        1.74153844]), np.array([ 1.62768634,  0.26384042,  0.12662517,  0.1753159 ,  0.033014  ,
-        0.34387234,  0.28336317,  0.09603692,  0.13733855,  0.25843374,
-        0.0863677 ,  0.20590779,  0.09292326,  0.16442649,  0.23280925,
-        0.05208333,  0.23280925,  0.16442649,  0.09292326,  0.20590779,
-        0.0863677 ,  0.25843374,  0.13733855,  0.09603692,  0.28336317,
-        0.34387234,  0.033014  ,  0.1753159 ,  0.12662517,  0.26384042,
-        1.62768634]), np.array([ 1.52290181,  0.37406449,  0.24060448,  0.17323281,  0.16312597,
-        0.22606132,  0.17679389,  0.21750639,  0.03467899,  0.15515322,
-        0.11468127,  0.13316699,  0.06864241,  0.19588706,  0.09741086,
-        0.1875    ,  0.09741086,  0.19588706,  0.06864241,  0.13316699,
-        0.11468127,  0.15515322,  0.03467899,  0.21750639,  0.17679389,
-        0.22606132,  0.16312597,  0.17323281,  0.24060448,  0.37406449,
-        1.52290181]), np.array([ 1.45105891,  0.43095441,  0.29512961,  0.25207212,  0.22643731,
-        0.15980714,  0.11107476,  0.20937241,  0.11713066,  0.13152435,
-        0.1481541 ,  0.10945539,  0.0163341 ,  0.19698333,  0.18008841,
-        0.10416667,  0.18008841,  0.19698333,  0.0163341 ,  0.10945539,
-        0.1481541 ,  0.13152435,  0.11713066,  0.20937241,  0.11107476,
-        0.15980714,  0.22643731,  0.25207212,  0.29512961,  0.43095441,
-        1.45105891]), np.array([ 1.3924995 ,  0.46062947,  0.31568628,  0.30803066,  0.23556681,
-        0.19312069,  0.15772538,  0.14731391,  0.11683242,  0.19064252,
-        0.08621686,  0.15782515,  0.05535251,  0.16857174,  0.12147979,
-        0.16666667,  0.12147979,  0.16857174,  0.05535251,  0.15782515,
-        0.08621686,  0.19064252,  0.11683242,  0.14731391,  0.15772538,
-        0.19312069,  0.23556681,  0.30803066,  0.31568628,  0.46062947,
-        1.3924995 ]), np.array([ 1.33092494,  0.47478098,  0.31197427,  0.33579426,  0.20094389,
-        0.25331048,  0.20653526,  0.15166896,  0.05465562,  0.15983046,
-        0.12514998,  0.09817356,  0.0210748 ,  0.21443451,  0.1758346 ,
-        0.10416667,  0.1758346 ,  0.21443451,  0.0210748 ,  0.09817356,
-        0.12514998,  0.15983046,  0.05465562,  0.15166896,  0.20653526,
-        0.25331048,  0.20094389,  0.33579426,  0.31197427,  0.47478098,
-        1.33092494]), np.array([ 1.26843815,  0.47267201,  0.28442425,  0.32664074,  0.13916756,
-        0.27013846,  0.19249506,  0.21245915,  0.08495497,  0.1215109 ,
-        0.14503463,  0.13529903,  0.04476092,  0.1546316 ,  0.12997079,
-        0.16666667,  0.12997079,  0.1546316 ,  0.04476092,  0.13529903,
-        0.14503463,  0.1215109 ,  0.08495497,  0.21245915,  0.19249506,
-        0.27013846,  0.13916756,  0.32664074,  0.28442425,  0.47267201,
-        1.26843815]), np.array([ 1.13658459,  0.44340977,  0.19135999,  0.24343308,  0.10679041,
-        0.1980821 ,  0.06057976,  0.22845534,  0.19135734,  0.25673778,
-        0.01204605,  0.18629908,  0.1092486 ,  0.28997873,  0.22662992,
-        0.03125   ,  0.22662992,  0.28997873,  0.1092486 ,  0.18629908,
-        0.01204605,  0.25673778,  0.19135734,  0.22845534,  0.06057976,
-        0.1980821 ,  0.10679041,  0.24343308,  0.19135999,  0.44340977,
-        1.13658459]), np.array([ 0.9883013 ,  0.39791846,  0.08467954,  0.10113013,  0.27185248,
-        0.03642744,  0.14120545,  0.10259227,  0.16905555,  0.25267011,
-        0.17817877,  0.02015878,  0.06935991,  0.15314556,  0.15135232,
-        0.19791667,  0.15135232,  0.15314556,  0.06935991,  0.02015878,
-        0.17817877,  0.25267011,  0.16905555,  0.10259227,  0.14120545,
-        0.03642744,  0.27185248,  0.10113013,  0.08467954,  0.39791846,
-        0.9883013 ]), np.array([ 0.94932641,  0.37710636,  0.06750802,  0.04961472,  0.3071289 ,
-        0.02993055,  0.1744207 ,  0.05892557,  0.11794814,  0.20081003,
-        0.15642437,  0.07012027,  0.01878791,  0.17601141,  0.15083714,
-        0.14583333,  0.15083714,  0.17601141,  0.01878791,  0.07012027,
-        0.15642437,  0.20081003,  0.11794814,  0.05892557,  0.1744207 ,
-        0.02993055,  0.3071289 ,  0.04961472,  0.06750802,  0.37710636,
-        0.94932641]), np.array([ 0.89720462,  0.32133225,  0.0803963 ,  0.05863602,  0.30526394,
-        0.12161451,  0.1476421 ,  0.14168198,  0.14798255,  0.25894679,
-        0.12006152,  0.07676858,  0.10425009,  0.18225814,  0.1801964 ,
-        0.23958333,  0.1801964 ,  0.18225814,  0.10425009,  0.07676858,
-        0.12006152,  0.25894679,  0.14798255,  0.14168198,  0.1476421 ,
-        0.12161451,  0.30526394,  0.05863602,  0.0803963 ,  0.32133225,
-        0.89720462]), np.array([ 0.86699022,  0.24690647,  0.14365814,  0.16102614,  0.23738705,
-        0.18136553,  0.05017333,  0.19901014,  0.23064592,  0.31110043,
-        0.2163579 ,  0.02762772,  0.07602763,  0.13782482,  0.13047946,
-        0.13541667,  0.13047946,  0.13782482,  0.07602763,  0.02762772,
-        0.2163579 ,  0.31110043,  0.23064592,  0.19901014,  0.05017333,
-        0.18136553,  0.23738705,  0.16102614,  0.14365814,  0.24690647,
-        0.86699022]), np.array([ 0.86987106,  0.15812085,  0.21592291,  0.24922108,  0.12294629,
-        0.18313938,  0.08467664,  0.14731391,  0.17997043,  0.2036475 ,
-        0.1479519 ,  0.09968684,  0.06798889,  0.21807087,  0.20214185,
-        0.25      ,  0.20214185,  0.21807087,  0.06798889,  0.09968684,
-        0.1479519 ,  0.2036475 ,  0.17997043,  0.14731391,  0.08467664,
-        0.18313938,  0.12294629,  0.24922108,  0.21592291,  0.15812085,
-        0.86987106]), np.array([ 0.8970624 ,  0.09367297,  0.25489977,  0.28212699,  0.09758526,
-        0.13297043,  0.14892612,  0.06588078,  0.10732647,  0.21619447,
-        0.11989817,  0.05356903,  0.0914157 ,  0.137179  ,  0.13220027,
-        0.16666667,  0.13220027,  0.137179  ,  0.0914157 ,  0.05356903,
-        0.11989817,  0.21619447,  0.10732647,  0.06588078,  0.14892612,
-        0.13297043,  0.09758526,  0.28212699,  0.25489977,  0.09367297,
-        0.8970624 ]), np.array([ 0.88594064,  0.1120432 ,  0.25473593,  0.28777354,  0.08000054,
-        0.15379969,  0.15614764,  0.0625    ,  0.09230948,  0.2012774 ,
-        0.10285102,  0.0697137 ,  0.11189287,  0.11643524,  0.11473642,
-        0.14583333,  0.11473642,  0.11643524,  0.11189287,  0.0697137 ,
-        0.10285102,  0.2012774 ,  0.09230948,  0.0625    ,  0.15614764,
-        0.15379969,  0.08000054,  0.28777354,  0.25473593,  0.1120432 ,
-        0.88594064]), np.array([ 0.9522911 ,  0.01907266,  0.21411838,  0.20890442,  0.17112296,
-        0.14798491,  0.06786354,  0.15625   ,  0.16647216,  0.11880505,
-        0.03196364,  0.16264818,  0.20112058,  0.05584431,  0.04880614,
-        0.05208333,  0.04880614,  0.05584431,  0.20112058,  0.16264818,
-        0.03196364,  0.11880505,  0.16647216,  0.15625   ,  0.06786354,
-        0.14798491,  0.17112296,  0.20890442,  0.21411838,  0.01907266,
-        0.9522911 ]), np.array([ 0.9522911 ,  0.01907266,  0.21411838,  0.20890442,  0.17112296,
-        0.14798491,  0.06786354,  0.15625   ,  0.16647216,  0.11880505,
-        0.03196364,  0.16264818,  0.20112058,  0.05584431,  0.04880614,
-        0.05208333,  0.04880614,  0.05584431,  0.20112058,  0.16264818,
-        0.03196364,  0.11880505,  0.16647216,  0.15625   ,  0.06786354,
-        0.14798491,  0.17112296,  0.20890442,  0.21411838,  0.01907266,
-        0.9522911 ]), np.array([ 0.90366338,  0.06961921,  0.26582359,  0.2451271 ,  0.20338317,
-        0.12973623,  0.01772613,  0.20833333,  0.20456409,  0.06745532,
-        0.02281208,  0.1749986 ,  0.19941185,  0.04916595,  0.08953583,
-        0.10416667,  0.08953583,  0.04916595,  0.19941185,  0.1749986 ,
-        0.02281208,  0.06745532,  0.20456409,  0.20833333,  0.01772613,
-        0.12973623,  0.20338317,  0.2451271 ,  0.26582359,  0.06961921,
-        0.90366338]), np.array([ 0.85247406,  0.11773909,  0.31292846,  0.25379441,  0.25476567,
-        0.17588971,  0.06048489,  0.21474508,  0.16874416,  0.10641485,
-        0.03579614,  0.12858686,  0.17119029,  0.07123281,  0.04160259,
-        0.05208333,  0.04160259,  0.07123281,  0.17119029,  0.12858686,
-        0.03579614,  0.10641485,  0.16874416,  0.21474508,  0.06048489,
-        0.17588971,  0.25476567,  0.25379441,  0.31292846,  0.11773909,
-        0.85247406]), np.array([ 0.75872551,  0.19921094,  0.37251279,  0.22298545,  0.30683502,
-        0.25179115,  0.13280674,  0.12586506,  0.12779658,  0.15203353,
-        0.06758653,  0.22091129,  0.25641962,  0.03749922,  0.13300033,
-        0.14583333,  0.13300033,  0.03749922,  0.25641962,  0.22091129,
-        0.06758653,  0.15203353,  0.12779658,  0.12586506,  0.13280674,
-        0.25179115,  0.30683502,  0.22298545,  0.37251279,  0.19921094,
-        0.75872551]), np.array([ 0.63676843,  0.30129778,  0.41594171,  0.14408587,  0.30014534,
-        0.26792983,  0.16124105,  0.13581672,  0.25269773,  0.06276761,
-        0.08358863,  0.17575144,  0.13841814,  0.11480845,  0.01232876,
-        0.02083333,  0.01232876,  0.11480845,  0.13841814,  0.17575144,
-        0.08358863,  0.06276761,  0.25269773,  0.13581672,  0.16124105,
-        0.26792983,  0.30014534,  0.14408587,  0.41594171,  0.30129778,
-        0.63676843]), np.array([  6.13876403,   1.94688123,   4.25906805,   1.28005814,
-         1.26011852,  23.21388178,   6.04246714,   1.90832651,
-         6.12489658,   1.67736667,   7.56115074,  16.48204757,
-         7.02620454,   2.46072957,   1.3147471 ,   3.54166667,
-         1.3147471 ,   2.46072957,   7.02620454,  16.48204757,
-         7.56115074,   1.67736667,   6.12489658,   1.90832651,
-         6.04246714,  23.21388178,   1.26011852,   1.28005814,
-         4.25906805,   1.94688123,   6.13876403]), np.array([  9.06972849,   3.68775509,   4.64216293,   4.10696899,
-         2.5363354 ,  24.32191731,   7.39310683,   5.28646603,
-         4.93392324,   2.08982336,   9.4878948 ,  13.50608281,
-         3.98192567,   2.51272972,   3.68256269,   6.94791667,
-         3.68256269,   2.51272972,   3.98192567,  13.50608281,
-         9.4878948 ,   2.08982336,   4.93392324,   5.28646603,
-         7.39310683,  24.32191731,   2.5363354 ,   4.10696899,
-         4.64216293,   3.68775509,   9.06972849]), np.array([  6.27539192,   3.50904084,   2.17483066,   4.14915891,
-         4.11592923,  20.31157765,   4.1204883 ,   6.38527223,
-         8.87909522,   5.68300758,   9.44687606,  13.22740216,
-         4.57754008,   6.39220248,   7.39255544,  10.95833333,
-         7.39255544,   6.39220248,   4.57754008,  13.22740216,
-         9.44687606,   5.68300758,   8.87909522,   6.38527223,
-         4.1204883 ,  20.31157765,   4.11592923,   4.14915891,
-         2.17483066,   3.50904084,   6.27539192]), np.array([  6.99299988,   2.41498552,   3.35286685,   2.66579201,
-         2.69082568,  20.95437022,   3.38840564,   5.16377817,
-         9.50662894,   6.08927419,   8.41738907,  14.46231402,
-         6.07208094,   7.9305198 ,   8.82685706,  12.53125   ,
-         8.82685706,   7.9305198 ,   6.07208094,  14.46231402,
-         8.41738907,   6.08927419,   9.50662894,   5.16377817,
-         3.38840564,  20.95437022,   2.69082568,   2.66579201,
-         3.35286685,   2.41498552,   6.99299988]), np.array([  7.82515832,   1.42100958,   5.12286653,   1.18431942,
-         3.1596453 ,  19.8278217 ,   1.63291657,   6.52420207,
-        10.93654484,   7.45172248,  10.18594269,  12.71469924,
-         4.42274871,   6.52310785,   7.41074187,  10.76041667,
-         7.41074187,   6.52310785,   4.42274871,  12.71469924,
-        10.18594269,   7.45172248,  10.93654484,   6.52420207,
-         1.63291657,  19.8278217 ,   3.1596453 ,   1.18431942,
-         5.12286653,   1.42100958,   7.82515832]), np.array([  9.24696513,   2.38520501,   7.54867195,   3.13807874,
-         5.91911023,  17.17718803,   3.1984818 ,   8.40242194,
-         9.2118518 ,   5.32933728,   9.07304741,  14.47876606,
-         6.30683876,   8.10889723,   9.36381561,  13.52083333,
-         9.36381561,   8.10889723,   6.30683876,  14.47876606,
-         9.07304741,   5.32933728,   9.2118518 ,   8.40242194,
-         3.1984818 ,  17.17718803,   5.91911023,   3.13807874,
-         7.54867195,   2.38520501,   9.24696513]), np.array([  9.50851102,   2.74232399,   7.85863917,   3.64279562,
-         6.24447072,  17.13802804,   3.58328348,   8.06667097,
-         8.82674522,   5.11535096,   8.7329123 ,  14.49774007,
-         6.14886167,   7.93080788,   9.02431895,  12.97916667,
-         9.02431895,   7.93080788,   6.14886167,  14.49774007,
-         8.7329123 ,   5.11535096,   8.82674522,   8.06667097,
-         3.58328348,  17.13802804,   6.24447072,   3.64279562,
-         7.85863917,   2.74232399,   9.50851102]), np.array([  9.85459634,   3.22816113,   7.95959143,   4.13157013,
-         6.03215577,  17.98709034,   3.21315953,   7.33762304,
-         9.62785103,   6.05237307,   9.6685717 ,  13.81440119,
-         5.90739185,   7.90212547,   9.476118  ,  13.91666667,
-         9.476118  ,   7.90212547,   5.90739185,  13.81440119,
-         9.6685717 ,   6.05237307,   9.62785103,   7.33762304,
-         3.21315953,  17.98709034,   6.03215577,   4.13157013,
-         7.95959143,   3.22816113,   9.85459634]), np.array([  9.62195189,   3.64460663,   9.46674907,   5.30585262,
-         8.66359675,  16.0472464 ,   6.02100848,   5.87906183,
-         9.13042538,   7.64769408,  11.35170771,  11.00202448,
-         4.42609716,   7.38430773,  10.7704957 ,  16.72916667,
-        10.7704957 ,   7.38430773,   4.42609716,  11.00202448,
-        11.35170771,   7.64769408,   9.13042538,   5.87906183,
-         6.02100848,  16.0472464 ,   8.66359675,   5.30585262,
-         9.46674907,   3.64460663,   9.62195189]), np.array([  9.71311798,   3.13941537,   4.65933267,   0.50707484,
-         5.66179157,  14.40217874,   7.36110584,  10.9690072 ,
-         4.0423239 ,   7.33470722,  11.33668568,   8.22993362,
-         3.32513082,   7.24294699,  13.71103952,  21.98958333,
-        13.71103952,   7.24294699,   3.32513082,   8.22993362,
-        11.33668568,   7.33470722,   4.0423239 ,  10.9690072 ,
-         7.36110584,  14.40217874,   5.66179157,   0.50707484,
-         4.65933267,   3.13941537,   9.71311798]), np.array([  9.71212683,   3.13507256,   4.66974749,   0.51479024,
-         5.65491696,  14.41228659,   7.3516532 ,  10.97093105,
-         4.03657869,   7.32671048,  11.3295837 ,   8.23479289,
-         3.32504097,   7.24243357,  13.71663155,  22.        ,
-        13.71663155,   7.24243357,   3.32504097,   8.23479289,
-        11.3295837 ,   7.32671048,   4.03657869,  10.97093105,
-         7.3516532 ,  14.41228659,   5.65491696,   0.51479024,
-         4.66974749,   3.13507256,   9.71212683]), np.array([  9.92399888,   4.59578521,   2.61120222,   2.73615156,
-         8.88720822,  12.75061728,   7.30505065,   7.80036558,
-         6.74676117,   4.69541009,   8.13817826,  11.38057032,
-         3.07968102,   6.55049795,  15.19880325,  25.25      ,
-        15.19880325,   6.55049795,   3.07968102,  11.38057032,
-         8.13817826,   4.69541009,   6.74676117,   7.80036558,
-         7.30505065,  12.75061728,   8.88720822,   2.73615156,
-         2.61120222,   4.59578521,   9.92399888]), np.array([ 10.01128269,   4.18651767,   2.62065353,   1.93161502,
-         8.20016661,  11.66263737,   8.89029651,   7.53862306,
-         7.86809868,   5.60123771,   7.69857021,  12.84257921,
-         3.32893484,   6.14601511,  15.8993331 ,  26.94791667,
-        15.8993331 ,   6.14601511,   3.32893484,  12.84257921,
-         7.69857021,   5.60123771,   7.86809868,   7.53862306,
-         8.89029651,  11.66263737,   8.20016661,   1.93161502,
-         2.62065353,   4.18651767,  10.01128269]), np.array([  9.76569776,   3.98166493,   2.95283159,   1.56795568,
-         7.70745338,  12.4924032 ,   8.49299992,   8.39203931,
-         7.44287887,   6.42126299,   8.34618877,  13.10966615,
-         3.28400566,   5.78460554,  16.15475613,  27.80208333,
-        16.15475613,   5.78460554,   3.28400566,  13.10966615,
-         8.34618877,   6.42126299,   7.44287887,   8.39203931,
-         8.49299992,  12.4924032 ,   7.70745338,   1.56795568,
-         2.95283159,   3.98166493,   9.76569776]), np.array([ 10.25314034,   4.59151354,   2.06994115,   2.49495409,
-         8.73854305,  12.3686818 ,   7.6878963 ,   8.49572247,
-         6.45665975,   6.63250699,   9.33483564,  12.70831746,
-         2.92070129,   5.12584569,  16.32319689,  28.83333333,
-        16.32319689,   5.12584569,   2.92070129,  12.70831746,
-         9.33483564,   6.63250699,   6.45665975,   8.49572247,
-         7.6878963 ,  12.3686818 ,   8.73854305,   2.49495409,
-         2.06994115,   4.59151354,  10.25314034]), np.array([  7.97472117,   2.0365908 ,   6.56631151,   2.46848414,
-         7.20009299,   8.60643192,  11.57907162,   4.11807605,
-         8.30992021,   4.2032306 ,  11.55674469,   8.80029627,
-         3.18504838,   2.72859106,  16.92766296,  33.33333333,
-        16.92766296,   2.72859106,   3.18504838,   8.80029627,
-        11.55674469,   4.2032306 ,   8.30992021,   4.11807605,
-        11.57907162,   8.60643192,   7.20009299,   2.46848414,
-         6.56631151,   2.0365908 ,   7.97472117]), np.array([  8.34725723,   2.30235652,   5.96390788,   1.80005655,
-         6.63671086,   9.26347317,  11.76120303,   3.9370315 ,
-         8.95863963,   3.49751184,  11.37259265,   8.08020695,
-         3.45731914,   2.58251566,  16.99546437,  34.0625    ,
-        16.99546437,   2.58251566,   3.45731914,   8.08020695,
-        11.37259265,   3.49751184,   8.95863963,   3.9370315 ,
-        11.76120303,   9.26347317,   6.63671086,   1.80005655,
-         5.96390788,   2.30235652,   8.34725723]), np.array([  7.17433349,   1.39823588,   6.83097308,   2.94938709,
-         8.45231667,   9.51927207,   9.90485162,   5.78500254,
-         8.6707095 ,   2.75487939,   9.65352255,   7.15864591,
-         3.74977798,   2.42725206,  16.94522964,  35.92708333,
-        16.94522964,   2.42725206,   3.74977798,   7.15864591,
-         9.65352255,   2.75487939,   8.6707095 ,   5.78500254,
-         9.90485162,   9.51927207,   8.45231667,   2.94938709,
-         6.83097308,   1.39823588,   7.17433349]), np.array([  7.54947967,   1.65823821,   6.84047085,   2.91067564,
-         8.27033046,   9.00523411,   9.96717961,   5.86510137,
-         8.15583937,   3.22024949,   9.21300458,   7.36699002,
-         3.69318383,   2.43633691,  16.86579987,  36.44791667,
-        16.86579987,   2.43633691,   3.69318383,   7.36699002,
-         9.21300458,   3.22024949,   8.15583937,   5.86510137,
-         9.96717961,   9.00523411,   8.27033046,   2.91067564,
-         6.84047085,   1.65823821,   7.54947967]), np.array([  7.41639129,   1.52403437,   6.74764188,   2.80069977,
-         8.17619501,   9.08906537,  10.11450128,   5.7120008 ,
-         8.1032127 ,   3.3362616 ,   9.21254831,   7.51441353,
-         3.60359642,   2.39968437,  16.8151942 ,  36.60416667,
-        16.8151942 ,   2.39968437,   3.60359642,   7.51441353,
-         9.21254831,   3.3362616 ,   8.1032127 ,   5.7120008 ,
-        10.11450128,   9.08906537,   8.17619501,   2.80069977,
-         6.74764188,   1.52403437,   7.41639129]), np.array([  5.72827721,   0.42880118,   5.0595021 ,   0.95853201,
-         6.33541169,   8.18298262,  11.16550911,   6.34744351,
-         6.57970982,   4.29700922,   7.74079319,   5.91004701,
-         5.35553927,   3.76023067,  17.80605283,  34.76041667,
-        17.80605283,   3.76023067,   5.35553927,   5.91004701,
-         7.74079319,   4.29700922,   6.57970982,   6.34744351,
-        11.16550911,   8.18298262,   6.33541169,   0.95853201,
-         5.0595021 ,   0.42880118,   5.72827721]), np.array([  4.06430396,   2.01151166,   3.31454919,   1.21184127,
-         5.66254903,   6.42328696,  10.12386707,   7.94252903,
-         8.00566425,   2.71279087,   9.45038509,   6.48979031,
-         3.73486569,   2.04316246,  16.57809345,  36.52083333,
-        16.57809345,   2.04316246,   3.73486569,   6.48979031,
-         9.45038509,   2.71279087,   8.00566425,   7.94252903,
-        10.12386707,   6.42328696,   5.66254903,   1.21184127,
-         3.31454919,   2.01151166,   4.06430396]), np.array([  3.88075468,   2.17100238,   3.1803429 ,   1.39465914,
-         5.78921889,   6.35958735,   9.94917606,   7.87362201,
-         8.074073  ,   2.68480142,   9.3839465 ,   6.55090077,
-         3.82777796,   2.22997319,  16.72887634,  36.33333333,
-        16.72887634,   2.22997319,   3.82777796,   6.55090077,
-         9.3839465 ,   2.68480142,   8.074073  ,   7.87362201,
-         9.94917606,   6.35958735,   5.78921889,   1.39465914,
-         3.1803429 ,   2.17100238,   3.88075468]), np.array([  4.60985971,   1.82618315,   3.3932938 ,   1.16936519,
-         5.07132873,   5.83414322,   9.84565458,   8.55864674,
-         8.79145396,   1.99351143,   9.83056432,   7.21734372,
-         3.86122534,   2.8977225 ,  17.39231091,  35.60416667,
-        17.39231091,   2.8977225 ,   3.86122534,   7.21734372,
-         9.83056432,   1.99351143,   8.79145396,   8.55864674,
-         9.84565458,   5.83414322,   5.07132873,   1.16936519,
-         3.3932938 ,   1.82618315,   4.60985971]), np.array([  7.74462943,   3.76328137,   4.18620981,   4.06065563,
-         4.81827262,   3.10003761,   6.69804833,   8.09108842,
-         9.27292418,   4.77428278,   6.68711926,   4.45149001,
-         5.96158256,   2.24142405,  14.32096398,  38.77083333,
-        14.32096398,   2.24142405,   5.96158256,   4.45149001,
-         6.68711926,   4.77428278,   9.27292418,   8.09108842,
-         6.69804833,   3.10003761,   4.81827262,   4.06065563,
-         4.18620981,   3.76328137,   7.74462943]), np.array([ 10.68454887,   6.79428022,   5.3215029 ,   6.81713571,
-         7.75254151,   5.04116264,   6.39764627,   5.0540911 ,
-         6.26826978,   5.42981929,   8.44806954,   5.69338928,
-         2.92353302,   1.93931495,  17.35552956,  35.72916667,
-        17.35552956,   1.93931495,   2.92353302,   5.69338928,
-         8.44806954,   5.42981929,   6.26826978,   5.0540911 ,
-         6.39764627,   5.04116264,   7.75254151,   6.81713571,
-         5.3215029 ,   6.79428022,  10.68454887]), np.array([  7.98025736,   4.02207006,   5.92744919,   6.12204589,
-         5.9575167 ,   2.94765434,   3.34545086,   6.09032133,
-         6.95950803,   8.48027763,   8.36956094,   6.18210892,
-         1.54296308,   4.15043637,  20.39458375,  32.66666667,
-        20.39458375,   4.15043637,   1.54296308,   6.18210892,
-         8.36956094,   8.48027763,   6.95950803,   6.09032133,
-         3.34545086,   2.94765434,   5.9575167 ,   6.12204589,
-         5.92744919,   4.02207006,   7.98025736]), np.array([  8.09332929,   4.1120767 ,   5.79232263,   6.01142641,
-         5.87719985,   2.84237645,   3.39636264,   6.22028527,
-         7.11088536,   8.53097819,   8.25558766,   6.12692295,
-         1.67133588,   4.25553362,  20.54341646,  32.51041667,
-        20.54341646,   4.25553362,   1.67133588,   6.12692295,
-         8.25558766,   8.53097819,   7.11088536,   6.22028527,
-         3.39636264,   2.84237645,   5.87719985,   6.01142641,
-         5.79232263,   4.1120767 ,   8.09332929]), np.array([  7.2668965 ,   4.05321468,   7.425719  ,   7.64680272,
-         7.51027242,   4.42261536,   4.86621694,   5.49465097,
-         7.2143242 ,   7.39550857,   6.67002677,   4.69586496,
-         3.30671427,   5.06663673,  21.98926587,  30.875     ,
-        21.98926587,   5.06663673,   3.30671427,   4.69586496,
-         6.67002677,   7.39550857,   7.2143242 ,   5.49465097,
-         4.86621694,   4.42261536,   7.51027242,   7.64680272,
-         7.425719  ,   4.05321468,   7.2668965 ]), np.array([  8.32834359,   3.47985719,   5.48760414,   6.03285626,
-         6.29276316,   4.73777636,   4.09797753,   3.06966636,
-         4.80421922,   4.88113442,   6.3784219 ,   2.12220026,
-         5.74458017,   6.34997283,  24.16980033,  28.17708333,
-        24.16980033,   6.34997283,   5.74458017,   2.12220026,
-         6.3784219 ,   4.88113442,   4.80421922,   3.06966636,
-         4.09797753,   4.73777636,   6.29276316,   6.03285626,
-         5.48760414,   3.47985719,   8.32834359]), np.array([  8.49756641,   3.40381292,   5.48183107,   6.18565386,
-         6.58936582,   5.18563893,   4.5394657 ,   2.83333333,
-         5.12795347,   4.87114387,   5.98646189,   2.30541607,
-         5.48370138,   6.23150241,  23.8574193 ,  28.625     ,
-        23.8574193 ,   6.23150241,   5.48370138,   2.30541607,
-         5.98646189,   4.87114387,   5.12795347,   2.83333333,
-         4.5394657 ,   5.18563893,   6.58936582,   6.18565386,
-         5.48183107,   3.40381292,   8.49756641]), np.array([  8.32553597,   4.09933278,   4.89582247,   5.12372076,
-         5.4306571 ,   4.87572523,   4.27239027,   1.87826683,
-         4.63857434,   3.82436127,   4.95853422,   2.28803753,
-         5.6087897 ,   6.5228421 ,  23.24466486,  29.80208333,
-        23.24466486,   6.5228421 ,   5.6087897 ,   2.28803753,
-         4.95853422,   3.82436127,   4.63857434,   1.87826683,
-         4.27239027,   4.87572523,   5.4306571 ,   5.12372076,
-         4.89582247,   4.09933278,   8.32553597]), np.array([  8.2707467 ,   2.99604081,   6.00002659,   6.34112962,
-         6.02790359,   3.85306994,   3.08709402,   2.91164001,
-         3.39051751,   2.90932649,   5.08556666,   1.96357158,
-         6.57237041,   7.42414472,  22.86772156,  31.0625    ,
-        22.86772156,   7.42414472,   6.57237041,   1.96357158,
-         5.08556666,   2.90932649,   3.39051751,   2.91164001,
-         3.08709402,   3.85306994,   6.02790359,   6.34112962,
-         6.00002659,   2.99604081,   8.2707467 ]), np.array([  8.16260819,   1.88896782,   7.13655644,   7.00892086,
-         5.6879037 ,   2.87427656,   2.60896197,   2.59978799,
-         3.61373786,   2.55975495,   4.03532409,   2.86585693,
-         5.42808142,   6.34674593,  22.98900925,  29.91666667,
-        22.98900925,   6.34674593,   5.42808142,   2.86585693,
-         4.03532409,   2.55975495,   3.61373786,   2.59978799,
-         2.60896197,   2.87427656,   5.6879037 ,   7.00892086,
-         7.13655644,   1.88896782,   8.16260819]), np.array([  8.93964001,   4.15778276,   5.60545221,   7.56993612,
-         7.840446  ,   3.19148369,   1.10245509,   4.86780541,
-         2.05743584,   0.75520188,   2.34679861,   5.09504877,
-         3.65707284,   4.07635458,  22.95254067,  27.64583333,
-        22.95254067,   4.07635458,   3.65707284,   5.09504877,
-         2.34679861,   0.75520188,   2.05743584,   4.86780541,
-         1.10245509,   3.19148369,   7.840446  ,   7.56993612,
-         5.60545221,   4.15778276,   8.93964001]), np.array([ 3.03387815,  0.41452079,  1.0418334 ,  0.21562995,  0.13459886,
-        0.4743582 ,  0.36462309,  0.50173311,  0.2144059 ,  0.25208163,
-        0.23486875,  0.16387318,  0.155169  ,  0.1338293 ,  0.17139181,
-        0.10416667,  0.17139181,  0.1338293 ,  0.155169  ,  0.16387318,
-        0.23486875,  0.25208163,  0.2144059 ,  0.50173311,  0.36462309,
-        0.4743582 ,  0.13459886,  0.21562995,  1.0418334 ,  0.41452079,
-        3.03387815]), np.array([ 3.07257656,  0.45356406,  1.08245818,  0.17407208,  0.17231539,
-        0.44854799,  0.37503988,  0.54326687,  0.25060065,  0.28958105,
-        0.27561595,  0.14310891,  0.17344429,  0.14915759,  0.1606015 ,
-        0.0625    ,  0.1606015 ,  0.14915759,  0.17344429,  0.14310891,
-        0.27561595,  0.28958105,  0.25060065,  0.54326687,  0.37503988,
-        0.44854799,  0.17231539,  0.17407208,  1.08245818,  0.45356406,
-        3.07257656]), np.array([ 3.50308474,  0.95323811,  1.55923291,  0.40927371,  0.64974265,
-        0.82711691,  0.87373132,  0.70955777,  0.3960089 ,  0.35193366,
-        0.36266196,  0.46541338,  0.533116  ,  0.5046896 ,  0.51622601,
-        0.5625    ,  0.51622601,  0.5046896 ,  0.533116  ,  0.46541338,
-        0.36266196,  0.35193366,  0.3960089 ,  0.70955777,  0.87373132,
-        0.82711691,  0.64974265,  0.40927371,  1.55923291,  0.95323811,
-        3.50308474]), np.array([ 3.69896025,  1.18609577,  1.73572065,  0.64325517,  0.78920255,
-        1.03147288,  0.94379715,  0.54326687,  0.29929712,  0.19687816,
-        0.16713726,  0.4101878 ,  0.29826466,  0.2569053 ,  0.32248249,
-        0.3125    ,  0.32248249,  0.2569053 ,  0.29826466,  0.4101878 ,
-        0.16713726,  0.19687816,  0.29929712,  0.54326687,  0.94379715,
-        1.03147288,  0.78920255,  0.64325517,  1.73572065,  1.18609577,
-        3.69896025]), np.array([ 3.7617988 ,  1.25782177,  1.7610003 ,  0.69323238,  0.7712217 ,
-        1.02191629,  0.86863933,  0.46689448,  0.20905183,  0.13266031,
-        0.15031522,  0.34501919,  0.35353276,  0.33924523,  0.37457639,
-        0.40625   ,  0.37457639,  0.33924523,  0.35353276,  0.34501919,
-        0.15031522,  0.13266031,  0.20905183,  0.46689448,  0.86863933,
-        1.02191629,  0.7712217 ,  0.69323238,  1.7610003 ,  1.25782177,
-        3.7617988 ]), np.array([ 3.811443  ,  1.30558615,  1.73649101,  0.68412825,  0.68826244,
-        0.9339246 ,  0.79936283,  0.53053465,  0.26864624,  0.22596087,
-        0.22962088,  0.43832041,  0.35164041,  0.28373346,  0.33965401,
-        0.3125    ,  0.33965401,  0.28373346,  0.35164041,  0.43832041,
-        0.22962088,  0.22596087,  0.26864624,  0.53053465,  0.79936283,
-        0.9339246 ,  0.68826244,  0.68412825,  1.73649101,  1.30558615,
-        3.811443  ]), np.array([ 3.8751612 ,  1.34435093,  1.61770989,  0.57438037,  0.54457894,
-        0.8277009 ,  0.90174626,  0.65633267,  0.38227483,  0.2351724 ,
-        0.12187062,  0.32866582,  0.27514872,  0.34495275,  0.38722458,
-        0.47916667,  0.38722458,  0.34495275,  0.27514872,  0.32866582,
-        0.12187062,  0.2351724 ,  0.38227483,  0.65633267,  0.90174626,
-        0.8277009 ,  0.54457894,  0.57438037,  1.61770989,  1.34435093,
-        3.8751612 ]), np.array([ 3.89143368,  1.3392428 ,  1.54669854,  0.50268302,  0.55055171,
-        0.86877189,  0.96500403,  0.61634634,  0.3314321 ,  0.1622976 ,
-        0.09115471,  0.31889412,  0.33182331,  0.33653774,  0.37168425,
-        0.40625   ,  0.37168425,  0.33653774,  0.33182331,  0.31889412,
-        0.09115471,  0.1622976 ,  0.3314321 ,  0.61634634,  0.96500403,
-        0.86877189,  0.55055171,  0.50268302,  1.54669854,  1.3392428 ,
-        3.89143368]), np.array([ 3.89037638,  1.35272777,  1.57604116,  0.52894406,  0.52245928,
-        0.8384561 ,  0.97484729,  0.64347688,  0.35189821,  0.1543397 ,
-        0.06539808,  0.29710896,  0.36306814,  0.34945338,  0.37537023,
-        0.375     ,  0.37537023,  0.34945338,  0.36306814,  0.29710896,
-        0.06539808,  0.1543397 ,  0.35189821,  0.64347688,  0.97484729,
-        0.8384561 ,  0.52245928,  0.52894406,  1.57604116,  1.35272777,
-        3.89037638]), np.array([ 3.91303787,  1.44893593,  1.65315643,  0.57043235,  0.4182604 ,
-        0.82990557,  1.09877291,  0.59292706,  0.25404548,  0.08135904,
-        0.18900039,  0.42199426,  0.26666069,  0.26747255,  0.35187903,
-        0.5       ,  0.35187903,  0.26747255,  0.26666069,  0.42199426,
-        0.18900039,  0.08135904,  0.25404548,  0.59292706,  1.09877291,
-        0.82990557,  0.4182604 ,  0.57043235,  1.65315643,  1.44893593,
-        3.91303787]), np.array([ 3.86673085,  1.32894724,  1.64464858,  0.62352761,  0.42756893,
-        0.71565974,  1.09678823,  0.71260964,  0.34187093,  0.0539078 ,
-        0.27214385,  0.52051469,  0.27663744,  0.18182526,  0.34763952,
-        0.625     ,  0.34763952,  0.18182526,  0.27663744,  0.52051469,
-        0.27214385,  0.0539078 ,  0.34187093,  0.71260964,  1.09678823,
-        0.71565974,  0.42756893,  0.62352761,  1.64464858,  1.32894724,
-        3.86673085]), np.array([ 3.74478837,  1.09070001,  1.78327771,  0.85754855,  0.31473136,
-        0.55959686,  1.33400472,  0.68947003,  0.22680098,  0.25046326,
-        0.37419771,  0.52793597,  0.17389131,  0.39969166,  0.43198012,
-        0.38541667,  0.43198012,  0.39969166,  0.17389131,  0.52793597,
-        0.37419771,  0.25046326,  0.22680098,  0.68947003,  1.33400472,
-        0.55959686,  0.31473136,  0.85754855,  1.78327771,  1.09070001,
-        3.74478837]), np.array([ 3.61997944,  0.92296811,  1.97275107,  1.02682575,  0.15536535,
-        0.69377498,  1.40952427,  0.49234593,  0.0639973 ,  0.21264321,
-        0.1822154 ,  0.37018255,  0.31571757,  0.20427409,  0.31493628,
-        0.58333333,  0.31493628,  0.20427409,  0.31571757,  0.37018255,
-        0.1822154 ,  0.21264321,  0.0639973 ,  0.49234593,  1.40952427,
-        0.69377498,  0.15536535,  1.02682575,  1.97275107,  0.92296811,
-        3.61997944]), np.array([ 3.48033352,  0.83786205,  2.15203383,  1.09577219,  0.03257343,
-        0.8655947 ,  1.26582333,  0.50796606,  0.25108114,  0.03648242,
-        0.29027796,  0.55767558,  0.1293949 ,  0.37338441,  0.44768154,
-        0.39583333,  0.44768154,  0.37338441,  0.1293949 ,  0.55767558,
-        0.29027796,  0.03648242,  0.25108114,  0.50796606,  1.26582333,
-        0.8655947 ,  0.03257343,  1.09577219,  2.15203383,  0.83786205,
-        3.48033352]), np.array([ 3.1162799 ,  0.95254891,  2.45607824,  1.04083279,  0.4600586 ,
-        0.98020492,  0.94821716,  0.93692112,  0.46781051,  0.47248257,
-        0.54113992,  0.39363479,  0.53839116,  0.28975219,  0.18745041,
-        0.83333333,  0.18745041,  0.28975219,  0.53839116,  0.39363479,
-        0.54113992,  0.47248257,  0.46781051,  0.93692112,  0.94821716,
-        0.98020492,  0.4600586 ,  1.04083279,  2.45607824,  0.95254891,
-        3.1162799 ]), np.array([ 2.66069699,  1.3866378 ,  2.62721579,  0.80999778,  0.84397611,
-        0.76495369,  1.33805646,  1.00005425,  0.39023108,  0.55622041,
-        0.21973584,  0.32197706,  0.38803415,  0.32000808,  0.55011288,
-        0.32291667,  0.55011288,  0.32000808,  0.38803415,  0.32197706,
-        0.21973584,  0.55622041,  0.39023108,  1.00005425,  1.33805646,
-        0.76495369,  0.84397611,  0.80999778,  2.62721579,  1.3866378 ,
-        2.66069699]), np.array([ 2.14218974,  1.93812114,  2.60043473,  0.46255456,  1.0542776 ,
-        0.26548575,  1.76554967,  0.53033009,  0.21684558,  0.14594909,
-        0.37716863,  0.66505134,  0.34601114,  0.44584487,  0.08322812,
-        0.875     ,  0.08322812,  0.44584487,  0.34601114,  0.66505134,
-        0.37716863,  0.14594909,  0.21684558,  0.53033009,  1.76554967,
-        0.26548575,  1.0542776 ,  0.46255456,  2.60043473,  1.93812114,
-        2.14218974]), np.array([ 1.34463211,  2.72513323,  2.29561234,  0.47739608,  1.10574913,
-        0.58832591,  1.64590494,  0.58416979,  0.68754777,  0.68427472,
-        0.79878044,  0.2613751 ,  0.8233606 ,  0.40095551,  0.83511027,
-        0.05208333,  0.83511027,  0.40095551,  0.8233606 ,  0.2613751 ,
-        0.79878044,  0.68427472,  0.68754777,  0.58416979,  1.64590494,
-        0.58832591,  1.10574913,  0.47739608,  2.29561234,  2.72513323,
-        1.34463211]), np.array([ 0.75839372,  3.22056358,  1.91166671,  0.86162053,  0.95248115,
-        1.03759334,  1.09175613,  1.06728904,  0.7005852 ,  0.74564486,
-        0.40526867,  0.33237725,  0.25707279,  0.36405606,  0.25083077,
-        0.64583333,  0.25083077,  0.36405606,  0.25707279,  0.33237725,
-        0.40526867,  0.74564486,  0.7005852 ,  1.06728904,  1.09175613,
-        1.03759334,  0.95248115,  0.86162053,  1.91166671,  3.22056358,
-        0.75839372]), np.array([ 0.49802876,  3.38398876,  1.67394414,  0.95425824,  0.75618454,
-        1.04311865,  0.95655274,  0.98672834,  0.45444801,  0.48847731,
-        0.3029322 ,  0.23704027,  0.43497732,  0.14477093,  0.49376427,
-        0.38541667,  0.49376427,  0.14477093,  0.43497732,  0.23704027,
-        0.3029322 ,  0.48847731,  0.45444801,  0.98672834,  0.95655274,
-        1.04311865,  0.75618454,  0.95425824,  1.67394414,  3.38398876,
-        0.49802876]), np.array([ 0.31492233,  3.4468749 ,  1.48844338,  0.91828902,  0.57177886,
-        0.88745956,  1.11359608,  0.80343501,  0.45222066,  0.55643592,
-        0.47244133,  0.14825537,  0.39853813,  0.3195984 ,  0.33544765,
-        0.57291667,  0.33544765,  0.3195984 ,  0.39853813,  0.14825537,
-        0.47244133,  0.55643592,  0.45222066,  0.80343501,  1.11359608,
-        0.88745956,  0.57177886,  0.91828902,  1.48844338,  3.4468749 ,
-        0.31492233]), np.array([ 0.32424364,  3.44715032,  1.49612343,  0.92633498,  0.57571932,
-        0.8964616 ,  1.10670353,  0.80106808,  0.44261616,  0.5502422 ,
-        0.48087042,  0.1412151 ,  0.40468826,  0.32990157,  0.3290526 ,
-        0.58333333,  0.3290526 ,  0.32990157,  0.40468826,  0.1412151 ,
-        0.48087042,  0.5502422 ,  0.44261616,  0.80106808,  1.10670353,
-        0.8964616 ,  0.57571932,  0.92633498,  1.49612343,  3.44715032,
-        0.32424364]), np.array([ 0.26992633,  3.41802246,  1.48031799,  0.85382005,  0.61899994,
-        0.90890997,  1.06386402,  0.87232975,  0.4060365 ,  0.47965914,
-        0.4840133 ,  0.06866787,  0.47406004,  0.39428862,  0.30434053,
-        0.65625   ,  0.30434053,  0.39428862,  0.47406004,  0.06866787,
-        0.4840133 ,  0.47965914,  0.4060365 ,  0.87232975,  1.06386402,
-        0.90890997,  0.61899994,  0.85382005,  1.48031799,  3.41802246,
-        0.26992633]), np.array([ 0.23549623,  3.27982904,  1.56708105,  0.74613746,  0.81624425,
-        1.1041547 ,  0.88532171,  0.85442069,  0.27510079,  0.54045005,
-        0.64732601,  0.25627081,  0.29097824,  0.29997423,  0.36939533,
-        0.45833333,  0.36939533,  0.29997423,  0.29097824,  0.25627081,
-        0.64732601,  0.54045005,  0.27510079,  0.85442069,  0.88532171,
-        1.1041547 ,  0.81624425,  0.74613746,  1.56708105,  3.27982904,
-        0.23549623]), np.array([ 0.34891553,  3.11947222,  1.72680058,  0.81893976,  0.91682575,
-        1.20506387,  0.95213962,  0.67740377,  0.44794327,  0.66678868,
-        0.49641314,  0.20967689,  0.40431314,  0.3216268 ,  0.34056873,
-        0.63541667,  0.34056873,  0.3216268 ,  0.40431314,  0.20967689,
-        0.49641314,  0.66678868,  0.44794327,  0.67740377,  0.95213962,
-        1.20506387,  0.91682575,  0.81893976,  1.72680058,  3.11947222,
-        0.34891553]), np.array([ 0.57332298,  2.88031517,  1.96351783,  1.05224181,  0.87744426,
-        1.10800213,  1.18433203,  0.71154297,  0.50261794,  0.47072937,
-        0.54058083,  0.14728689,  0.40707859,  0.39880261,  0.35668857,
-        0.39583333,  0.35668857,  0.39880261,  0.40707859,  0.14728689,
-        0.54058083,  0.47072937,  0.50261794,  0.71154297,  1.18433203,
-        1.10800213,  0.87744426,  1.05224181,  1.96351783,  2.88031517,
-        0.57332298]), np.array([ 0.83317879,  2.63535736,  2.16389277,  1.27765959,  0.67076291,
-        0.84847925,  1.2058942 ,  0.96268261,  0.26172717,  0.45224756,
-        0.71585083,  0.33099314,  0.25975948,  0.22199891,  0.39377707,
-        0.65625   ,  0.39377707,  0.22199891,  0.25975948,  0.33099314,
-        0.71585083,  0.45224756,  0.26172717,  0.96268261,  1.2058942 ,
-        0.84847925,  0.67076291,  1.27765959,  2.16389277,  2.63535736,
-        0.83317879]), np.array([ 1.07088989,  2.46641461,  2.25258648,  1.37083569,  0.43986241,
-        0.76609415,  0.98823523,  0.93773145,  0.28744332,  0.66299339,
-        0.49145335,  0.13232879,  0.46424759,  0.42458101,  0.30592623,
-        0.41666667,  0.30592623,  0.42458101,  0.46424759,  0.13232879,
-        0.49145335,  0.66299339,  0.28744332,  0.93773145,  0.98823523,
-        0.76609415,  0.43986241,  1.37083569,  2.25258648,  2.46641461,
-        1.07088989]), np.array([ 1.35182302,  2.3804919 ,  2.22485768,  1.31337074,  0.46269587,
-        1.02017556,  0.83734849,  0.64616927,  0.53967446,  0.49878698,
-        0.60865963,  0.29443036,  0.18693789,  0.13292855,  0.46724824,
-        0.70833333,  0.46724824,  0.13292855,  0.18693789,  0.29443036,
-        0.60865963,  0.49878698,  0.53967446,  0.64616927,  0.83734849,
-        1.02017556,  0.46269587,  1.31337074,  2.22485768,  2.3804919 ,
-        1.35182302]), np.array([ 0.13132038,  0.27729422,  0.1414959 ,  0.13905215,  0.23323547,
-        0.14141211,  0.05528246,  0.05609547,  0.13535292,  0.15882727,
-        0.09900035,  0.04635597,  0.05932666,  0.05760606,  0.03524155,
-        0.11458333,  0.03524155,  0.05760606,  0.05932666,  0.04635597,
-        0.09900035,  0.15882727,  0.13535292,  0.05609547,  0.05528246,
-        0.14141211,  0.23323547,  0.13905215,  0.1414959 ,  0.27729422,
-        0.13132038]), np.array([ 0.14394479,  0.27654801,  0.12074068,  0.13389587,  0.21502066,
-        0.12830905,  0.07499111,  0.07583448,  0.15545333,  0.16624672,
-        0.08487747,  0.06651562,  0.07886975,  0.03717286,  0.05345878,
-        0.13541667,  0.05345878,  0.03717286,  0.07886975,  0.06651562,
-        0.08487747,  0.16624672,  0.15545333,  0.07583448,  0.07499111,
-        0.12830905,  0.21502066,  0.13389587,  0.12074068,  0.27654801,
-        0.14394479]), np.array([ 0.21575483,  0.25663505,  0.07688481,  0.08112761,  0.22595799,
-        0.18643573,  0.10725535,  0.12715162,  0.14134039,  0.08299198,
-        0.16811073,  0.07317154,  0.07021525,  0.12022606,  0.03286611,
-        0.05208333,  0.03286611,  0.12022606,  0.07021525,  0.07317154,
-        0.16811073,  0.08299198,  0.14134039,  0.12715162,  0.10725535,
-        0.18643573,  0.22595799,  0.08112761,  0.07688481,  0.25663505,
-        0.21575483]), np.array([ 0.23609733,  0.2477303 ,  0.08803899,  0.06306761,  0.24609288,
-        0.20443352,  0.09751802,  0.11646187,  0.12058342,  0.0919032 ,
-        0.15814162,  0.05243956,  0.05259088,  0.10174597,  0.01833189,
-        0.07291667,  0.01833189,  0.10174597,  0.05259088,  0.05243956,
-        0.15814162,  0.0919032 ,  0.12058342,  0.11646187,  0.09751802,
-        0.20443352,  0.24609288,  0.06306761,  0.08803899,  0.2477303 ,
-        0.23609733]), np.array([ 0.26734554,  0.22644215,  0.11816128,  0.03287175,  0.27012405,
-        0.20342344,  0.06715761,  0.08960755,  0.13291148,  0.11318431,
-        0.14458792,  0.07935944,  0.08379077,  0.1232554 ,  0.03955442,
-        0.04166667,  0.03955442,  0.1232554 ,  0.08379077,  0.07935944,
-        0.14458792,  0.11318431,  0.13291148,  0.08960755,  0.06715761,
-        0.20342344,  0.27012405,  0.03287175,  0.11816128,  0.22644215,
-        0.26734554]), np.array([ 0.25711629,  0.23573967,  0.10846401,  0.03833582,  0.27101696,
-        0.21290634,  0.06699958,  0.08398185,  0.12521606,  0.12259262,
-        0.13448144,  0.08362958,  0.09285945,  0.12824671,  0.04817956,
-        0.03125   ,  0.04817956,  0.12824671,  0.09285945,  0.08362958,
-        0.13448144,  0.12259262,  0.12521606,  0.08398185,  0.06699958,
-        0.21290634,  0.27101696,  0.03833582,  0.10846401,  0.23573967,
-        0.25711629]), np.array([ 0.31581593,  0.1734194 ,  0.1523891 ,  0.0769105 ,  0.21764964,
-        0.17313606,  0.12841706,  0.14168198,  0.08204668,  0.13579327,
-        0.09716663,  0.08807184,  0.13434965,  0.15046022,  0.10355455,
-        0.03125   ,  0.10355455,  0.15046022,  0.13434965,  0.08807184,
-        0.09716663,  0.13579327,  0.08204668,  0.14168198,  0.12841706,
-        0.17313606,  0.21764964,  0.0769105 ,  0.1523891 ,  0.1734194 ,
-        0.31581593]), np.array([ 0.30677296,  0.18338424,  0.14914566,  0.06692015,  0.22741528,
-        0.16729175,  0.12542588,  0.14508738,  0.09020093,  0.12906061,
-        0.10325212,  0.08509079,  0.13806008,  0.15260914,  0.11275535,
-        0.04166667,  0.11275535,  0.15260914,  0.13806008,  0.08509079,
-        0.10325212,  0.12906061,  0.09020093,  0.14508738,  0.12542588,
-        0.16729175,  0.22741528,  0.06692015,  0.14914566,  0.18338424,
-        0.30677296]), np.array([ 0.29149368,  0.20001412,  0.15667521,  0.0602666 ,  0.23328027,
-        0.14683144,  0.14448497,  0.16470196,  0.07611698,  0.14919539,
-        0.08249494,  0.10339659,  0.1434481 ,  0.15710684,  0.09717359,
-        0.02083333,  0.09717359,  0.15710684,  0.1434481 ,  0.10339659,
-        0.08249494,  0.14919539,  0.07611698,  0.16470196,  0.14448497,
-        0.14683144,  0.23328027,  0.0602666 ,  0.15667521,  0.20001412,
-        0.29149368]), np.array([ 0.29752473,  0.19464743,  0.14789017,  0.05486842,  0.23975386,
-        0.14915243,  0.1390325 ,  0.1682864 ,  0.08341688,  0.15111962,
-        0.07810266,  0.11327608,  0.15187587,  0.16382252,  0.09187893,
-        0.01041667,  0.09187893,  0.16382252,  0.15187587,  0.11327608,
-        0.07810266,  0.15111962,  0.08341688,  0.1682864 ,  0.1390325 ,
-        0.14915243,  0.23975386,  0.05486842,  0.14789017,  0.19464743,
-        0.29752473]), np.array([ 0.28575035,  0.200973  ,  0.17914005,  0.08510179,  0.20867866,
-        0.17502911,  0.11725476,  0.13975425,  0.11027559,  0.12682895,
-        0.09928528,  0.13062634,  0.18312132,  0.19240849,  0.08822373,
-        0.02083333,  0.08822373,  0.19240849,  0.18312132,  0.13062634,
-        0.09928528,  0.12682895,  0.11027559,  0.13975425,  0.11725476,
-        0.17502911,  0.20867866,  0.08510179,  0.17914005,  0.200973  ,
-        0.28575035]), np.array([ 0.28938982,  0.20435387,  0.16226409,  0.06864849,  0.21900214,
-        0.1587386 ,  0.13604874,  0.13176157,  0.10677917,  0.10817533,
-        0.11945206,  0.13034099,  0.20093962,  0.2132407 ,  0.09561119,
-        0.04166667,  0.09561119,  0.2132407 ,  0.20093962,  0.13034099,
-        0.11945206,  0.10817533,  0.10677917,  0.13176157,  0.13604874,
-        0.1587386 ,  0.21900214,  0.06864849,  0.16226409,  0.20435387,
-        0.28938982]), np.array([ 0.29153187,  0.22363875,  0.15534097,  0.07437209,  0.20817953,
-        0.17116535,  0.13291824,  0.10259227,  0.13784563,  0.10925272,
-        0.1123709 ,  0.15274698,  0.1890158 ,  0.18489457,  0.08025198,
-        0.01041667,  0.08025198,  0.18489457,  0.1890158 ,  0.15274698,
-        0.1123709 ,  0.10925272,  0.13784563,  0.10259227,  0.13291824,
-        0.17116535,  0.20817953,  0.07437209,  0.15534097,  0.22363875,
-        0.29153187]), np.array([ 0.29248814,  0.21433927,  0.15097818,  0.06485361,  0.21813795,
-        0.16080599,  0.14311737,  0.09882118,  0.14119451,  0.10064591,
-        0.12062482,  0.16312566,  0.19208521,  0.17828569,  0.07535775,
-        0.        ,  0.07535775,  0.17828569,  0.19208521,  0.16312566,
-        0.12062482,  0.10064591,  0.14119451,  0.09882118,  0.14311737,
-        0.16080599,  0.21813795,  0.06485361,  0.15097818,  0.21433927,
-        0.29248814]), np.array([ 0.30336995,  0.1832229 ,  0.1260223 ,  0.03681423,  0.24303483,
-        0.15496778,  0.15776298,  0.06987712,  0.16850757,  0.12831607,
-        0.09193096,  0.14490391,  0.16841733,  0.18909883,  0.09701817,
-        0.03125   ,  0.09701817,  0.18909883,  0.16841733,  0.14490391,
-        0.09193096,  0.12831607,  0.16850757,  0.06987712,  0.15776298,
-        0.15496778,  0.24303483,  0.03681423,  0.1260223 ,  0.1832229 ,
-        0.30336995]), np.array([ 0.26204729,  0.27432405,  0.21933128,  0.10624719,  0.26223464,
-        0.08403884,  0.23416788,  0.08838835,  0.23763878,  0.15658346,
-        0.1232655 ,  0.19093085,  0.07804858,  0.21434361,  0.18519126,
-        0.125     ,  0.18519126,  0.21434361,  0.07804858,  0.19093085,
-        0.1232655 ,  0.15658346,  0.23763878,  0.08838835,  0.23416788,
-        0.08403884,  0.26223464,  0.10624719,  0.21933128,  0.27432405,
-        0.26204729]), np.array([ 0.25723879,  0.28305822,  0.22845163,  0.11105452,  0.27244446,
-        0.07375895,  0.24090604,  0.08135677,  0.24188552,  0.16241721,
-        0.11297298,  0.1805236 ,  0.08829989,  0.21356591,  0.17478856,
-        0.11458333,  0.17478856,  0.21356591,  0.08829989,  0.1805236 ,
-        0.11297298,  0.16241721,  0.24188552,  0.08135677,  0.24090604,
-        0.07375895,  0.27244446,  0.11105452,  0.22845163,  0.28305822,
-        0.25723879]), np.array([ 0.22451478,  0.32303631,  0.26363229,  0.11234741,  0.31968677,
-        0.08567211,  0.20883742,  0.05208333,  0.18185104,  0.10252499,
-        0.15008244,  0.23050654,  0.06064273,  0.20138737,  0.23681796,
-        0.17708333,  0.23681796,  0.20138737,  0.06064273,  0.23050654,
-        0.15008244,  0.10252499,  0.18185104,  0.05208333,  0.20883742,
-        0.08567211,  0.31968677,  0.11234741,  0.26363229,  0.32303631,
-        0.22451478]), np.array([ 0.20268435,  0.34063112,  0.27140501,  0.10008883,  0.31998057,
-        0.12688375,  0.16840139,  0.09375   ,  0.18122742,  0.11165184,
-        0.16223931,  0.22478679,  0.05220408,  0.22229539,  0.19742268,
-        0.13541667,  0.19742268,  0.22229539,  0.05220408,  0.22478679,
-        0.16223931,  0.11165184,  0.18122742,  0.09375   ,  0.16840139,
-        0.12688375,  0.31998057,  0.10008883,  0.27140501,  0.34063112,
-        0.20268435]), np.array([ 0.190581  ,  0.34332623,  0.26548039,  0.08492359,  0.30380811,
-        0.13397963,  0.17123846,  0.09603692,  0.20124387,  0.12704074,
-        0.1417398 ,  0.21131565,  0.06342009,  0.20505518,  0.21534952,
-        0.15625   ,  0.21534952,  0.20505518,  0.06342009,  0.21131565,
-        0.1417398 ,  0.12704074,  0.20124387,  0.09603692,  0.17123846,
-        0.13397963,  0.30380811,  0.08492359,  0.26548039,  0.34332623,
-        0.190581  ]), np.array([ 0.14525236,  0.33408849,  0.21089452,  0.00456168,  0.22485134,
-        0.09782721,  0.25457178,  0.02329237,  0.1802102 ,  0.06675794,
-        0.20896082,  0.29422395,  0.02779574,  0.28680551,  0.16125   ,
-        0.07291667,  0.16125   ,  0.28680551,  0.02779574,  0.29422395,
-        0.20896082,  0.06675794,  0.1802102 ,  0.02329237,  0.25457178,
-        0.09782721,  0.22485134,  0.00456168,  0.21089452,  0.33408849,
-        0.14525236]), np.array([ 0.12553923,  0.31168542,  0.13030348,  0.0896745 ,  0.22497333,
-        0.02933466,  0.28789322,  0.07365696,  0.09155769,  0.06944322,
-        0.22152453,  0.23055672,  0.08861121,  0.19662749,  0.21094832,
-        0.16666667,  0.21094832,  0.19662749,  0.08861121,  0.23055672,
-        0.22152453,  0.06944322,  0.09155769,  0.07365696,  0.28789322,
-        0.02933466,  0.22497333,  0.0896745 ,  0.13030348,  0.31168542,
-        0.12553923]), np.array([ 0.12545894,  0.30692058,  0.11995468,  0.09716584,  0.23468677,
-        0.02019521,  0.2801269 ,  0.07583448,  0.09833969,  0.07410837,
-        0.21142145,  0.22892741,  0.07867991,  0.20451637,  0.20555966,
-        0.15625   ,  0.20555966,  0.20451637,  0.07867991,  0.22892741,
-        0.21142145,  0.07410837,  0.09833969,  0.07583448,  0.2801269 ,
-        0.02019521,  0.23468677,  0.09716584,  0.11995468,  0.30692058,
-        0.12545894]), np.array([ 0.12755947,  0.31483998,  0.12932794,  0.0971494 ,  0.2262917 ,
-        0.02952357,  0.28859282,  0.08589803,  0.0926352 ,  0.0844412 ,
-        0.20377638,  0.22072996,  0.07279667,  0.20956025,  0.20246618,
-        0.14583333,  0.20246618,  0.20956025,  0.07279667,  0.22072996,
-        0.20377638,  0.0844412 ,  0.0926352 ,  0.08589803,  0.28859282,
-        0.02952357,  0.2262917 ,  0.0971494 ,  0.12932794,  0.31483998,
-        0.12755947]), np.array([ 0.13772143,  0.33477868,  0.14130901,  0.11348737,  0.22844832,
-        0.03643182,  0.28084023,  0.0931695 ,  0.11250878,  0.08132028,
-        0.20120058,  0.24145636,  0.07477631,  0.20779176,  0.20519901,
-        0.16666667,  0.20519901,  0.20779176,  0.07477631,  0.24145636,
-        0.20120058,  0.08132028,  0.11250878,  0.0931695 ,  0.28084023,
-        0.03643182,  0.22844832,  0.11348737,  0.14130901,  0.33477868,
-        0.13772143]), np.array([ 0.15300071,  0.35549828,  0.14458277,  0.13405084,  0.24745754,
-        0.03107139,  0.26026198,  0.07511565,  0.11603155,  0.06284439,
-        0.21955908,  0.22878565,  0.08429143,  0.20144758,  0.20654961,
-        0.14583333,  0.20654961,  0.20144758,  0.08429143,  0.22878565,
-        0.21955908,  0.06284439,  0.11603155,  0.07511565,  0.26026198,
-        0.03107139,  0.24745754,  0.13405084,  0.14458277,  0.35549828,
-        0.15300071]), np.array([ 0.11822964,  0.31942766,  0.16395291,  0.1142767 ,  0.21376791,
-        0.07095605,  0.26495393,  0.10416667,  0.15763768,  0.03796986,
-        0.25669071,  0.2392767 ,  0.12380376,  0.17920519,  0.22288285,
-        0.10416667,  0.22288285,  0.17920519,  0.12380376,  0.2392767 ,
-        0.25669071,  0.03796986,  0.15763768,  0.10416667,  0.26495393,
-        0.07095605,  0.21376791,  0.1142767 ,  0.16395291,  0.31942766,
-        0.11822964]), np.array([ 0.09162016,  0.30228672,  0.19330245,  0.13081972,  0.21896374,
-        0.09195375,  0.23631951,  0.08900004,  0.15605398,  0.0226593 ,
-        0.25370751,  0.21150688,  0.09471206,  0.20391392,  0.20449855,
-        0.13541667,  0.20449855,  0.20391392,  0.09471206,  0.21150688,
-        0.25370751,  0.0226593 ,  0.15605398,  0.08900004,  0.23631951,
-        0.09195375,  0.21896374,  0.13081972,  0.19330245,  0.30228672,
-        0.09162016])]
+def convert(modulePath, path=DATA_FILE):
+    """the literals of TrainingData in an old activity.py are written to path"""
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("old_activity", modulePath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    features = module.TrainingData.trainingDataTest
+    labels = module.TrainingData.featureVector
+    if len(features) != len(labels):
+        raise ValueError("%d recordings but %d labels" % (len(features), len(labels)))
+    save(features, labels, path)
+    return len(labels)
 
 
 def main():
-    app = TrainingData()
+    if len(sys.argv) >= 3 and sys.argv[1] == "convert":
+        path = sys.argv[3] if len(sys.argv) > 3 else DATA_FILE
+        print("converted %d recordings to %s" % (convert(sys.argv[2], path), path))
+    else:
+        features, labels = load()
+        print("%d recordings with %d features, labels %s" % (features.shape + (np.bincount(labels).tolist(),)))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# coding: utf-8
+# -*- coding: utf-8 -*-
+
+"""Benchmarks for the gesture hot path, so that regressions are caught before they reach the wall display.
+The suite "gesture" times every stage of Recognizer.recognizeGesture (resample, rotate, scale, translate, recognize)
+and the whole call on synthetic strokes (circles, checks and zig-zags with noise and different numbers of points) and
+optionally on recorded strokes. The suite "resample" compares the resampling with the previous implementation, which
+inserted every new point into the input list, on strokes with 100 to 10,000 points. The suite "transform" compares the
+per call latency of Transform.transform with the previous np.matrix implementation, once with a new homography for
+every report and once with the cached homography of LEDs which do not move. The suite "motion" measures the latency of a
+sensor tick of the motion classifier (features and prediction) with the previous fit before every prediction and with
+the classifier which is fitted once; it needs scikit-learn, which is only imported when the suite runs. The suite
+"import" measures the import time of modules in a fresh interpreter with python -X importtime and the suite "startup"
+breaks down the import of main.py, the time until the window can be created, by the modules main.py imports.
+The results are printed as JSON with latency percentiles in milliseconds and the throughput in calls per second.
+Recorded strokes are read from a JSON file which holds a list of strokes (lists of [x, y] points) or an object
+{"strokes": [...], "labels": [...]}; with labels the accuracy is reported as well.
+Run with: python3 benchmark.py [--mode protractor] [--recorded strokes.json] [--output results.json] [suite ...]"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+import numpy as np
+from recognizer import Recognizer
+from transform import Transform
+
+
+def legacyResample(points, N=64):
+    """the previous Recognizer.resample, kept as reference: every new point is inserted into the input list"""
+    def distance(p1, p2):
+        return math.sqrt((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2)
+
+    pathLength = sum(distance(points[i - 1], points[i]) for i in range(1, len(points)))
+    intervalLength = pathLength / float(N - 1)
+    D = 0.0
+    newpoints = [points[0]]
+    i = 1
+    while i < len(points):
+        d = distance(points[i - 1], points[i])
+        if d + D >= intervalLength:
+            delta_distance = float((intervalLength - D) / d)
+            q = [points[i-1][0] + delta_distance * (points[i][0] - points[i-1][0]),
+                 points[i-1][1] + delta_distance * (points[i][1] - points[i-1][1])]
+            newpoints.append(q)
+            points.insert(i, q)
+            D = 0.0
+        else:
+            D += d
+        i += 1
+    if len(newpoints) == N - 1:
+        newpoints.append(points[-1])
+    return newpoints
+
+
+def legacyTransform(leds, W, H):
+    """the previous Transform.transform, kept as reference: the homography is calculated with np.matrix, two solves and
+    an inverse for every report"""
+    points = sorted(leds[:4], key=lambda k: k[0])
+    A, B = (points[0], points[1]) if points[0][1] < points[1][1] else (points[1], points[0])
+    D, C = (points[2], points[3]) if points[2][1] < points[3][1] else (points[3], points[2])
+
+    source_points_123 = np.matrix([[A[0], B[0], C[0]], [A[1], B[1], C[1]], [1, 1, 1]])
+    l, m, t = np.asarray(np.linalg.solve(source_points_123, [[D[0]], [D[1]], [1]])).ravel()
+    unit_to_source = np.matrix([[l * A[0], m * B[0], t * C[0]], [l * A[1], m * B[1], t * C[1]], [l, m, t]])
+
+    B2, A2, D2, C2 = (0, 0), (0, H), (W, H), (W, 0)
+    dest_points_123 = np.matrix([[A2[0], B2[0], C2[0]], [A2[1], B2[1], C2[1]], [1, 1, 1]])
+    l, m, t = np.asarray(np.linalg.solve(dest_points_123, np.matrix([[D2[0]], [D2[1]], [1]]))).ravel()
+    unit_to_dest = np.matrix([[l * A2[0], m * B2[0], t * C2[0]], [l * A2[1], m * B2[1], t * C2[1]], [l, m, t]])
+
+    source_to_dest = unit_to_dest @ np.linalg.inv(unit_to_source)
+    x, y, z = np.asarray(source_to_dest @ np.matrix([[512], [384], [1]])).ravel()
+    return x / z, y / z
+
+
+def syntheticLeds(count, jitter=20.0, seed=0):
+    """count reports of four LEDs in the camera image, a rectangle around the center moved by up to jitter pixels"""
+    rng = np.random.default_rng(seed)
+    corners = np.array([[300, 200], [700, 200], [300, 560], [700, 560]], dtype=float)
+    leds = corners + rng.uniform(-jitter, jitter, (count, 4, 2))
+    return [[(float(x), float(y)) for x, y in report] for report in leds]
+
+
+def syntheticStroke(kind, numPoints, noise=2.0, seed=0):
+    """a parametric stroke as list of (x, y) tuples: "circle", "check" or "zigzag" with numPoints points, a random
+    size, position and start angle and gaussian noise with the standard deviation noise in pixels"""
+    rng = np.random.default_rng(seed)
+    t = np.linspace(0, 1, numPoints)
+    size = rng.uniform(80, 300)
+    if kind == "circle":
+        a = 2 * np.pi * t + rng.uniform(0, 2 * np.pi)
+        points = np.column_stack((np.cos(a), np.sin(a))) * size / 2
+    elif kind == "check":
+        # short stroke down to the right, long stroke up to the right
+        x = np.where(t < 1 / 3, t * 0.6, 0.2 + (t - 1 / 3) * 1.2)
+        y = np.where(t < 1 / 3, t * 0.9, 0.3 - (t - 1 / 3) * 1.5)
+        points = np.column_stack((x, y)) * size
+    elif kind == "zigzag":
+        points = np.column_stack((t, np.abs((t * 4) % 2 - 1))) * size
+    else:
+        raise ValueError("unknown stroke '%s'" % kind)
+    points = points + rng.uniform(200, 600, 2) + rng.normal(0, noise, (numPoints, 2))
+    return [(float(x), float(y)) for x, y in points]
+
+
+def syntheticStrokes(numPoints=(16, 64, 256, 1024), noise=2.0, perKind=10):
+    """perKind strokes of every kind for every number of points"""
+    strokes = []
+    for n in numPoints:
+        for kind in ["circle", "check", "zigzag"]:
+            for seed in range(perKind):
+                strokes.append(syntheticStroke(kind, n, noise, seed))
+    return strokes
+
+
+def loadRecorded(path):
+    """recorded strokes and their labels (or None) from a JSON file"""
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        return [[tuple(p) for p in s] for s in data["strokes"]], data.get("labels")
+    return [[tuple(p) for p in s] for s in data], None
+
+
+def latency(samples):
+    """percentiles and mean of the samples in seconds as milliseconds and the throughput in calls per second"""
+    samples = np.asarray(samples) * 1000
+    p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+    return {"count": len(samples), "mean_ms": float(samples.mean()), "p50_ms": float(p50), "p90_ms": float(p90),
+            "p99_ms": float(p99), "max_ms": float(samples.max()), "throughput_per_s": float(1000 / samples.mean())}
+
+
+def timeStages(recognizer, strokes, repeat=3):
+    """times every stage of recognizeGesture and the whole call for every stroke"""
+    stages = ["resample", "rotate", "scale", "translate", "recognize"]
+    samples = {stage: [] for stage in stages + ["recognizeGesture"]}
+    clock = time.perf_counter
+    for _ in range(repeat):
+        for stroke in strokes:
+            t0 = clock()
+            gesture = recognizer.resample(stroke)
+            t1 = clock()
+            gesture = recognizer.rotate(gesture)
+            t2 = clock()
+            gesture = recognizer.scale(gesture)
+            t3 = clock()
+            gesture = recognizer.translate(gesture)
+            t4 = clock()
+            recognizer.recognize(gesture)
+            t5 = clock()
+            recognizer.recognizeGesture(stroke)
+            t6 = clock()
+            for stage, duration in zip(stages + ["recognizeGesture"], [t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4,
+                                                                        t6 - t5]):
+                samples[stage].append(duration)
+    return {stage: latency(values) for stage, values in samples.items()}
+
+
+def benchmarkGesture(args):
+    """the stage latencies on synthetic and recorded strokes, with labels also the accuracy of the recorded strokes"""
+    recognizer = Recognizer(args.mode)
+    results = {"mode": args.mode, "synthetic": timeStages(recognizer, syntheticStrokes(), args.repeat)}
+    if args.recorded:
+        strokes, labels = loadRecorded(args.recorded)
+        results["recorded"] = timeStages(recognizer, strokes, args.repeat)
+        if labels is not None:
+            predicted = [recognizer.recognizeGesture(stroke) for stroke in strokes]
+            results["recorded"]["accuracy"] = float(np.mean([p == l for p, l in zip(predicted, labels)]))
+    return results
+
+
+def benchmarkResample(args, sizes=(100, 300, 1000, 3000, 10000)):
+    """the best time of both resample implementations per stroke size in milliseconds"""
+    recognizer = Recognizer()
+    results = []
+    for size in sizes:
+        stroke = syntheticStroke("circle", size)
+        number = max(1, 2000 // size)
+        legacy = min(timeit.repeat(lambda: legacyResample(list(stroke)), number=number, repeat=args.repeat)) / number
+        current = min(timeit.repeat(lambda: recognizer.resample(stroke), number=number, repeat=args.repeat)) / number
+        results.append({"points": size, "legacy_ms": legacy * 1000, "numpy_ms": current * 1000,
+                        "speedup": legacy / current})
+    return results
+
+
+def benchmarkTransform(args, count=1000, W=1920, H=1080):
+    """the per call latency of the previous and the current transformation for moving LEDs (every report needs a new
+    homography) and for LEDs which do not move (the cached homography is reused), and the largest difference"""
+    reports = syntheticLeds(count)
+    results = {}
+    for name, stream, tolerance in [("moving", reports, 0), ("still", [reports[0]] * count, 0.5)]:
+        transform = Transform(tolerance)
+        legacy = min(timeit.repeat(lambda: [legacyTransform(leds, W, H) for leds in stream], number=1,
+                                   repeat=args.repeat)) / count
+        current = min(timeit.repeat(lambda: [transform.transform(None, leds, W, H) for leds in stream], number=1,
+                                    repeat=args.repeat)) / count
+        error = max(max(abs(a - b) for a, b in zip(legacyTransform(leds, W, H), transform.transform(None, leds, W, H)))
+                    for leds in stream)
+        results[name] = {"legacy_us": legacy * 1e6, "closed_form_us": current * 1e6, "speedup": legacy / current,
+                         "max_error_px": float(error)}
+    return results
+
+
+def syntheticAccel(count, seed=0):
+    """count accelerometer values (x, y, z) of a wiimote which is shaken around its resting position"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(count) / 20
+    values = 512 + 100 * np.sin(2 * np.pi * 2 * t)[:, None] + rng.normal(0, 10, (count, 3))
+    return [tuple(int(v) for v in row) for row in values]
+
+
+def benchmarkMotion(args, ticks=100):
+    """the latency of a sensor tick with a fit before every prediction (previous Window.svm) and with the classifier
+    fitted once, and the time of that one fit"""
+    import activity
+    from sklearn import svm
+    from classifier import MotionClassifier
+    from features import AccelFeatures
+
+    features, labels = activity.load()
+    accel = syntheticAccel(ticks + 32)
+    clock = time.perf_counter
+
+    def ticksOf(predict):
+        accelFeatures = AccelFeatures(32)
+        for x, y, z in accel[:32]:
+            accelFeatures.update(x, y, z)
+        samples = []
+        for x, y, z in accel[32:]:
+            t0 = clock()
+            predict(accelFeatures.update(x, y, z)[1:])
+            samples.append(clock() - t0)
+        return latency(samples)
+
+    def legacy(data):
+        c = svm.SVC()
+        c.fit(features, labels)
+        return c.predict([data])[0]
+
+    t0 = clock()
+    classifier = MotionClassifier(features, labels)
+    fit = clock() - t0
+    return {"fit_ms": fit * 1000, "legacy_tick": ticksOf(legacy), "tick": ticksOf(classifier.predict)}
+
+
+def importTimes(statement, repeat=3):
+    """the self and cumulative import time in milliseconds of every module imported by statement in a fresh
+    interpreter, the fastest of repeat runs, and the depth of the module in the import tree (0 = imported by
+    statement)"""
+    times = {}
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            fields = line[len("import time:"):].split("|")
+            try:
+                selfTime, cumulative = int(fields[0]), int(fields[1])
+            except ValueError:
+                continue  # the header
+            name = fields[2][1:]
+            depth = (len(name) - len(name.lstrip())) // 2
+            name = name.strip()
+            best = times.get(name)
+            if best is None or cumulative < best["cumulative_ms"] * 1000:
+                times[name] = {"self_ms": selfTime / 1000, "cumulative_ms": cumulative / 1000, "depth": depth}
+    return times
+
+
+def benchmarkImport(args, modules=("activity",)):
+    """the import time of the modules and the time to read the training data through the memory map"""
+    results = {module: importTimes("import %s" % module, args.repeat)[module] for module in modules}
+    import activity
+    results["activity.load"] = min(timeit.repeat(lambda: activity.load()[0].sum(), number=1,
+                                                 repeat=args.repeat)) * 1000
+    return results
+
+
+def benchmarkStartup(args, top=15):
+    """the startup profile of the application: the import time of main.py and the modules it imports directly,
+    slowest first. The modules which are only needed on rare paths are imported on first use and do not show up"""
+    try:
+        times = importTimes("import main", args.repeat)
+    except subprocess.CalledProcessError as e:
+        return {"error": e.stderr.strip().splitlines()[-1]}
+    direct = sorted((name for name, time in times.items() if time["depth"] == 1),
+                    key=lambda name: times[name]["cumulative_ms"], reverse=True)
+    return {"main_ms": times["main"]["cumulative_ms"],
+            "modules": len(times),
+            "imports": [dict(module=name, **times[name]) for name in direct[:top]]}
+
+
+SUITES = {"gesture": benchmarkGesture,
+          "resample": benchmarkResample,
+          "transform": benchmarkTransform,
+          "motion": benchmarkMotion,
+          "import": benchmarkImport,
+          "startup": benchmarkStartup}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmarks for the gesture hot path")
+    parser.add_argument("suites", nargs="*", default=["gesture", "resample"],
+                        help="suites to run: %s (default: gesture resample)" % ", ".join(sorted(SUITES)))
+    parser.add_argument("--mode", default=Recognizer.MODE_DOLLAR,
+                        choices=[Recognizer.MODE_DOLLAR, Recognizer.MODE_PROTRACTOR])
+    parser.add_argument("--recorded", help="JSON file with recorded strokes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the results to this file instead of stdout")
+    args = parser.parse_args()
+    for suite in args.suites:
+        if suite not in SUITES:
+            parser.error("unknown suite '%s'" % suite)
+
+    report = {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine(),
+              "results": {suite: SUITES[suite](args) for suite in args.suites}}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
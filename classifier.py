@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# coding: utf-8
+# -*- coding: utf-8 -*-
+
+"""The classifier of the wiimote movements (0 = resting, 1 and 2 = the trained movements, see activity.py). The SVM is
+fitted once, when the classifier is created, or a fitted model is loaded from a file; a sensor tick only predicts.
+scikit-learn is imported when a model is fitted or loaded, not with this module.
+The model fitted on the training data is cached in motion_model.pkl next to this module. The file holds a key, the
+SHA-256 of the training data, the SVM parameters and the version of scikit-learn, and the model is only loaded if the
+key still matches; otherwise the SVM is fitted again and the file is rewritten."""
+
+import hashlib
+import json
+import os
+import pickle
+import numpy as np
+
+MODEL_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "motion_model.pkl")
+
+
+def _sklearnVersion():
+    import importlib.metadata
+    try:
+        return importlib.metadata.version("scikit-learn")
+    except importlib.metadata.PackageNotFoundError:
+        import sklearn
+        return sklearn.__version__
+
+
+def modelKey(features, labels, probability=False, **parameters):
+    """the SHA-256 of the training data, the parameters of the SVM and the version of scikit-learn"""
+    features = np.ascontiguousarray(features, dtype=np.float64)
+    labels = np.ascontiguousarray(labels, dtype=np.int64)
+    key = hashlib.sha256()
+    key.update(repr((features.shape, labels.shape)).encode())
+    key.update(features.tobytes())
+    key.update(labels.tobytes())
+    key.update(json.dumps({"probability": probability, "parameters": parameters}, sort_keys=True, default=repr).encode())
+    key.update(_sklearnVersion().encode())
+    return key.hexdigest()
+
+
+class MotionClassifier:
+
+    def __init__(self, features=None, labels=None, probability=False, **parameters):
+        """with features and labels the SVM is fitted right away, probability enables predict_proba and the remaining
+        parameters are passed to sklearn.svm.SVC"""
+        self.probability = probability
+        self.parameters = parameters
+        self._model = None
+        if features is not None:
+            self.fit(features, labels)
+
+    @classmethod
+    def fromTrainingData(cls, probability=False, cache=MODEL_CACHE, **parameters):
+        """a classifier fitted on the recorded movements of activity.npy, with cache the model is loaded from or
+        written to this file (None disables the cache)"""
+        import activity
+        features, labels = activity.load()
+        if cache is None:
+            return cls(features, labels, probability, **parameters)
+        return cls.cached(features, labels, cache, probability, **parameters)
+
+    @classmethod
+    def cached(cls, features, labels, path=MODEL_CACHE, probability=False, **parameters):
+        """the classifier of the cache file if it was fitted on the same data with the same parameters and version of
+        scikit-learn, otherwise a newly fitted classifier which is written to the cache file"""
+        key = modelKey(features, labels, probability, **parameters)
+        if os.path.exists(path):
+            try:
+                classifier, cachedKey = cls.load(path, withKey=True)
+                if cachedKey == key:
+                    return classifier
+            except Exception as e:
+                # an unreadable or incompatible cache is replaced like an outdated one
+                print("model cache '%s' is not usable: %s" % (path, e))
+        classifier = cls(features, labels, probability, **parameters)
+        classifier.save(path, key)
+        return classifier
+
+    @classmethod
+    def load(cls, path, withKey=False):
+        """a classifier with the fitted model of a file written by save, with withKey also the key it was saved with"""
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        model = data["model"]
+        parameters = model.get_params()
+        probability = bool(parameters.pop("probability", False))
+        classifier = cls(probability=probability, **parameters)
+        classifier._model = model
+        if withKey:
+            return classifier, data.get("key")
+        return classifier
+
+    def save(self, path, key=None):
+        """the fitted model and its key are written to a temporary file which then replaces path, so a crash never
+        leaves a partial cache behind"""
+        if self._model is None:
+            raise RuntimeError("the classifier has not been fitted")
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as f:
+            pickle.dump({"key": key, "model": self._model}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+    def fit(self, features, labels):
+        from sklearn import svm
+        parameters = dict(self.parameters)
+        if self.probability:
+            parameters["probability"] = True
+        self._model = svm.SVC(**parameters)
+        self._model.fit(features, labels)
+        return self
+
+    @property
+    def fitted(self):
+        return self._model is not None
+
+    def predict(self, features):
+        """the movement of one feature vector"""
+        return self._model.predict([features])[0]
+
+    def predict_proba(self, features):
+        """the probabilities of all movements for one feature vector, needs probability=True"""
+        if not self.probability:
+            raise RuntimeError("the classifier was created without probability=True")
+        return self._model.predict_proba([features])[0]
+
+    @property
+    def classes(self):
+        return self._model.classes_
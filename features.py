@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# coding: utf-8
+# -*- coding: utf-8 -*-
+
+"""The features of the motion classifier: the magnitudes of the Fourier transform of the last 32 accelerometer values,
+averaged over the x-, y- and z-axis. The values are written into preallocated circular buffers, the average of a
+sample is calculated once when it arrives and the transform is a precomputed DFT matrix multiplied into output buffers,
+so a tick allocates no memory once the buffers are filled. The magnitudes of a DFT do not change when the signal is
+shifted circularly, therefore the buffer does not have to be rotated into chronological order."""
+
+import numpy as np
+
+
+class AccelFeatures:
+
+    def __init__(self, size=32):
+        """size is the number of samples the spectrum is calculated of"""
+        self.size = size
+        self.x = np.zeros(size)
+        self.y = np.zeros(size)
+        self.z = np.zeros(size)
+        self.avg = np.zeros(size)
+        self.count = 0
+        self._index = 0
+
+        # real and imaginary part of the DFT matrix, scaled by 1 / size like the original np.fft.fft(avg / len(avg))
+        k = np.arange(size)
+        angles = -2 * np.pi * np.outer(k, k) / size
+        self._cos = np.cos(angles) / size
+        self._sin = np.sin(angles) / size
+        self._real = np.empty(size)
+        self._imag = np.empty(size)
+        self._magnitude = np.empty(size)
+
+    @property
+    def full(self):
+        return self.count >= self.size
+
+    def push(self, x, y, z):
+        """the accelerometer values of one tick overwrite the oldest sample"""
+        i = self._index
+        self.x[i] = x
+        self.y[i] = y
+        self.z[i] = z
+        self.avg[i] = (x + y + z) / 3
+        self._index = (i + 1) % self.size
+        self.count += 1
+
+    def spectrum(self):
+        """the magnitudes of the DFT of the averaged channel. While the buffers are filled, only the samples received so
+        far are transformed. The returned array is reused and overwritten by the next call"""
+        if self.count < self.size:
+            return abs(np.fft.fft(self.avg[:self.count] / max(self.count, 1)))
+        np.matmul(self._cos, self.avg, out=self._real)
+        np.matmul(self._sin, self.avg, out=self._imag)
+        return np.hypot(self._real, self._imag, out=self._magnitude)
+
+    def update(self, x, y, z):
+        """push and spectrum in one call"""
+        self.push(x, y, z)
+        return self.spectrum()
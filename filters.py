@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# coding: utf-8
+# -*- coding: utf-8 -*-
+
+"""Filters which smooth the cursor position calculated from the IR camera before the cursor is moved. The jitter of
+the LEDs would otherwise end up in every drawn stroke, which makes the strokes longer and noisier and costs time when
+they are resampled and recognized. Every filter keeps a constant state of a few floats and is updated with one point
+and its timestamp in seconds:
+OneEuroFilter - the One Euro Filter of Casiez et al. (CHI 2012), a low pass filter whose cutoff frequency rises with
+    the speed of the cursor, so it smooths a resting cursor strongly and lags little behind a fast one
+KalmanFilter - a Kalman filter with a constant velocity model for every axis
+NoFilter - passes the points through unchanged"""
+
+import math
+
+
+class NoFilter:
+
+    def filter(self, x, y, t):
+        """the point is returned unchanged"""
+        return x, y
+
+    def reset(self):
+        pass
+
+
+class OneEuroFilter:
+
+    def __init__(self, min_cutoff=1.0, beta=0.01, d_cutoff=1.0):
+        """min_cutoff is the cutoff frequency in Hz of a resting cursor, beta how fast the cutoff rises with the speed
+        in pixels per second and d_cutoff the cutoff frequency of the filtered speed"""
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    def reset(self):
+        """the next point starts a new signal"""
+        self.t = None
+        self.x = self.y = 0.0
+        self.dx = self.dy = 0.0
+
+    @staticmethod
+    def alpha(cutoff, dt):
+        """the smoothing factor of an exponential filter with the cutoff frequency for the sampling interval dt"""
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def filter(self, x, y, t):
+        """the filtered point for the point (x, y) measured at the time t"""
+        if self.t is None or t <= self.t:
+            if self.t is None:
+                self.x, self.y = x, y
+            self.t = t
+            return self.x, self.y
+        dt = t - self.t
+        self.t = t
+
+        a = self.alpha(self.d_cutoff, dt)
+        self.dx += a * ((x - self.x) / dt - self.dx)
+        self.dy += a * ((y - self.y) / dt - self.dy)
+
+        a = self.alpha(self.min_cutoff + self.beta * math.hypot(self.dx, self.dy), dt)
+        self.x += a * (x - self.x)
+        self.y += a * (y - self.y)
+        return self.x, self.y
+
+
+class KalmanFilter:
+
+    def __init__(self, process_noise=200000.0, measurement_noise=4.0):
+        """process_noise is the variance of the acceleration in (pixels per second squared)^2 which the constant
+        velocity model does not explain, measurement_noise the variance of a measured point in pixels^2"""
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.reset()
+
+    def reset(self):
+        """the next point starts a new signal"""
+        self.t = None
+        # position, velocity and the symmetric covariance (pp, pv, vv) of both axes, which is the same for x and y
+        self.x = self.y = 0.0
+        self.vx = self.vy = 0.0
+        self.pp = self.pv = self.vv = 0.0
+
+    def filter(self, x, y, t):
+        """the filtered point for the point (x, y) measured at the time t"""
+        if self.t is None:
+            self.t = t
+            self.x, self.y = x, y
+            self.pp = self.measurement_noise
+            self.vv = self.process_noise
+            return self.x, self.y
+        dt = max(t - self.t, 0.0)
+        self.t = t
+
+        # predict with constant velocity, the acceleration is white noise
+        q = self.process_noise
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        pp = self.pp + 2 * dt * self.pv + dt * dt * self.vv + q * dt ** 4 / 4
+        pv = self.pv + dt * self.vv + q * dt ** 3 / 2
+        vv = self.vv + q * dt * dt
+
+        # correct with the measured position
+        s = pp + self.measurement_noise
+        kp = pp / s
+        kv = pv / s
+        ex = x - self.x
+        ey = y - self.y
+        self.x += kp * ex
+        self.y += kp * ey
+        self.vx += kv * ex
+        self.vy += kv * ey
+        self.pp = (1 - kp) * pp
+        self.pv = (1 - kp) * pv
+        self.vv = vv - kv * pv
+        return self.x, self.y
+
+
+FILTERS = {"none": NoFilter,
+           "one-euro": OneEuroFilter,
+           "kalman": KalmanFilter}
+
+
+def create(name, **parameters):
+    """a new filter by its name in FILTERS"""
+    if name not in FILTERS:
+        raise ValueError("unknown filter '%s', use one of %s" % (name, ", ".join(sorted(FILTERS))))
+    return FILTERS[name](**parameters)
@@ -5,17 +5,14 @@
 import wiimote
 from recognizer import Recognizer
 from transform import Transform
+import filters
+from features import AccelFeatures
+from classifier import MotionClassifier
 from PyQt5 import QtWidgets, QtCore, QtGui
-from pylab import *
-from scipy import fft
-from sklearn import svm
-import numpy as np
 import sys
-import activity
 import subprocess
-import cv2
-import matplotlib.pyplot as plt
-from PIL import Image
+import threading
+import time
 import os
 
 
@@ -28,6 +25,7 @@ class DrawWidget(QtWidgets.QWidget):
         self.pos = []
         self.draw = False
         self.parent = parent
+        self.session = None
 
 
     def mousePressEvent(self, event):
@@ -35,18 +33,22 @@ class DrawWidget(QtWidgets.QWidget):
         so that a new gesture can be drawn"""
         if event.button() == QtCore.Qt.LeftButton:
             self.draw = True
+            self.session = self.parent.recognizer.startSession()
             self.raise_()
 
         self.update()
 
     def drawOnWidget(self, draw):
         if draw:
+            if not self.draw:
+                self.session = self.parent.recognizer.startSession()
             self.draw = draw
             self.update()
         else:
             self.draw = False
-            self.parent.recognizeDrawing(self.pos)
+            self.parent.recognizeDrawing(self.pos, self.session)
             self.pos = []
+            self.session = None
             self.update()
 
     def mouseMoveEvent(self, event):
@@ -54,6 +56,8 @@ class DrawWidget(QtWidgets.QWidget):
         if self.draw:
             point = (event.x(), event.y())
             self.pos.append(point)
+            if self.session is not None:
+                self.session.addPoint(point)
             self.update()
 
     def paintEvent(self, event):
@@ -67,6 +71,9 @@ class DrawWidget(QtWidgets.QWidget):
             if len(self.pos) > 1:
                 for i in range(len(self.pos)-1):
                     self.qp.drawLine(self.pos[i][0], self.pos[i][1], self.pos[i+1][0], self.pos[i+1][1])
+                # preview of the gesture which is recognized for the points drawn so far
+                if self.session is not None and self.session.provisional() in self.parent.recognizer.gestureName:
+                    self.qp.drawText(self.pos[-1][0] + 20, self.pos[-1][1] - 20, self.session.provisional())
 
             self.qp.end()
 
@@ -78,8 +85,9 @@ class DrawWidget(QtWidgets.QWidget):
             if event.button() == QtCore.Qt.LeftButton:
                 self.draw = False
                 self.parent.raiseWidgets()
-                self.parent.recognizeDrawing(self.pos)
+                self.parent.recognizeDrawing(self.pos, self.session)
                 self.pos = []
+                self.session = None
                 self.update()
 
 class Window(QtWidgets.QWidget):
@@ -109,10 +117,7 @@ class Window(QtWidgets.QWidget):
 
         self.wiimote = None
         self._acc_vals = []
-        self._bufferX = np.array([])
-        self._bufferY = np.array([])
-        self._bufferZ = np.array([])
-        self._avg = np.array([])
+        self.accelFeatures = AccelFeatures(32)
         self.predicted = -1
         self.buttonA = False
         self.moveOneUp = False
@@ -133,15 +138,17 @@ class Window(QtWidgets.QWidget):
         self.btn_Two = False
 
 
-        self.featureVector = activity.TrainingData.featureVector
-        self.trainingDataTest = activity.TrainingData.trainingDataTest
-
-        self.trainingData = []
-        self.trainingData.append(self.trainingDataTest)
-        self.c = svm.SVC()
-        self.fourier = []
+        # fitted once on the recorded movements (or loaded from the model cache) by a thread which is started after
+        # the window is shown, so scikit-learn is neither imported at startup nor on the Qt thread; a sensor tick only
+        # predicts and movements are not classified until the classifier is ready
+        self.motionClassifier = None
         self.update_timer = QtCore.QTimer()
         self.update_timer.timeout.connect(self.update_all_sensors)
+        # the IR reports arrive with 100 Hz, the cursor is moved on the Qt thread at most once per frame
+        self.cursorPoint = None
+        self.cursor_timer = QtCore.QTimer()
+        self.cursor_timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.cursor_timer.timeout.connect(self.processWiimoteCallbacks)
 
         # init status arrays for undo and redo
         self.current = []
@@ -162,6 +169,8 @@ class Window(QtWidgets.QWidget):
         self.setMouseTracking(True)
         self.recognizer = Recognizer()
         self.transform = Transform()
+        # smooths the cursor moved by the wiimote and thereby the drawn gestures, see filters.FILTERS
+        self.cursorFilter = filters.create("one-euro")
         self.qp = QtGui.QPainter()
         self.draw = False
         self.tabIndex = 0
@@ -328,6 +337,14 @@ class Window(QtWidgets.QWidget):
         self.layout.addLayout(layoutSettings)
         self.setLayout(self.layout)
         self.show()
+        threading.Thread(target=self.loadMotionClassifier, daemon=True).start()
+
+    def loadMotionClassifier(self):
+        """runs in a background thread, the classifier is handed to the Qt thread by assigning it when it is ready"""
+        try:
+            self.motionClassifier = MotionClassifier.fromTrainingData()
+        except Exception as e:
+            print("motion classifier not available:", e)
 
     def on_item_selection_todoList(self, index, item):
         item.setCheckState(QtCore.Qt.Unchecked)
@@ -341,20 +358,22 @@ class Window(QtWidgets.QWidget):
         self.doneList.setCurrentItem(newItem)
 
     def connect_wiimote(self):
-        self.wiimote = wiimote.connect(self.btaddr)
+        # the callbacks of the wiimote are queued and called on the Qt thread by the cursor timer
+        self.wiimote = wiimote.connect(self.btaddr, dispatcher=wiimote.CallbackDispatcher(threaded=False))
 
         if self.wiimote is not None:
             self.wiimote.ir.register_callback(self.process_wiimote_ir_data)
             self.wiimote.buttons.register_callback(self.getPressedButton)
             self.set_update_rate(20)
+            self.cursor_timer.start(16)
 
-    # gets which button was pressed on the wiimote
+    # gets which button was pressed or released on the wiimote, ev is a wiimote.ButtonEvent and only sent on changes
     def getPressedButton(self, ev):
         x = self.cursor().pos().x()
         y = self.cursor().pos().y()
         getCurrentTab = self.tab.currentIndex()
 
-        if self.wiimote.buttons["B"]:
+        if ev.is_pressed("B"):
             self.draw_widget.raise_()
             if not self.draw:
                 self.pos = []
@@ -363,16 +382,16 @@ class Window(QtWidgets.QWidget):
 
             self.draw_widget.drawOnWidget(self.draw)
 
-        else:
+        elif ev.is_released("B"):
             self.draw = False
             self.draw_widget.drawOnWidget(self.draw)
 
         # if the undo or the redo buttons were clicked while pressing the 'A'-Button on the wiimote, the action is
-        if self.wiimote.buttons["A"]:
+        if ev.is_pressed("A"):
 
             self.buttonA = True
 
-        else:
+        elif ev.is_released("A"):
             if self.buttonA is True:
                 xUndo = self.undoButton.pos().x()
                 yUndo = self.undoButton.pos().y()
@@ -435,67 +454,63 @@ class Window(QtWidgets.QWidget):
 
 
         # if the 'Plus'-Button is released an the wiimote is not moving the current item will be moved up by one element
-        if self.wiimote.buttons['Plus'] and self.predicted == 2:
-            self.moveOneUp = True
-        else:
-          #  self.moveOneUp = False
-            self.one_move_up.emit(getCurrentTab)
-
-         # if the 'Minus'-Button is released an the wiimote is not moving the current item will be moved down by one element
-        if self.wiimote.buttons['Minus'] and self.predicted == 2:
-            self.moveOneDown = True
-        else:
-            #self.moveOneDown = False
-            self.one_move_down.emit(getCurrentTab)
-
         # if the 'Plus'-Button is released an the wiimote is moved slightly up and down the current item will be moved to the bottom of the list
-        if self.wiimote.buttons['Plus'] and self.predicted == 1:
-            self.moveCompleteUp = True
-        else:
-            #self.moveCompleteUp = False
+        # the movement is read when the button is pressed, the item is moved when it is released
+        if ev.is_pressed('Plus'):
+            if self.predicted == 2:
+                self.moveOneUp = True
+            if self.predicted == 1:
+                self.moveCompleteUp = True
+        elif ev.is_released('Plus'):
+            self.one_move_up.emit(getCurrentTab)
             self.on_move_up_all.emit(getCurrentTab)
 
+        # if the 'Minus'-Button is released an the wiimote is not moving the current item will be moved down by one element
         # if the 'Minus'-Button is released an the wiimote is moved slightly up and down the current item will be moved to the top of the list
-        if self.wiimote.buttons['Minus'] and self.predicted == 1:
-            self.moveCompleteDown = True
-        else:
+        if ev.is_pressed('Minus'):
+            if self.predicted == 2:
+                self.moveOneDown = True
+            if self.predicted == 1:
+                self.moveCompleteDown = True
+        elif ev.is_released('Minus'):
             self.moveCompleteDown = False
+            self.one_move_down.emit(getCurrentTab)
             self.on_move_down_all.emit(getCurrentTab)
 
         # if the 'Up'-Button is released the higher Item will be selected
-        if self.wiimote.buttons['Up']:
+        if ev.is_pressed('Up'):
             self.arrowUp = True
-        else:
+        elif ev.is_released('Up'):
             self.arrowUpReleased(getCurrentTab)
         # if the 'Down'-Button is released the lower Item will be selected
-        if self.wiimote.buttons['Down']:
+        if ev.is_pressed('Down'):
             self.arrowDown = True
-        else:
+        elif ev.is_released('Down'):
             self.arrowDownReleased(getCurrentTab)
 
-        if self.wiimote.buttons['Left']:
+        if ev.is_pressed('Left'):
             self.btn_One = True
-        else:
+        elif ev.is_released('Left'):
             if self.tab.currentIndex() is not 0 and self.btn_One is True:
                 self.tab.setCurrentIndex(0)
                 self.btn_One = False
-        if self.wiimote.buttons['Right']:
+        if ev.is_pressed('Right'):
             self.btn_Two = True
-        else:
+        elif ev.is_released('Right'):
             if self.tab.currentIndex() is not 1 and self.btn_Two == True:
                 self.tab.setCurrentIndex(1)
                 self.btn_Two = False
 
-        if self.wiimote.buttons['One']:
+        if ev.is_pressed('One'):
             self.undoOne = True
-        else:
+        elif ev.is_released('One'):
             if self.undoOne == True:
                 self.undoOne = False
                 self.undo()
 
-        if self.wiimote.buttons['Two']:
+        if ev.is_pressed('Two'):
             self.redoTwo = True
-        else:
+        elif ev.is_released('Two'):
             if self.redoTwo == True:
                 self.redoTwo = False
                 self.redo()
@@ -708,6 +723,8 @@ class Window(QtWidgets.QWidget):
     def rightButtonPressed(self):
 
         if self.predicted == 2 and self.movieOpened is False and self.rightButton is True:
+            # PIL is only needed here, it is not imported at startup
+            from PIL import Image
             filename = "katze.png"
             self.image = Image.open(filename).show()
 
@@ -856,63 +873,70 @@ class Window(QtWidgets.QWidget):
         self._acc_vals = self.wiimote.accelerometer
         x, y, z = self._acc_vals
         fftData = self.fft(x, y, z)
-        self.fourier.append(fftData)
-        if len(self.fourier) >= 32:
+        if self.accelFeatures.full:
             self.svm(fftData)
             self.update()
 
     # fft reads in the accelerometer data of x-,y- and z-axis.
     # calculate the peaks of the raw data from every movement with the furier transformations
     def fft(self, x, y, z):
-        size = 32
-        self._bufferX = np.append(self._bufferX, x)
-        self._bufferX = self._bufferX[-size:]
-        self._bufferY = np.append(self._bufferY, y)
-        self._bufferY = self._bufferY[-size:]
-        self._bufferZ = np.append(self._bufferZ, z)
-        self._bufferZ = self._bufferZ[-size:]
-
-        for i in range(len(self._bufferX)):
-            xValue = self._bufferX[i]
-            yValue = self._bufferY[i]
-            zValue = self._bufferZ[i]
-            avgValue = ((xValue + yValue + zValue) / 3)
-            self._avg = np.append(self._avg, avgValue)
-            self._avg = self._avg[-size:]
-
-        avg = np.fft.fft(self._avg / len(self._avg))
-        avgfft = abs(avg)
-        return avgfft
+        return self.accelFeatures.update(x, y, z)
 
     # with the trained data it is possible to predict the current input movement of the wiimote
     def svm(self, data):
-        self.c.fit(self.trainingDataTest, self.featureVector)
-        predicted = self.c.predict([data[1:]])
-        self.predicted = predicted[0]
+        classifier = self.motionClassifier
+        if classifier is not None:
+            self.predicted = classifier.predict(data[1:])
 
     def update_accel(self, acc_vals):
         self._acc_vals = acc_vals
 
     def process_wiimote_ir_data(self,event):
-        if len(event) == 4:
-            leds = []
-
-            for led in event:
-                leds.append((led["x"], led["y"]))
+        # event is the structured array of the IR camera (see wiimote.IRCam.STATE_TYPE), ordered by track id
+        if event["valid"].all():
+            leds = list(zip(event["x"].tolist(), event["y"].tolist()))
+            ids = event["id"].tolist()
 
             if leds[0][0] == leds[0][1] == leds[1][0] == leds[1][1] == leds[2][0] \
                     == leds[2][1] == leds[3][0] == leds[3][1]:
+                self.cursorFilter.reset()
                 return -1, -1
 
             P, DEST_W, DEST_H = (1024 / 2, 768 / 2), 1280, 800
 
             try:
-                x, y = self.transform.transform(P, leds, DEST_W, DEST_H)
+                x, y = self.transform.transform(P, leds, DEST_W, DEST_H, tuple(ids))
+                x, y = self.cursorFilter.filter(x, y, time.monotonic())
             except Exception as e:
                 print(e)
+                self.cursorFilter.reset()
                 x = y = -1
 
-            self.cursor().setPos(self.mapToGlobal(QtCore.QPoint(x, y)))
+            self.cursorPoint = x, y
+
+    def applyCursorPoint(self):
+        """moves the cursor to the latest point of the wiimote on the Qt thread"""
+        point = self.cursorPoint
+        if point is not None:
+            self.cursorPoint = None
+            self.cursor().setPos(self.mapToGlobal(QtCore.QPoint(int(point[0]), int(point[1]))))
+
+    def processWiimoteCallbacks(self):
+        """called by the cursor timer: the queued callbacks of the wiimote (buttons and IR camera) are called and the
+        cursor is moved to the point of the latest IR report in the same tick, so an IR report waits for one timer
+        tick at most"""
+        if self.wiimote is not None:
+            self.wiimote.dispatcher.process_pending()
+        self.applyCursorPoint()
+
+    def closeEvent(self, event):
+        if self.wiimote is not None:
+            # IR states are coalesced by the dispatcher before the cursor timer calls the callback, so the states it
+            # coalesced or dropped are the dropped cursor frames (buttons are never coalesced)
+            stats = self.wiimote.dispatcher.stats()
+            print("dropped cursor frames:", stats["coalesced"] + stats["dropped"])
+            print("wiimote callbacks:", stats)
+        super().closeEvent(event)
 
     def keyPressEvent(self, event):
         if event.text() == "b":
@@ -940,20 +964,17 @@ class Window(QtWidgets.QWidget):
 
         return QtWidgets.QWidget.eventFilter(self, widget, event)
 
-    def recognizeDrawing(self, pos):
+    def recognizeDrawing(self, pos, session=None):
+        """the gesture is recognized at the end of the stroke, with the points of a streaming session which covers the
+        whole stroke"""
         self.pos = pos
         if len(self.pos) > 0:
-            recognized = self.recognizer.recognizeGesture(self.pos)
+            if session is not None and session.count == len(self.pos):
+                recognized = session.finish()
+            else:
+                recognized = self.recognizer.recognizeGesture(self.pos)
             self.recognizedAction(recognized)
 
-    # source: jupyter notebook "Signals, Noise, Filters", ITT
-    #def moving_average(self, pos):
-     #   filtered_signal = []
-      #  width = 10
-       # for i in range(len(pos)):
-        #    filtered_signal.append(sum(pos[i][i-width:i]/width))
-        #return filtered_signal
-
     def raiseWidgets(self):
         self.undoButton.raise_()
         self.redoButton.raise_()
@@ -11,89 +11,123 @@ The $1 Recognizer gets a list of points which describes a gesture which is drawn
 resampled, rotated, scaled and translated. When the mode is "recognize" the input gesture is compared with the templates
 of the created gestures. If the distance between input and template is under 15 the gesture is recognized and the name
 of the gestures is returned.
+As an alternative to the golden section search of the $1 Recognizer the closed form matching of "Protractor: A Fast and
+Accurate Gesture Recognizer" from Yang Li (2010) can be selected with the mode "protractor".
 by Miriam Schlindwein"""
 
 import numpy as np
 import math
-from operator import itemgetter
+from templates import TemplateStore, TEMPLATE_FILE, vectorize
 
 
 class Recognizer:
 
-    def __init__(self):
-        """init recognizer"""
+    MODE_DOLLAR = "dollar"
+    MODE_PROTRACTOR = "protractor"
+
+    def __init__(self, mode=MODE_DOLLAR, path=TEMPLATE_FILE, prune=True):
+        """init recognizer, the mode decides whether the templates are matched with the golden section search of the
+        $1 Recognizer ("dollar") or with the closed form optimal angle of Protractor ("protractor"), the templates are
+        loaded from the template file at path. With prune the $1 Recognizer skips templates which can not be better
+        than the threshold or the best template so far"""
+        if mode not in [self.MODE_DOLLAR, self.MODE_PROTRACTOR]:
+            raise ValueError("unknown recognition mode '%s'" % mode)
+        self.mode = mode
+        self.prune = prune
         self.gestures = []
-        self.gestureName = ["Circle", "Circle", "Check", "Uncheck", "Uncheck", "Edit", "Edit"]
         self.N = 64
         self.category = -1
         self.size = 100
         self.origin = 100, 100
         self.ratio = 1/2 * (-1 + np.sqrt(5))
         self.recognizedName = "gesture not found"
+        self.ranking = []
         self.angle_range = 45
         self.angle_step = 2
-        self.template = [[[56.747453856502204, 99.99999999999994], [54.62822145026911, 96.1706746531226], [56.220123471956526, 91.27134458108168], [59.21511054435149, 86.7956902928237], [62.6416734593127, 82.4940824274255], [65.3118829706288, 78.07790317423931], [66.65326082262669, 72.99864021137077], [69.09624399304994, 68.61285262020584], [72.5140546517843, 64.33284177392204], [76.63564243400702, 60.852042968570316], [81.72570713655523, 58.0803199577889], [87.26191866158109, 56.308281830546036], [92.85811793351587, 54.457491234077], [98.51581223547856, 52.745012706613636], [103.95381102375524, 50.68123353427353], [109.91565016450761, 50.64721929164722], [115.80152851968813, 51.62723146356538], [121.39660109997635, 53.51641336230142], [126.27149939817946, 56.244033934719994], [131.4648566895906, 58.75385593857416], [135.4674663172695, 62.61722617707656], [139.44230846319914, 66.54127067213236], [142.54264515097185, 70.97959959162242], [145.2890724054863, 75.63855864062708], [148.0007765414373, 80.31295040868355], [150.68379358443826, 85.0000637391262], [152.1841509849736, 90.03022383490645], [153.79990760888478, 95.06884715066354], [154.6282214502691, 100.21235398123423], [153.46307399676806, 105.35283463212346], [152.93988938054662, 110.56743299339087], [151.60958196994642, 115.62423978190651], [149.39005853683187, 120.4735863084806], [147.30007612178218, 125.11858670645097], [144.8356529115764, 129.84566878264474], [142.3007704104523, 134.57045684869757], [137.8486395742969, 137.94702377315372], [133.1089821629099, 141.1601743887402], [128.43660744358948, 144.42643032435677], [123.69222485051858, 147.5370880530977], [117.73092845643106, 148.1272420929585], [111.79753157148525, 148.87028319609004], [105.84867269563694, 149.55207982068384], [99.99743899762217, 149.876880656514], [94.07459358000887, 150.64721929164722], [88.77939555895483, 149.46349020733777], [83.12736345470898, 148.16662183930106], [78.63861231457025, 145.11880516189052], [73.83400026174286, 142.1294042806599], [70.25906025929464, 138.1437056010942], [66.00496263684374, 134.68762447392027], [63.95060334711485, 130.88454595762443], [63.06543602190317, 125.72754177638336], [63.0758777868362, 120.49639622038154], [63.781562297638345, 115.29252983622877], [63.93137009881087, 110.31752942782441], [60.76127405422699, 105.97566228203561], [58.91622838234497, 101.28998447935078], [59.648654944446946, 96.12657973078262], [61.14721334244297, 91.15023794276178], [61.68458354110817, 85.93723893384421], [62.724411692440356, 80.81513453500409], [64.01695973332522, 75.72002007529039], [67.4101945865952, 71.79145943440244]],
-                         [[60.350153960547175, 99.99999999999999], [59.41185549159948, 104.72841380122976], [59.79127388501166, 108.44386812220371], [60.704180791630534, 113.00201011449964], [61.2470029441439, 117.84107422541543], [63.66930654380889, 122.1973215385106], [66.39441225560631, 126.4343106105912], [69.48493739657721, 130.36097601090165], [72.78568338494381, 134.22311496227996], [76.59680984278813, 137.82431628695656], [80.45188038964548, 141.30852528885384], [85.70881913975845, 143.06967596412858], [90.67260654127065, 145.31870560919504], [95.80515720085847, 147.21170614074072], [101.03097209851327, 148.97063766624052], [106.11773824708573, 150.28020584141842], [111.66870858529293, 149.27565581678215], [117.28375558918893, 149.0709069049724], [122.48600997946559, 147.4284903832488], [127.6295250996188, 145.6334049188203], [132.81169157571273, 143.66169663297865], [137.7059899597517, 141.39574313451635], [141.72463930124783, 139.2217511879337], [145.19172713024895, 135.49230549540835], [148.0568160848886, 131.35660226868322], [149.39346495660388, 126.70876053196265], [150.38748738095623, 122.05961990238599], [151.095874791539, 117.25709693641703], [151.2863041778759, 112.40429315187076], [151.11203356582965, 107.61942673361874], [151.68431966248917, 102.78275769939846], [151.35974755432434, 98.01343755344804], [150.33249812024346, 93.31178876407263], [149.0026870774287, 88.6208488620842], [148.18872252394638, 83.80967056520426], [145.84965521044884, 79.4249349879782], [142.41177396445252, 75.60980053203592], [138.29435834439684, 72.2753885743375], [133.8692199910507, 69.24508231890512], [128.84621093496898, 66.98390434669675], [123.75427122833648, 64.84488067972465], [118.53581785163314, 62.93656225929048], [113.26763445984338, 61.17020747849658], [108.20752394511155, 59.09677146517093], [103.13223378476172, 56.92297817192137], [98.27097755335248, 54.41627866896037], [93.16062814697759, 52.33624507948194], [87.9036707583011, 50.53858466431528], [82.28426237381345, 50.28020584141841], [76.70006594060467, 50.39185385976474], [71.21755340991672, 51.36892985012598], [66.0342667781035, 52.76488540963497], [62.444193585197524, 56.31152891193109], [59.710590327846774, 60.50104473107636], [57.72999428269563, 64.99362815195404], [54.37477595478464, 68.90148090535318], [53.041371061210015, 73.55460472390489], [52.473737673431174, 78.38849207554311], [51.879938908935145, 83.22094942990806], [51.68431966248917, 87.7382002632804], [52.006368272643414, 92.3789085682043], [53.98202733565256, 96.52888567145074], [57.94017416306977, 99.14095029277807], [62.367590865528314, 101.39471245938374]],
-                         [[40.94217965299879, 99.99999999999999], [42.876802021424425, 102.3109368171704], [46.34710448170901, 103.72546983439257], [50.22907880150768, 104.8576504343241], [53.502764822570924, 106.59227278864937], [56.48306228759142, 108.57794159808752], [59.041479538259836, 110.7328521626162], [61.05708909804778, 113.10860014854823], [63.10575750137994, 115.47393168458187], [65.00238187311356, 117.88426704871709], [66.89834373297433, 120.29478595063496], [68.78469492303603, 122.7079673271394], [70.16051759064678, 125.23623535233325], [71.85160455581709, 127.70001176251826], [73.58527584780396, 130.1508861577197], [75.47758054271975, 132.5248501615784], [77.44722238927162, 134.8719791834601], [79.91805346343, 137.09050872810246], [81.52019263409787, 139.39469457174732], [84.27658235801243, 141.4915029183726], [87.46606738838713, 143.1188087297274], [90.02432389245038, 142.08644802797306], [92.02537071596507, 139.9325474734644], [94.42850298268681, 137.80486734394395], [96.1513611318887, 135.34887860541738], [97.44672811324776, 132.81082101079187], [98.48746083230421, 130.22328790991202], [99.83886808841149, 127.68650809395176], [101.19574163549598, 125.1507628930958], [102.56143231437366, 122.61668652724482], [103.92712299325123, 120.08261016139384], [105.29281367212891, 117.54853379554287], [105.57686698551797, 114.91245448176689], [107.29972513471986, 112.45646574324032], [108.9312906628638, 109.97937047643607], [110.45372049545895, 107.47704342619186], [111.9761503280541, 104.97471637594764], [113.49858016064931, 102.47238932570339], [114.95190241396355, 99.96289045995978], [115.10131567590659, 97.31300534772701], [116.16207629967843, 94.72787481437642], [117.22283692345022, 92.1427442810258], [118.33890556836545, 89.56620520815339], [119.54209505093903, 87.00319934833207], [120.43363307910411, 84.40105847600505], [121.07767883418327, 81.76783925295872], [121.72172458926244, 79.13462002991237], [122.3657703443416, 76.50140080686604], [123.01575177126065, 73.86877039012039], [123.8454965754772, 71.25397212650536], [124.7114471381565, 68.64359766397241], [125.68458162089868, 66.04631947014603], [126.65771610364092, 63.449041276319676], [127.55757755128482, 60.84251121071118], [128.44513419596237, 58.23442747042283], [129.55750225388257, 55.665585075185035], [131.18381990653458, 53.18645375419625], [133.01958468877885, 50.76144714324768], [134.26000496857077, 48.21994708688207], [135.22026323755276, 45.620976581170524], [135.79200151124937, 43.11880872972738], [138.98115170711523, 43.50411776755364], [140.94217965299876, 45.62119427539105], [139.11795269317278, 48.031446920692716]],
-                         [[48.81696213701977, 100.00000000000006], [49.879807504848145, 99.76499950064715], [54.304132091354035, 99.05601491119626], [58.688171979525265, 97.5361171411063], [63.21068478437249, 96.46007102480792], [67.7245078367996, 95.98010852883485], [72.3031250720197, 95.315468867455], [76.88032097817782, 94.63694059092128], [81.43903626268528, 93.8034213931295], [85.98318010016592, 92.85778730259014], [90.53275051442668, 91.99239425273154], [95.08223249592928, 91.0887199382185], [99.48460728372021, 89.71460409891222], [103.71607174768121, 87.51412693030198], [108.10786500020225, 85.92482045372654], [112.1067957895776, 83.65634129220425], [116.50334377702211, 82.12955563455193], [121.04685769968799, 81.35236322586107], [125.4555311082004, 79.75653145307271], [129.76863181374338, 77.87935268001112], [133.5942306231618, 74.84677121192013], [138.06329995495267, 74.70208516065733], [142.219283819587, 72.54000304841313], [146.72417193849785, 73.3303504573552], [148.81696213701977, 77.21244744507962], [145.83383650471674, 81.4193199648758], [142.5424087584257, 85.2925686153456], [139.47981074434088, 89.27718887051205], [137.27524780065622, 94.13629841500779], [135.13088379227204, 99.00389528305666], [131.99133450641713, 103.0562965125936], [128.7415535015788, 106.97769992126607], [125.79964150530887, 111.23134729092098], [122.989164170659, 115.61577677195228], [120.99303488353601, 120.57837875911278], [119.55607758263878, 125.80659970724489], [118.49789090731409, 131.1697609226492], [117.00800695629516, 136.3958824375746], [114.5667235541701, 140.99276339181628], [112.83415760457422, 146.11880415805112], [110.14988299224808, 150.55737237927164], [107.19901113884313, 154.1928648452957], [103.62744043618525, 151.497168028355], [101.793388316657, 146.4346110357446], [100.260938164885, 141.24578083513936], [98.30070898258552, 136.23828422372318], [96.531776885435, 131.13079297371232], [95.75748021151267, 125.69527935761661], [94.74093974814625, 120.3147264725603], [92.48399996834027, 115.56108715119385], [90.11313983250554, 110.8159606856677], [87.7422796966708, 106.07083422014153], [84.93912669927968, 101.80668605599695], [82.58529385799395, 97.05046910916579], [79.60736909963907, 92.87561879482055], [76.68060690258056, 88.64628197669799], [74.13858164422638, 84.03160750986362], [71.29535044107817, 79.67585379979559], [68.06229445277583, 75.9082070017428], [65.36713128943094, 71.41951570567451], [63.054457825446576, 66.68807071426235], [59.9419115981793, 62.790354445866484], [56.55480589371507, 59.03573026671191], [55.3797466983566, 54.1928648452957]],
-                         [[45.28964521495388, 99.99999999999991], [49.64967553578708, 99.21027360450549], [52.80998433754746, 102.43030543789993], [56.707709001454134, 101.94310674174719], [61.143657786510744, 101.92210812368538], [65.58637441661358, 102.48089772460696], [70.0649676592422, 102.55695124592924], [74.51618265828665, 102.17442476549817], [78.89908886690944, 101.11392949415182], [83.26342463621609, 101.0996621875222], [87.71792583733628, 101.72297128966983], [92.0307166327971, 102.93709437546687], [96.38475241449257, 104.05704175758149], [100.73587969529342, 105.25090135990277], [105.09365478548176, 106.46212151559692], [109.48591259563625, 107.42347163692281], [113.8070928580533, 108.78082145801596], [118.24685874294778, 108.6588864590932], [122.72771873753851, 108.9457992361231], [127.16691523267951, 109.57948596315484], [131.64344810523812, 109.40424143755834], [135.7540065697699, 109.43610799656088], [139.9579940893238, 107.89027353202616], [143.9298665015737, 108.7279869517493], [145.2896452149539, 109.3521333721612], [141.1409059822077, 108.45035112355524], [136.8541459048251, 108.03763927863221], [132.66017129104137, 106.2368004883966], [128.62314369407795, 104.47710591822917], [125.04519393059081, 101.79951655638752], [121.46900970625495, 98.85752212931502], [118.11913337310693, 95.5027261748788], [114.49645572149271, 92.53758593130104], [111.29680832398083, 89.00260401192085], [108.58581246926994, 85.25562338424263], [106.63040191573904, 80.78215573423765], [104.47111197785912, 76.44957483354798], [102.17868425727715, 72.10875376720793], [99.6719694999141, 67.97347332011796], [97.17854829671893, 63.807818466768396], [94.05206167924936, 60.23322003700878], [92.18135806200928, 55.68323828163054], [92.94135837395453, 53.73083167921183], [94.58055395205147, 58.181985359447395], [96.2530608073387, 62.87048775954017], [96.9143435033844, 67.72298893331075], [97.48709869585821, 72.71994346062357], [97.53102076769204, 77.73309447943893], [96.7731502958141, 82.69204413949288], [96.59080723646164, 87.74028981604201], [96.37757524150109, 92.78623628596321], [95.65540230255434, 97.7530853364186], [95.01656420384313, 102.72206337649627], [94.81322140872112, 107.76929266362393], [94.42275402760245, 112.77671382359247], [93.02082908170232, 117.57018640898784], [92.54901256127147, 122.56065315178762], [91.27045621681319, 127.40378355038936], [90.21113156903357, 132.3110304616309], [89.20577678267486, 137.23113832969491], [88.57319623646836, 142.23313297140126], [87.49570364723598, 147.01064534359867], [88.01172298129595, 151.99283388558374], [91.7472458944763, 153.7308316792119]],
-                         [[41.813010715816006, 99.99999999999994], [43.55014283197383, 94.98957476829], [47.081965643944386, 93.38798603068204], [50.36865262671182, 90.17949810299808], [53.162156188965184, 85.77388436010568], [56.07628835579442, 81.55716612699902], [58.764707622590066, 76.918117780941], [61.28809735555427, 71.98084827477379], [64.09201577525849, 67.62142952046622], [67.06466324359084, 63.557442745939625], [69.58048581956226, 58.72259863671741], [72.31997528751245, 54.43422588420219], [75.11517074765626, 55.153014974602456], [75.83766154891603, 61.66417604303493], [76.21440790792377, 68.23944472581223], [75.89981514657964, 74.85836393148895], [75.60322615037953, 81.47893009925073], [75.06074996644494, 88.05109817399307], [74.55156558500846, 94.63248601545723], [74.90886344713644, 101.22852016608064], [75.20920984252317, 107.6568205742357], [75.83927151873664, 113.66390066009717], [78.04788608374005, 109.87038094789509], [80.83911997852758, 105.82910818556073], [83.85289446318532, 101.85579465335414], [86.62342526240371, 97.35227193435463], [89.4037061222522, 92.86451361726807], [92.15297825633237, 88.32913321942584], [95.39000482619028, 84.97923671159097], [98.83819297300036, 82.32857530069737], [102.17476246251252, 79.6923455720775], [105.86827171267544, 78.6653770336147], [109.2677388205046, 81.1361161646324], [110.67141663510267, 86.49832398204256], [111.32399316678831, 92.9504387310592], [111.62877542413187, 99.51455364139514], [112.10233136718963, 106.09278529899228], [111.8135508112417, 112.7133239917728], [111.42548043096772, 119.32025885753455], [110.77018693938174, 125.82802498386246], [110.82219470911969, 132.4503433501934], [111.63593471971191, 136.5666950701846], [113.95006546354043, 131.5111502335651], [116.72934929985288, 127.05175430984843], [119.13306217937881, 121.9424012466122], [121.40538362265778, 116.68238535655246], [123.83063702672965, 111.59555405320287], [126.37894442801704, 106.69947455281599], [128.916383849059, 101.78528996937357], [131.91435541580742, 97.79619910225992], [134.8761198008152, 93.8513288853585], [137.71893721463502, 89.72310773232377], [140.9267881991565, 90.12237952821346], [141.20125404147424, 96.39165652835686], [141.81301071581598, 102.88721371940736], [141.62102626409748, 109.47929929108938], [141.0744144457523, 116.0407794971519], [140.64997556114437, 122.63527408242837], [140.23598604439408, 129.23642096442347], [139.77446815594973, 135.82861671030201], [139.80111063338822, 142.11792993344477], [138.50014285451797, 148.21897594514326], [137.30668748240274, 154.4342258842022], [138.18694880787578, 153.3814536302474]],
-                         [[45.795160842872605, 99.99999999999991], [44.51369159478617, 100.60737558620673], [46.51943797381412, 106.09536803916649], [49.204764725083834, 109.8279905471808], [51.116992792042964, 115.49371950916384], [53.07477049311356, 120.85323442627], [55.1658039400304, 126.1772577686153], [57.4042807338009, 131.26837230069785], [60.171596378987886, 134.97099724931203], [62.82275816974027, 138.87121754287753], [65.34031508843199, 143.2820180271855], [68.17040107490777, 146.15122033010405], [70.73950272914522, 142.24288247113034], [72.07956802165751, 135.92292125650485], [72.71805629006553, 129.10852081237127], [73.91377846936712, 122.71010140103127], [74.82635049877308, 116.0115285276033], [75.67126747699282, 109.2606600346059], [76.40360142730702, 102.45977131194749], [77.36736368620558, 95.88877344844781], [79.34693939990811, 90.35530938129585], [81.6433415484803, 85.81574198173993], [84.47948218867577, 87.90150693430871], [86.80892906150683, 91.90270017698515], [88.74045051488213, 97.21602348150611], [90.90590691782475, 102.44525955554226], [92.99104494490865, 107.80330714544766], [95.05844926575605, 113.13667030942963], [97.00845373424372, 118.54750330918594], [99.85591103906236, 121.8734254471772], [102.8380897811158, 123.08757594662919], [105.94898176413079, 122.95096175530833], [107.49774444550675, 117.6826271088], [107.52605256148681, 110.69455339056307], [108.38187274733423, 104.29806549996496], [109.58430908249119, 97.79930433878721], [110.77580559749453, 91.29549794670012], [111.19790379114289, 84.4481447742019], [112.01644741910451, 77.83411661694825], [112.77444879363799, 71.05476009388994], [113.74914732207759, 64.46928196674585], [115.8357154794364, 59.37556349668259], [118.60217481378345, 60.12431400082872], [120.2485430991662, 65.94603101329753], [121.75076439259504, 72.11086938321407], [122.97323618843012, 78.4869771090375], [124.256273960476, 84.88453994008964], [125.75002956405112, 91.09615645669345], [127.41513067723886, 96.98197356775793], [128.66713306405347, 103.32737817606846], [129.6021920722818, 109.86821735163687], [132.081584203958, 113.91427827478822], [134.55908221295854, 114.03272070526603], [136.05375515996434, 107.82315732661257], [137.87996452353616, 102.62489375189287], [139.41302354340365, 97.00406418297095], [139.8840535712405, 90.08848027029137], [140.07719710858072, 83.16330471059183], [140.5134911889952, 76.28528464835111], [141.11761777143442, 69.4172752155269], [141.35586105665612, 62.47929269687643], [142.06228406809026, 55.68373380588662], [143.23802635698507, 49.31400583395279], [144.51369159478617, 46.15122033010405]]
-                         ]
+        self.threshold = 15
+        self.protractor_threshold = 0.45
+        self.abandon_chunk = 32
+        self.pruned = 0
+        self.abandoned = 0
+        self.store = TemplateStore.load(path)
+        if self.store.N != self.N:
+            raise ValueError("the templates in '%s' have %d points instead of %d" % (path, self.store.N, self.N))
+        self.loadTemplates()
 
     def recognizeGesture(self, gest):
         """when the mode is "recognize" the input gesture are resampled, rotated, scaled and translated and at least
         the recognition is started. If the result of recognition is -1 no agreement is found otherwise the name of the
         gesture is defined by the value which is returned after recognition"""
-        gesture = []
-        result = "gesture not found"
-        gesture = gest
         try:
-            if len(gesture) > 1:
-                gesture = self.resample(gesture)
-                gesture = self.rotate(gesture)
-                gesture = self.scale(gesture)
-                gesture = self.translate(gesture)
-                self.category = self.recognize(gesture, self.template)
-                if sorted(self.category, key=itemgetter(0))[0][0] <= 15:
-                    self.category = sorted(self.category, key=itemgetter(0))[0][1]
-                    result = self.gestureName[self.category]
-                return result
+            if len(gest) > 1:
+                return self.recognizeResampled(self.resample(gest))
             else:
                 return "no valid gesture"
         except Exception as e:
             print(e)
 
+    def recognizeResampled(self, gesture):
+        """the already resampled gesture is rotated, scaled and translated and compared with the templates, the name
+        of the best template or "gesture not found" is returned"""
+        result = "gesture not found"
+        gesture = self.rotate(gesture)
+        gesture = self.scale(gesture)
+        gesture = self.translate(gesture)
+        self.ranking = self.recognize(gesture)
+        self.category = -1
+        if len(self.ranking) > 0 and self.ranking[0][0] <= self.getThreshold():
+            self.category = self.ranking[0][1]
+            result = self.gestureName[self.category]
+        return result
+
+    def startSession(self, interval=8):
+        """starts the recognition of a gesture while it is drawn, see GestureSession"""
+        return GestureSession(self, interval)
+
+    def loadTemplates(self):
+        """the names, points and Protractor vectors of the template store are used for recognition, the arrays are
+        views of the memory mapped file and are not converted again"""
+        self.gestureName = self.store.names
+        self.template = self.store.points
+        self.templates = self.store.points
+        self.vectors = self.store.vectors
+
+    def addTemplate(self, name, gest):
+        """the gesture is resampled, rotated, scaled and translated and added as new template with the given name"""
+        gesture = self.translate(self.scale(self.rotate(self.resample(gest))))
+        self.store.add(name, gesture, self.size, self.origin)
+        self.loadTemplates()
+
+    def saveTemplates(self, path=TEMPLATE_FILE):
+        """the templates including the ones added with addTemplate are written to the template file"""
+        self.store.save(path)
+
+    def getThreshold(self):
+        """returns the maximum distance for a recognized gesture, Protractor distances are angles between the
+        normalized vectors and need their own threshold"""
+        if self.mode == self.MODE_PROTRACTOR:
+            return self.protractor_threshold
+        return self.threshold
+
     def getGestureName(self):
         """returns the name of the recognized gesture"""
         return self.recognizedName
 
     def resample(self, points):
-        """the input gestures are sampled to the length n and the list newPoints is returned"""
-        intervalLength = self.pathLength(points) / float(self.N - 1)
-        D = 0.0
-        newpoints = [points[0]]
-        i = 1
-        while i < len(points):
-            point = points[i - 1]
-            next_point = points[i]
-            d = self.distance(point, next_point)
-            if d + D >= intervalLength:
-                delta_distance = float((intervalLength - D) / d)
-                self.q = [0.0, 0.0]
-                self.q[0] = points[i-1][0] + delta_distance * (points[i][0] - points[i-1][0])
-                self.q[1] = points[i-1][1] + delta_distance * (points[i][1] - points[i-1][1])
-                newpoints.append(self.q)
-                points.insert(i, self.q)
-                D = 0.0
-
-            else:
-                D += d
-            i += 1
-
-        if len(newpoints) == self.N - 1:
-            newpoints.append(points[-1])
-        return newpoints
+        """the input gesture is sampled to N points which are evenly spaced along the path, the new points are
+        interpolated from the cumulative path length in linear time and the input list is not changed"""
+        points = np.asarray(points, dtype=float)
+        segments = np.hypot(np.diff(points[:, 0]), np.diff(points[:, 1]))
+        cumulative = np.concatenate(([0.0], np.cumsum(segments)))
+        return self.resampleAlong(points, cumulative)
+
+    def resampleAlong(self, points, cumulative):
+        """the points with the shape (n, 2) are sampled to N points, cumulative holds the path length from the first
+        point up to every point"""
+        targets = np.linspace(0.0, cumulative[-1], self.N)
+        x = np.interp(targets, cumulative, points[:, 0])
+        y = np.interp(targets, cumulative, points[:, 1])
+        return np.column_stack((x, y)).tolist()
 
     def centroid(self, gesture):
         """the centroid of the gesture is calculated and returned"""
@@ -165,33 +199,28 @@ class Recognizer:
 
         return newPoints
 
-    def recognize(self, points, templates):
-        b = math.inf
-        resultArray = []
-        for i in range(len(templates)):
-            for j in range(len(templates[i])):
-                d = self.distanceAtBestAngle(points, templates[i], -self.angle_range, self.angle_range, self.angle_step)
-                if(d < b):
-                    b = d
-                    resultArray.append([d, i])
-
-        return resultArray
+    def recognize(self, points, templates=None):
+        """every template is scored exactly once against the points, a list of (distance, template index, best angle)
+        sorted by ascending distance is returned, the first entry is the best match. When pruning is enabled for the
+        $1 Recognizer, templates which can not get below the threshold or the best distance are left out"""
+        if self.mode == self.MODE_PROTRACTOR:
+            vectors = self.vectors if templates is None else self.vectorize(templates)
+            distances, angles = self.optimalCosineDistance(points, vectors)
+        else:
+            if templates is None:
+                templates = self.templates
+            bound = self.getThreshold() if self.prune else None
+            distances, angles = self.distanceAtBestAngleAll(points, np.asarray(templates, dtype=float),
+                                                            -self.angle_range, self.angle_range, self.angle_step, bound)
+        order = np.argsort(distances, kind="stable")
+        return [(float(distances[i]), int(i), float(angles[i])) for i in order if distances[i] < np.inf]
 
     def recognized(self, points):
         """calculates the distance between points and templates and returns the number of template
         if there is no recognition -1 is returned"""
-        numGesture = -1
-        b = np.inf
-        angle = 45
-        a = 2
-        for i in range(len(self.template)):
-            template = self.template[i]
-            d = self.distanceAtBestAngle(points, template, - angle, angle, a)
-            if d < b:
-                b = d
-                numGesture = i
-        if b < 15:
-            return numGesture
+        ranking = self.recognize(points)
+        if len(ranking) > 0 and ranking[0][0] < self.getThreshold():
+            return ranking[0][1]
         else:
             return -1
 
@@ -224,6 +253,142 @@ class Recognizer:
         d = self.pathDistance(newPoints, T)
         return d
 
+    def distanceAtBestAngleAll(self, points, templates, minAngle, angle, a, bound=None):
+        """the golden section search of distanceAtBestAngle for all templates at once, templates has the shape
+        (T, N, 2) and every step rotates and scores all templates with one broadcast operation, the minimum distance and
+        the angle at which it was found are returned for every template, both with the shape (T,).
+        With a bound the search is pruned: templates whose lower bound exceeds the bound or the best distance found so
+        far are skipped and get the distance inf. A new probe is only compared with the distance that the search keeps,
+        so it is abandoned as soon as its partial sum exceeds that distance, the result stays the same. The number of
+        skipped templates and abandoned probes of the call is kept in self.pruned and self.abandoned"""
+        points = np.asarray(points, dtype=float)
+        templates = templates[:, :len(points)]
+        distances = np.full(len(templates), np.inf)
+        angles = np.zeros(len(templates))
+        self.pruned = self.abandoned = 0
+        live = np.arange(len(templates))
+        lower = np.zeros(len(templates))
+        if bound is not None:
+            # the coarse bound on every 8th point is checked first, the bound on all points only for the rest
+            coarse = self.lowerBound(points, templates, 8)
+            live = np.flatnonzero(coarse <= bound)
+            lower = self.lowerBound(points, templates[live])
+            live, lower = live[lower <= bound], lower[lower <= bound]
+            self.pruned = len(templates) - len(live)
+            if len(live) == 0:
+                return distances, angles
+        T = templates[live]
+        minAngle = np.full(len(live), float(minAngle))
+        angle = np.full(len(live), float(angle))
+        x1 = self.ratio * minAngle + (1 - self.ratio) * angle
+        f1 = self.distanceAtAngleAll(points, T, x1)
+        x2 = (1 - self.ratio) * minAngle + self.ratio * angle
+        f2 = self.distanceAtAngleAll(points, T, x2, None if bound is None else f1)
+
+        active = np.abs(angle - minAngle) > a
+        while active.any():
+            if bound is not None:
+                # the kept distance min(f1, f2) never grows, so the best of it bounds the final best distance
+                bound = min(bound, np.minimum(f1, f2).min())
+                keep = lower <= bound
+                if not keep.all():
+                    self.pruned += len(keep) - int(keep.sum())
+                    live, lower, T, minAngle, angle = live[keep], lower[keep], T[keep], minAngle[keep], angle[keep]
+                    x1, x2, f1, f2, active = x1[keep], x2[keep], f1[keep], f2[keep], active[keep]
+            left = active & (f1 < f2)
+            right = active & ~(f1 < f2)
+            angle = np.where(left, x2, angle)
+            minAngle = np.where(right, x1, minAngle)
+            newX1 = np.where(left, self.ratio * minAngle + (1 - self.ratio) * angle, np.where(right, x2, x1))
+            newX2 = np.where(left, x1, np.where(right, (1 - self.ratio) * minAngle + self.ratio * angle, x2))
+            newF1 = np.where(right, f2, f1)
+            newF2 = np.where(left, f1, f2)
+            # every active template needs exactly one new probe per step, either at x1 or at x2
+            probe = np.where(left, newX1, newX2)[active]
+            kept = None if bound is None else np.minimum(f1, f2)[active]
+            f = np.zeros(len(live))
+            f[active] = self.distanceAtAngleAll(points, T[active], probe, kept)
+            x1, x2 = newX1, newX2
+            f1 = np.where(left, f, newF1)
+            f2 = np.where(right, f, newF2)
+            active = np.abs(angle - minAngle) > a
+
+        distances[live] = np.minimum(f1, f2)
+        angles[live] = np.where(f2 < f1, x2, x1)
+        return distances, angles
+
+    def distanceAtAngleAll(self, points, templates, radians, bound=None):
+        """the distance between points and every template is calculated, each template with its own angle"""
+        if bound is not None:
+            return self.pathDistanceBounded(points, templates, radians, bound)
+        newPoints = self.rotateAll(points, radians)
+        return self.pathDistanceAll(newPoints, templates)
+
+    def pathDistanceBounded(self, points, templates, radians, bound):
+        """distanceAtAngleAll in chunks of points, a template is abandoned as soon as the partial distance exceeds its
+        bound, the partial distance is returned then which is already larger than the bound"""
+        centroid = points.mean(0)
+        cos = np.cos(-radians)
+        sin = np.sin(-radians)
+        n = len(points)
+        total = np.zeros(len(templates))
+        live = np.arange(len(templates))
+        for start in range(0, n, self.abandon_chunk):
+            dx = points[start:start + self.abandon_chunk, 0] - centroid[0]
+            dy = points[start:start + self.abandon_chunk, 1] - centroid[1]
+            x = dx * cos[live, np.newaxis] - dy * sin[live, np.newaxis] + centroid[0]
+            y = dx * sin[live, np.newaxis] + dy * cos[live, np.newaxis] + centroid[1]
+            chunk = templates[live, start:start + self.abandon_chunk]
+            total[live] += np.sqrt((chunk[..., 0] - x) ** 2 + (chunk[..., 1] - y) ** 2).sum(-1)
+            over = total[live] / n > bound[live]
+            if over.any():
+                self.abandoned += int(over.sum())
+                live = live[~over]
+                if len(live) == 0:
+                    break
+        return total / n
+
+    def lowerBound(self, points, templates, step=1):
+        """a lower bound of pathDistance at any angle for every template: the rotation around the centroid keeps the
+        distance of every point to the centroid, so |p - q| >= ||p - c| - |q - c||. With step > 1 only every step-th
+        point is summed up, which is cheaper but less tight"""
+        centroid = points.mean(0)
+        radius = np.hypot(points[::step, 0] - centroid[0], points[::step, 1] - centroid[1])
+        radii = np.hypot(templates[:, ::step, 0] - centroid[0], templates[:, ::step, 1] - centroid[1])
+        return np.abs(radii - radius).sum(-1) / len(points)
+
+    def rotateAll(self, points, radians):
+        """the gesture with the shape (N, 2) is rotated by every angle of radians, the rotated gestures are returned
+        with the shape (len(radians), N, 2)"""
+        centroid = points.mean(0)
+        cos = np.cos(-radians)[:, np.newaxis]
+        sin = np.sin(-radians)[:, np.newaxis]
+        dx = points[:, 0] - centroid[0]
+        dy = points[:, 1] - centroid[1]
+        x = dx * cos - dy * sin + centroid[0]
+        y = dx * sin + dy * cos + centroid[1]
+        return np.stack((x, y), axis=-1)
+
+    def vectorize(self, gestures):
+        """the gestures are converted to the unit vectors used by Protractor"""
+        return vectorize(gestures)
+
+    def optimalCosineDistance(self, points, vectors):
+        """Protractor: the optimal angle between the points and every template vector is calculated in closed form, so
+        each template comparison is a single dot product. The angular distance arccos(similarity) and the angle which
+        rotates the points onto the template (same convention as rotateBy) are returned with the shape (T,)"""
+        vector = self.vectorize(points)
+        vectors = vectors[:, :len(vector)]
+        a = vectors[:, 0::2] @ vector[0::2] + vectors[:, 1::2] @ vector[1::2]
+        b = vectors[:, 0::2] @ vector[1::2] - vectors[:, 1::2] @ vector[0::2]
+        # at the optimal angle atan2(b, a) the similarity a * cos + b * sin equals sqrt(a^2 + b^2)
+        similarity = np.minimum(np.hypot(a, b), 1.0)
+        return np.arccos(similarity), np.arctan2(b, a)
+
+    # calculates the mean distance of corresponding points for all templates at once
+    def pathDistanceAll(self, pts, templates):
+        return np.sqrt(((templates - pts) ** 2).sum(-1)).mean(-1)
+
     # calculates the distance of all points
     def pathDistance(self, pts1, pts2):
         d = 0.0
@@ -236,3 +401,111 @@ class Recognizer:
         dx = p2[0] - p1[0]
         dy = p2[1] - p1[1]
         return float(math.sqrt(dx * dx + dy * dy))
+
+
+class GestureSession:
+
+    def __init__(self, recognizer, interval=8):
+        """the points of a gesture are added one by one while it is drawn. The session keeps the running path length
+        of the points, so they are resampled without measuring the stroke again, and recognizes the points drawn so
+        far every interval points, so a provisional result is always available while the gesture is drawn. The final
+        result still resamples and recognizes the whole stroke, because the resampled points depend on its length"""
+        self.recognizer = recognizer
+        self.interval = interval
+        self.points = np.empty((256, 2))
+        self.cumulative = np.empty(256)
+        self.count = 0
+        self.length = 0.0
+        self.result = "no valid gesture"
+        self.resultCount = 0
+
+    def addPoint(self, point):
+        """adds the next point of the gesture and updates the path length and if due the provisional result"""
+        if self.count == len(self.points):
+            self.points = np.concatenate((self.points, np.empty_like(self.points)))
+            self.cumulative = np.concatenate((self.cumulative, np.empty_like(self.cumulative)))
+        x, y = float(point[0]), float(point[1])
+        if self.count > 0:
+            last = self.points[self.count - 1]
+            self.length += math.hypot(x - last[0], y - last[1])
+        self.points[self.count] = x, y
+        self.cumulative[self.count] = self.length
+        self.count += 1
+        if self.count - self.resultCount >= self.interval:
+            self.update()
+
+    def update(self):
+        """the points added so far are resampled with the running path length and recognized"""
+        self.resultCount = self.count
+        if self.count > 1:
+            try:
+                resampled = self.recognizer.resampleAlong(self.points[:self.count], self.cumulative[:self.count])
+                self.result = self.recognizer.recognizeResampled(resampled)
+            except Exception as e:
+                print(e)
+                self.result = None
+        else:
+            self.result = "no valid gesture"
+
+    def provisional(self):
+        """returns the name of the best matching template for the points drawn so far"""
+        return self.result
+
+    def finish(self):
+        """returns the final result of the gesture, it is only recognized again if points were added since the last
+        update"""
+        if self.resultCount != self.count:
+            self.update()
+        return self.result
+
+
+# the recognizer of a worker process in recognize_batch, every worker memory maps the same template file
+_worker = None
+
+
+def _initWorker(mode, path, prune):
+    global _worker
+    _worker = Recognizer(mode, path, prune)
+
+
+def _recognizeStroke(stroke):
+    return _worker.recognizeGesture(stroke) or "gesture not found"
+
+
+def recognize_batch(strokes, labels=None, workers=None, mode=Recognizer.MODE_DOLLAR, path=TEMPLATE_FILE, prune=True):
+    """recognizes many recorded strokes for offline evaluation. Normalization and matching are spread over a pool of
+    worker processes (default: one per cpu), the templates are shared read only by memory mapping the template file
+    in every worker. The list of recognized names is returned, with labels additionally the confusion matrix and its
+    classes (see confusionMatrix)"""
+    strokes = list(strokes)
+    if workers == 1:
+        _initWorker(mode, path, prune)
+        predicted = [_recognizeStroke(stroke) for stroke in strokes]
+    else:
+        # only needed for offline evaluation, not imported with the recognizer
+        import multiprocessing
+        workers = workers or multiprocessing.cpu_count()
+        chunksize = max(1, len(strokes) // (4 * workers))
+        with multiprocessing.Pool(workers, initializer=_initWorker, initargs=(mode, path, prune)) as pool:
+            predicted = pool.map(_recognizeStroke, strokes, chunksize)
+    if labels is None:
+        return predicted
+    matrix, classes = confusionMatrix(labels, predicted, TemplateStore.load(path).names)
+    return predicted, matrix, classes
+
+
+def confusionMatrix(labels, predicted, names=()):
+    """counts how often every label was recognized as every class, the row is the label and the column the recognized
+    name. The classes start with the given gesture names and continue with the other names in order of appearance"""
+    labels = list(labels)
+    if len(labels) != len(predicted):
+        raise ValueError("%d labels for %d strokes" % (len(labels), len(predicted)))
+    classes = []
+    for name in list(names) + labels + list(predicted):
+        if name not in classes:
+            classes.append(name)
+    index = {name: i for i, name in enumerate(classes)}
+    matrix = np.zeros((len(classes), len(classes)), dtype=int)
+    for label, name in zip(labels, predicted):
+        matrix[index[label], index[name]] += 1
+    return matrix, classes
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# coding: utf-8
+# -*- coding: utf-8 -*-
+
+"""The templates of the $1 Recognizer are kept in a binary NumPy file (templates.npy) instead of Python literals.
+Every template is one record of a structured array with its name, the size and origin it was normalized with, the
+normalized points and the unit vector used by Protractor. The vector is calculated once when a template is added, so
+neither importing the recognizer nor recognizing a gesture has to convert the templates again. The file is memory
+mapped when it is loaded.
+Run this module to list the stored templates."""
+
+import numpy as np
+import os
+import sys
+
+TEMPLATE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates.npy")
+
+
+def vectorize(gestures):
+    """the gestures with the shape (..., N, 2) are translated to their centroid, flattened to (x1, y1, x2, y2, ...)
+    and scaled to unit length as described for Protractor"""
+    gestures = np.asarray(gestures, dtype=float)
+    centered = gestures - gestures.mean(-2, keepdims=True)
+    vectors = centered.reshape(centered.shape[:-2] + (-1,))
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+class TemplateStore:
+
+    def __init__(self, N=64, records=None):
+        """init an empty store for templates with N points or wrap already loaded records"""
+        if records is None:
+            records = np.zeros(0, dtype=self.recordType(N))
+        self.records = records
+        self.N = records.dtype["points"].shape[0]
+
+    @staticmethod
+    def recordType(N):
+        """the record of one template: name, size and origin of the normalization, N points and the Protractor
+        vector with 2N values"""
+        return np.dtype([("name", "U32"), ("size", "f8"), ("origin", "f8", (2,)), ("points", "f8", (N, 2)),
+                         ("vector", "f8", (2 * N,))])
+
+    @classmethod
+    def load(cls, path=TEMPLATE_FILE, mmap=True):
+        """the templates are loaded from path, by default the file is memory mapped read only"""
+        records = np.load(path, mmap_mode="r" if mmap else None)
+        if records.dtype.names != cls.recordType(records.dtype["points"].shape[0]).names:
+            raise ValueError("'%s' is not a template file" % path)
+        return cls(records=records)
+
+    def save(self, path=TEMPLATE_FILE):
+        """the templates are written to a temporary file which then replaces path. The records may be memory mapped
+        from path itself, writing to path directly would truncate the file they are read from"""
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as f:
+            np.save(f, np.ascontiguousarray(self.records))
+        os.replace(temporary, path)
+
+    def add(self, name, points, size, origin):
+        """a normalized gesture is appended as new template, the Protractor vector is calculated here once"""
+        points = np.asarray(points, dtype=float)
+        if points.shape != (self.N, 2):
+            raise ValueError("a template needs %d points, got %d" % (self.N, len(points)))
+        record = np.zeros(1, dtype=self.records.dtype)
+        record["name"] = name
+        record["size"] = size
+        record["origin"] = origin
+        record["points"] = points
+        record["vector"] = vectorize(points)
+        self.records = np.concatenate((self.records, record))
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def names(self):
+        return [str(name) for name in self.records["name"]]
+
+    @property
+    def points(self):
+        """all template points with the shape (T, N, 2)"""
+        return self.records["points"]
+
+    @property
+    def vectors(self):
+        """all Protractor vectors with the shape (T, 2N)"""
+        return self.records["vector"]
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else TEMPLATE_FILE
+    store = TemplateStore.load(path)
+    for i, record in enumerate(store.records):
+        print(i, record["name"], "size", record["size"], "origin", tuple(record["origin"]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# coding: utf-8
+# -*- coding: utf-8 -*-
+
+"""Regression tests of the Recognizer: the ranked result of recognize has to give the same gesture names as the
+recognition loop before it scored every template only once. LegacyRecognizer is a copy of that loop, it scores every
+template 64 times and mutates the input gesture while resampling, which is kept as it was."""
+
+import math
+from operator import itemgetter
+
+import numpy as np
+import pytest
+
+from recognizer import Recognizer
+
+
+class LegacyRecognizer(Recognizer):
+
+    def recognizeGesture(self, gest):
+        """the recognition of the recognizer before the ranked results, returns the name and the best distance"""
+        gesture = self.resample([list(point) for point in gest])
+        gesture = self.rotate(gesture)
+        gesture = self.scale(gesture)
+        gesture = self.translate(gesture)
+        result = "gesture not found"
+        category = self.recognize(gesture, self.template.tolist())
+        best = sorted(category, key=itemgetter(0))[0]
+        if best[0] <= 15:
+            result = self.gestureName[best[1]]
+        return result, best[0]
+
+    def resample(self, points):
+        intervalLength = self.pathLength(points) / float(self.N - 1)
+        D = 0.0
+        newpoints = [points[0]]
+        i = 1
+        while i < len(points):
+            point = points[i - 1]
+            next_point = points[i]
+            d = self.distance(point, next_point)
+            if d + D >= intervalLength:
+                delta_distance = float((intervalLength - D) / d)
+                self.q = [0.0, 0.0]
+                self.q[0] = points[i-1][0] + delta_distance * (points[i][0] - points[i-1][0])
+                self.q[1] = points[i-1][1] + delta_distance * (points[i][1] - points[i-1][1])
+                newpoints.append(self.q)
+                points.insert(i, self.q)
+                D = 0.0
+
+            else:
+                D += d
+            i += 1
+
+        if len(newpoints) == self.N - 1:
+            newpoints.append(points[-1])
+        return newpoints
+
+    def recognize(self, points, templates):
+        b = math.inf
+        resultArray = []
+        for i in range(len(templates)):
+            for j in range(len(templates[i])):
+                d = self.distanceAtBestAngle(points, templates[i], -self.angle_range, self.angle_range, self.angle_step)
+                if(d < b):
+                    b = d
+                    resultArray.append([d, i])
+
+        return resultArray
+
+
+def strokes():
+    """fixed strokes: every template drawn again with noise, scaled and moved on the screen, an ellipse and two shapes
+    which match no template"""
+    rng = np.random.default_rng(2007)
+    recognizer = Recognizer()
+    result = []
+    for template in recognizer.template:
+        for scale in (0.8, 2.5):
+            points = np.asarray(template) * scale + rng.uniform(50, 400, 2) + rng.normal(0, 1.5, template.shape)
+            result.append(points.tolist())
+    t = np.linspace(0, 2 * np.pi, 90)
+    result.append(np.column_stack((300 + 120 * np.cos(t), 250 + 80 * np.sin(t))).tolist())
+    wave = np.linspace(0, 6 * np.pi, 40)
+    result.append(np.column_stack((np.linspace(100, 500, 40), 200 + 60 * np.sin(wave))).tolist())
+    result.append([[100, 100], [200, 300], [300, 100], [400, 300], [500, 120]])
+    return result
+
+
+@pytest.fixture(scope="module")
+def legacy():
+    return [LegacyRecognizer().recognizeGesture(stroke) for stroke in strokes()]
+
+
+@pytest.mark.parametrize("prune", [False, True])
+def test_recognize_matches_legacy_loop(legacy, prune):
+    recognizer = Recognizer(prune=prune)
+    for stroke, (name, distance) in zip(strokes(), legacy):
+        assert recognizer.recognizeGesture(stroke) == name
+        # with pruning only templates below the threshold are ranked
+        if distance <= recognizer.threshold or not prune:
+            assert recognizer.ranking[0][0] == pytest.approx(distance, rel=1e-6)
+
+
+def test_recognize_scores_every_template_once():
+    recognizer = Recognizer(prune=False)
+    stroke = strokes()[0]
+    recognizer.recognizeGesture(stroke)
+    assert sorted(index for _, index, _ in recognizer.ranking) == list(range(len(recognizer.template)))
+    distances = [distance for distance, _, _ in recognizer.ranking]
+    assert distances == sorted(distances)
+
+
+def test_recognize_does_not_change_the_input():
+    stroke = strokes()[0]
+    copy = [list(point) for point in stroke]
+    Recognizer().recognizeGesture(stroke)
+    assert stroke == copy
+
+
+def test_save_templates_over_the_mapped_file(tmp_path):
+    path = str(tmp_path / "templates.npy")
+    Recognizer().saveTemplates(path)
+    recognizer = Recognizer(path=path)
+    names = recognizer.gestureName
+    # the templates are memory mapped from path while they are written back to it
+    recognizer.saveTemplates(path)
+    assert Recognizer(path=path).gestureName == names
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# coding: utf-8
+# -*- coding: utf-8 -*-
+
+"""Tests of the cached homography of Transform.transform: it is only reused for LEDs which did not move, every move of
+a LED by one camera pixel has to move the cursor."""
+
+from transform import Transform
+
+LEDS = [(300, 250), (700, 260), (310, 520), (690, 530)]
+
+
+def test_one_pixel_move_changes_the_cursor():
+    transform = Transform()
+    previous = transform.transform(Transform.CENTER, LEDS, 1920, 1080)
+    for step in range(1, 6):
+        leds = [(x + step, y) for x, y in LEDS]
+        point = transform.transform(Transform.CENTER, leds, 1920, 1080)
+        assert point[0] != previous[0]
+        previous = point
+    assert transform.hits == 0
+
+
+def test_still_leds_reuse_the_homography():
+    transform = Transform()
+    first = transform.transform(Transform.CENTER, LEDS, 1920, 1080)
+    assert transform.transform(Transform.CENTER, list(LEDS), 1920, 1080) == first
+    assert transform.hits == 1 and transform.misses == 1
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# coding: utf-8
+# -*- coding: utf-8 -*-
+
+"""Tests of the report decoding of the IR camera and of the callback dispatcher in wiimote.py. The camera is created
+for a stand-in Wiimote which records what is sent to the controller and which callbacks are posted, so no Bluetooth
+connection is needed."""
+
+import pytest
+
+pytest.importorskip("bluetooth")
+
+import wiimote
+
+
+class FakeCom:
+
+    def set_report_mode(self, mode):
+        self.mode = mode
+
+    def _send(self, *data):
+        pass
+
+
+class FakeMemory:
+
+    def write(self, address, data, eeprom=True):
+        pass
+
+
+class FakeDispatcher:
+
+    def __init__(self):
+        self.posted = []
+
+    def post(self, source, callbacks, state, coalesce=True):
+        self.posted.append((source, state))
+
+
+class FakeWiiMote:
+
+    def __init__(self):
+        self._com = FakeCom()
+        self.memory = FakeMemory()
+        self.dispatcher = FakeDispatcher()
+
+
+def full_report(rpt_type, blobs):
+    """an interleaved report with two blobs (x, y, size) in full mode, the other six bytes of a blob stay zero"""
+    report = bytearray(22)
+    report[0] = rpt_type
+    for offset, (x, y, size) in zip((4, 13), blobs):
+        report[offset] = x & 0xff
+        report[offset + 1] = y & 0xff
+        report[offset + 2] = ((y >> 8) << 6) | ((x >> 8) << 4) | size
+    return bytes(report)
+
+
+@pytest.fixture
+def ir():
+    ir = wiimote.IRCam(FakeWiiMote())
+    ir.set_mode(wiimote.IRCam.MODE_FULL)
+    ir.register_callback(lambda state: None)
+    return ir
+
+
+def test_lone_second_half_is_dropped(ir):
+    # the first report after switching to MODE_FULL, or one whose first half was lost
+    ir.handle_report(full_report(0x3f, [(500, 300, 3), (700, 310, 3)]))
+    assert not ir.get_state()['valid'].any()
+    assert ir.wiimote.dispatcher.posted == []
+
+
+def test_report_pair_decodes_four_blobs(ir):
+    ir.handle_report(full_report(0x3e, [(100, 100, 2), (900, 110, 2)]))
+    assert ir.wiimote.dispatcher.posted == []
+    ir.handle_report(full_report(0x3f, [(120, 700, 2), (880, 710, 2)]))
+    state = ir.get_state()
+    assert state['valid'].all()
+    assert sorted(zip(state['x'], state['y'])) == [(100, 100), (120, 700), (880, 710), (900, 110)]
+    assert len(ir.wiimote.dispatcher.posted) == 1
+
+
+def test_repeated_second_half_is_dropped(ir):
+    ir.handle_report(full_report(0x3e, [(100, 100, 2), (900, 110, 2)]))
+    ir.handle_report(full_report(0x3f, [(120, 700, 2), (880, 710, 2)]))
+    ir.handle_report(full_report(0x3f, [(120, 700, 2), (880, 710, 2)]))
+    assert len(ir.wiimote.dispatcher.posted) == 1
+    assert ir.get_state()['valid'].sum() == 4
+
+
+@pytest.mark.parametrize("policy", [wiimote.CallbackDispatcher.COALESCE_LATEST, wiimote.CallbackDispatcher.DROP_OLDEST])
+def test_full_queue_of_button_events_drops_the_sensor_state(policy):
+    dispatcher = wiimote.CallbackDispatcher(maxsize=3, policy=policy, threaded=False)
+    received = []
+    for event in ("b1", "b2", "b3"):
+        dispatcher.post('buttons', [received.append], event, coalesce=False)
+    dispatcher.post('ir', [received.append], 99)
+    dispatcher.process_pending()
+    assert received == ["b1", "b2", "b3"]
+    assert dispatcher.dropped == 1
+
+
+def test_full_queue_drops_the_sensor_state_before_button_events():
+    dispatcher = wiimote.CallbackDispatcher(maxsize=3, threaded=False)
+    received = []
+    dispatcher.post('buttons', [received.append], "b1", coalesce=False)
+    dispatcher.post('ir', [received.append], 98)
+    dispatcher.post('buttons', [received.append], "b2", coalesce=False)
+    dispatcher.post('buttons', [received.append], "b3", coalesce=False)
+    dispatcher.process_pending()
+    assert received == ["b1", "b2", "b3"]
+    assert dispatcher.dropped == 1
@@ -3,70 +3,182 @@
 # -*- coding: utf-8 -*-
 
 """The code of Transform() is based on the Jupyter Notebook 'Projective Transformation'.
+The four LEDs span a quadrilateral which is mapped to the unit square and from there to the screen. Both mappings are
+calculated in closed form: the 3x3 systems of the notebook are solved with Cramer's rule, where every determinant is
+twice the signed area of a triangle, and the inverse is replaced by the adjugate because a homography does not change
+when it is scaled. Only the camera center (512, 384) is projected, so a report needs a few dozen float operations and
+no matrix objects. Nothing is stored on the object except the caches: the mapping of the unit square to the screen is
+kept per screen size and the projected camera center is reused as long as every one of the four LEDs has moved less
+than the tolerance. The IR coordinates are integers, so with the default of half a camera pixel only LEDs which did
+not move at all reuse it. When the LEDs come with the track ids of IRCam, their assignment to the corners is kept
+until the ids change.
 by Miriam Schlindwein"""
 
 import numpy as np
 
 
-class Transform():
+def _area(P, Q, R):
+    """the determinant of the points P, Q and R in homogeneous coordinates, twice the signed area of the triangle"""
+    return P[0] * (Q[1] - R[1]) - Q[0] * (P[1] - R[1]) + R[0] * (P[1] - Q[1])
 
-    def transform(self, P, leds, W, H):
-        """sort function oriented on 'https://stackoverflow.com/questions/37111798/how-to-sort-a-list-of-x-y-coordinates',
-        the central point of the wiimote is transformed to the screen, the rectangle of the ir camera of the wiimote is
-        equalizes and the central point is calculated to set the cursor on the screen to this relation"""
 
-        A = leds[0]
-        B = leds[1]
-        C = leds[2]
-        D = leds[3]
+class Transform():
 
-        points = [A, B, C, D]
-        points = sorted(points, key=lambda k: k[0])
+    CENTER = 512, 384
+
+    def __init__(self, tolerance=0.5):
+        """tolerance is the distance in camera pixels every LED has to stay below to reuse the cached homography,
+        hits and misses count how often the cached homography was reused or had to be calculated"""
+        self.tolerance = tolerance
+        self.hits = 0
+        self.misses = 0
+        self._unit_to_dest = {}
+        # (corners, unit coordinates of the camera center), replaced as a whole so readers never see a mixed state
+        self._cache = None
+        # (track ids, indices of the corners A, B, C and D)
+        self._corner_order = None
+
+    def cornerOrder(self, leds):
+        """sort function oriented on 'https://stackoverflow.com/questions/37111798/how-to-sort-a-list-of-x-y-coordinates',
+        the indices of the LEDs at the corners A (upper left), B (lower left), C (lower right) and D (upper right) of
+        the camera image"""
+        order = sorted(range(4), key=lambda k: leds[k][0])
 
-        if points[0][1] < points[1][1]:
-            A = points[0]
-            B = points[1]
+        if leds[order[0]][1] < leds[order[1]][1]:
+            A = order[0]
+            B = order[1]
         else:
-            A = points[1]
-            B = points[0]
+            A = order[1]
+            B = order[0]
 
-        if points[2][1] < points[3][1]:
-            D = points[2]
-            C = points[3]
+        if leds[order[2]][1] < leds[order[3]][1]:
+            D = order[2]
+            C = order[3]
         else:
-            D = points[3]
-            C = points[2]
-
-        self.source_points_123 = np. matrix([[A[0], B[0], C[0]], [A[1], B[1], C[1]], [1, 1, 1]])
-        self.source_point_4 = [[D[0]], [D[1]], [1]]
-
-        scale_to_source = np.linalg.solve(self.source_points_123, self.source_point_4)
-        l, m, t = [float(x) for x in scale_to_source]
-
-        unit_to_source = np.matrix([[l * A[0], m * B[0], t * C[0]], [l * A[1], m * B[1], t * C[1]], [l, m, t]])
-
-        DESTINATION_SCREEN_WIDTH = W
-        DESTINATION_SCREEN_HEIGHT = H
+            D = order[3]
+            C = order[2]
+        return A, B, C, D
+
+    def sortCorners(self, leds, ids=None):
+        """the LEDs at the corners A, B, C and D of the camera image. With the track ids of the LEDs (see IRCam) the
+        order is only calculated when the ids change, as long as the same LEDs are tracked it is reused"""
+        if ids is None:
+            order = self.cornerOrder(leds)
+        else:
+            cached = self._corner_order
+            if cached is not None and cached[0] == ids:
+                order = cached[1]
+            else:
+                order = self.cornerOrder(leds)
+                self._corner_order = ids, order
+        return leds[order[0]], leds[order[1]], leds[order[2]], leds[order[3]]
+
+    def transform(self, P, leds, W, H, ids=None):
+        """the central point of the wiimote is transformed to the screen, the rectangle of the ir camera of the wiimote
+        is equalizes and the central point is calculated to set the cursor on the screen to this relation.
+        ids are the optional track ids of the LEDs, with them the LEDs are not sorted again for every report"""
+        A, B, C, D = self.sortCorners(leds, ids)
+
+        cache = self._cache
+        if cache is not None and max(abs(a - b) for corner, cached in zip((A, B, C, D), cache[0])
+                                     for a, b in zip(corner, cached)) < self.tolerance:
+            self.hits += 1
+            unit = cache[1]
+        else:
+            self.misses += 1
+            unit = self.sourceToUnit(A, B, C, D, self.CENTER)
+            self._cache = (A, B, C, D), unit
+
+        (a, b, c), (d, e, f), (g, h, i) = self.unitToDest(W, H)
+        x = a * unit[0] + b * unit[1] + c * unit[2]
+        y = d * unit[0] + e * unit[1] + f * unit[2]
+        z = g * unit[0] + h * unit[1] + i * unit[2]
+        return x / z, y / z
+
+    def sourceToUnit(self, A, B, C, D, point):
+        """the homogeneous coordinates of the camera point in the unit square spanned by the LEDs A, B, C and D.
+        The scales l, m and t of the notebook follow from Cramer's rule, the inverse of the mapping is the adjugate of
+        the corner matrix divided by the scales (the common determinant cancels)"""
+        det = _area(A, B, C)
+        l = _area(D, B, C)
+        m = _area(A, D, C)
+        t = _area(A, B, D)
+        if det == 0 or l == 0 or m == 0 or t == 0:
+            raise np.linalg.LinAlgError("Singular matrix")
+        return _area(point, B, C) / l, _area(A, point, C) / m, _area(A, B, point) / t
+
+    def unitToDest(self, W, H):
+        """the mapping of the unit square to a screen with the width W and the height H as nested tuple of floats,
+        cached per screen size"""
+        if (W, H) in self._unit_to_dest:
+            return self._unit_to_dest[(W, H)]
 
         B2 = 0, 0
-        A2 = 0, DESTINATION_SCREEN_HEIGHT
-        D2 = DESTINATION_SCREEN_WIDTH, DESTINATION_SCREEN_HEIGHT
-        C2 = DESTINATION_SCREEN_WIDTH, 0
-
-        dest_points_123 = np.matrix([[A2[0], B2[0], C2[0]], [A2[1], B2[1], C2[1]], [1, 1, 1]])
-
-        dest_point_4 = np.matrix([[D2[0]], [D2[1]], [1]])
-
-        scale_to_dest = np.linalg.solve(dest_points_123, dest_point_4)
-        l, m, t = [float(x) for x in scale_to_dest]
-
-        unit_to_dest = np.matrix([[l * A2[0], m * B2[0], t * C2[0]], [l * A2[1], m * B2[1], t * C2[1]], [l, m, t]])
-
-        source_to_unit = np.linalg.inv(unit_to_source)
-        source_to_dest = unit_to_dest @ source_to_unit
-
-        x, y, z = [float(w) for w in (source_to_dest @ np.matrix([[512], [384], [1]]))]
-
-        x = x / z
-        y = y / z
-        return x, y
+        A2 = 0, H
+        D2 = W, H
+        C2 = W, 0
+
+        l = _area(D2, B2, C2)
+        m = _area(A2, D2, C2)
+        t = _area(A2, B2, D2)
+        unit_to_dest = ((float(l * A2[0]), float(m * B2[0]), float(t * C2[0])),
+                        (float(l * A2[1]), float(m * B2[1]), float(t * C2[1])),
+                        (float(l), float(m), float(t)))
+        self._unit_to_dest[(W, H)] = unit_to_dest
+        return unit_to_dest
+
+    def homography(self, leds, W, H, out=None):
+        """the complete 3x3 homography from the camera to the screen for the four LEDs, a new array unless it is
+        written into the given array out"""
+        A, B, C, D = self.sortCorners(leds)
+        scales = _area(D, B, C), _area(A, D, C), _area(A, B, D)
+        if _area(A, B, C) == 0 or 0 in scales:
+            raise np.linalg.LinAlgError("Singular matrix")
+        # the rows of the adjugate are divided by the scales of the unit square mapping
+        source_to_unit = np.array(((B[1] - C[1], C[0] - B[0], B[0] * C[1] - C[0] * B[1]),
+                                   (C[1] - A[1], A[0] - C[0], C[0] * A[1] - A[0] * C[1]),
+                                   (A[1] - B[1], B[0] - A[0], A[0] * B[1] - B[0] * A[1])), dtype=float)
+        source_to_unit /= np.array(scales)[:, np.newaxis]
+        return np.matmul(self.unitToDest(W, H), source_to_unit, out=out)
+
+    def transform_batch(self, leds, W, H):
+        """maps many IR frames at once, leds has the shape (N, 4, 2) and the screen points of the camera center are
+        returned with the shape (N, 2). The LEDs of every frame are assigned to the corners like in transform and all
+        homographies are solved with batched np.linalg.solve calls on plain arrays. Frames whose LEDs do not span a
+        quadrilateral get the point (nan, nan)"""
+        leds = np.asarray(leds, dtype=float)
+        frames = np.arange(len(leds))
+
+        # sorted by x, the left pair gives A (upper) and B, the right pair gives D (upper) and C
+        order = np.argsort(leds[:, :, 0], axis=1, kind="stable")
+        points = leds[frames[:, np.newaxis], order]
+        swap_left = ~(points[:, 0, 1] < points[:, 1, 1])
+        swap_right = ~(points[:, 2, 1] < points[:, 3, 1])
+        A = points[frames, swap_left.astype(int)]
+        B = points[frames, 1 - swap_left.astype(int)]
+        D = points[frames, 2 + swap_right.astype(int)]
+        C = points[frames, 3 - swap_right.astype(int)]
+
+        source_points_123 = np.ones((len(leds), 3, 3))
+        source_points_123[:, :2, 0] = A
+        source_points_123[:, :2, 1] = B
+        source_points_123[:, :2, 2] = C
+        source_point_4 = np.ones((len(leds), 3, 1))
+        source_point_4[:, :2, 0] = D
+
+        singular = np.abs(np.linalg.det(source_points_123)) < 1e-9
+        source_points_123[singular] = np.eye(3)
+        scale_to_source = np.linalg.solve(source_points_123, source_point_4)
+
+        # the columns of the points are scaled with l, m and t
+        unit_to_source = source_points_123 * scale_to_source.transpose(0, 2, 1)
+        singular |= np.abs(np.linalg.det(unit_to_source)) < 1e-9
+        unit_to_source[singular] = np.eye(3)
+
+        center = np.broadcast_to(np.array([[512.0], [384.0], [1.0]]), (len(leds), 3, 1))
+        unit = np.linalg.solve(unit_to_source, center)[:, :, 0]
+        x, y, z = np.array(self.unitToDest(W, H)) @ unit.T
+
+        result = np.column_stack((x / z, y / z))
+        result[singular] = np.nan
+        return result
@@ -34,8 +34,14 @@
 # based on the awesome documentation at http://wiibrew.org/wiki/Wiimote
 
 import bluetooth
+import collections
+import math
+import numpy as np
+import select
+import struct
 import threading
 import time
+import traceback
 
 # ################### nanosleep ########################### #
 # from https://github.com/graycatlabs/PyBBIO/blob/master/tests/sleep_test.py
@@ -87,15 +93,17 @@ def find():
     return wiimotes
 
 
-def connect(btaddr, model=None):
+def connect(btaddr, model=None, dispatcher=None):
     """
     Establishes a connection to the Wiimote at *btaddr* and returns a Wiimote
     object. If no *model* is specified, the model is determined automatically.
+    The callbacks are called by *dispatcher*, by default a CallbackDispatcher
+    with its own worker thread.
     """
     if model is None:
         model = bluetooth.lookup_name(btaddr)
     if model in KNOWN_DEVICES:
-        return WiiMote(btaddr, model)
+        return WiiMote(btaddr, model, dispatcher)
     else:
         raise Exception("Wiimote model '%s' unknown!" % (model))
 
@@ -157,7 +165,9 @@ class Accelerometer(object):
     Represents the accelerometer of the Wiimote.
     """
 
-    SUPPORTED_REPORTS = [0x31, 0x33]
+    SUPPORTED_REPORTS = [0x31, 0x33, 0x37]
+
+    REPORT = struct.Struct('5B')  # two button bytes with the LSBs, X, Y and Z MSBs
 
     def __init__(self, wiimote):
         self._state = [0.0, 0.0, 0.0]
@@ -196,29 +206,69 @@ class Accelerometer(object):
 
     def _notify_callbacks(self):
         """
-        Call all registered callback functions with state (x,y,z values) as parameter.
+        Queue a copy of the state (x,y,z values) for all registered callback functions.
         """
-        for callback in self._callbacks:
-            callback(self._state)
+        if self._callbacks:
+            self._wiimote.dispatcher.post('accelerometer', self._callbacks, list(self._state))
 
     def handle_report(self, report):
         """
         Extract accelerometer data from a Wiimote report.
         Usually gets called by the Wiimote CommunicationHandler object.
         """
-        if report[0] in [0x3e, 0x3f]:  # interleaved modes
+        if report[0] in (0x3e, 0x3f):  # interleaved modes
             raise NotImplementedError("Data reporting mode 0x3e/0x3f not supported")
-        x_msb, y_msb, z_msb = report[3:6]
-        x = (x_msb << 2) + ((report[1] & 0b01100000) >> 5)
-        y = (y_msb << 2) + ((report[2] & 0b00100000) >> 4)
-        z = (z_msb << 2) + ((report[2] & 0b01000000) >> 5)
-        self._state = [x, y, z]
+        lsb_x, lsb_yz, x_msb, y_msb, z_msb = self.REPORT.unpack_from(report, 1)
+        # the state list is updated in place, callbacks always get the same list
+        state = self._state
+        state[0] = (x_msb << 2) + ((lsb_x & 0b01100000) >> 5)
+        state[1] = (y_msb << 2) + ((lsb_yz & 0b00100000) >> 4)
+        state[2] = (z_msb << 2) + ((lsb_yz & 0b01000000) >> 5)
         self._notify_callbacks()
 
 
+class ButtonEvent(object):
+    """
+    A change of the Wiimote buttons: `pressed` and `released` are bitmasks
+    of the buttons which went down or up with this report, `state` is the
+    bitmask of all buttons which are down now (see Buttons.BUTTONS).
+    Iterating yields (button, state) pairs of the changed buttons.
+    """
+
+    __slots__ = ('pressed', 'released', 'state')
+
+    def __init__(self, pressed, released, state):
+        self.pressed = pressed
+        self.released = released
+        self.state = state
+
+    def is_pressed(self, btn):
+        return bool(self.pressed & Buttons.BUTTONS[btn])
+
+    def is_released(self, btn):
+        return bool(self.released & Buttons.BUTTONS[btn])
+
+    def is_down(self, btn):
+        return bool(self.state & Buttons.BUTTONS[btn])
+
+    def __iter__(self):
+        changed = self.pressed | self.released
+        while changed:
+            mask = changed & -changed  # lowest set bit
+            changed ^= mask
+            yield Buttons.NAMES[mask], bool(self.pressed & mask)
+
+    def __len__(self):
+        return bin(self.pressed | self.released).count("1")
+
+    def __repr__(self):
+        return "ButtonEvent(%r)" % list(self)
+
+
 class Buttons(object):
     """
     Represents the buttons of the Wiimote.
+    The state of all buttons is kept as one 16-bit integer.
     """
 
     BUTTONS = {'A': 0x0008,
@@ -232,32 +282,43 @@ class Buttons(object):
                'Right': 0x0200,
                'Two': 0x0001,
                'Up': 0x0800, }
+    NAMES = {mask: btn for btn, mask in BUTTONS.items()}
+    # the other bits of the two button bytes belong to the accelerometer
+    MASK = sum(BUTTONS.values())
+
+    REPORT = struct.Struct('>H')
 
     def __init__(self, wiimote):
         self._wiimote = wiimote
         self._com = wiimote._com
-        self._state = {}
-        for button in list(Buttons.BUTTONS.keys()):
-            self._state[button] = False
+        self._bits = 0
         self._callbacks = []
 
     def __len__(self):
-        return len(self._state)
+        return len(Buttons.BUTTONS)
 
     def __repr__(self):
-        return repr(self._state)
+        return repr({btn: bool(self._bits & mask) for btn, mask in Buttons.BUTTONS.items()})
 
     def __getitem__(self, btn):
-        if btn in self._state:
-            return self._state[btn]
+        if btn in Buttons.BUTTONS:
+            return bool(self._bits & Buttons.BUTTONS[btn])
         else:
             raise KeyError(str(btn))
 
+    @property
+    def bits(self):
+        """
+        Bitmask of all buttons which are currently pressed.
+        """
+        return self._bits
+
     def register_callback(self, func):
         """
         Register a callback function `func` that gets called every time
-        when new button states are transmitted from the Wiimote.
-        A list of all _changed_ buttons is passed as parameter to this function.
+        a button is pressed or released on the Wiimote.
+        A ButtonEvent with the changed buttons is passed as parameter to
+        this function; iterating it yields (button, state) pairs.
         """
         self._callbacks.append(func)
 
@@ -269,33 +330,25 @@ class Buttons(object):
         if func in self._callbacks:
             self._callbacks.remove(func)
 
-    def _notify_callbacks(self, diff):
+    def _notify_callbacks(self, event):
         """
-        Call all registered callback functions with a list of buttons whose state
-        has changed as parameter.
+        Queue the ButtonEvent for all registered callback functions. Button
+        events are never coalesced, every edge reaches the callbacks.
         """
-        for callback in self._callbacks:
-            callback(diff)
+        if self._callbacks:
+            self._wiimote.dispatcher.post('buttons', self._callbacks, event, coalesce=False)
 
     def handle_report(self, report):
         """
         Extract button data from a Wiimote report.
         Usually gets called by the Wiimote CommunicationHandler object.
+        Callbacks are only called if a button was pressed or released.
         """
-        btn_bytes = (report[1] << 8) + report[2]
-        new_state = {}
-        for btn, mask in list(Buttons.BUTTONS.items()):
-            new_state[btn] = bool(mask & btn_bytes)
-        diff = self._update_state(new_state)
-        self._notify_callbacks(diff)
-
-    def _update_state(self, new_state):
-        diff = []
-        for btn, state in list(new_state.items()):
-            if self._state[btn] != state:
-                diff.append((btn, state))
-                self._state[btn] = state
-        return diff
+        bits = self.REPORT.unpack_from(report, 1)[0] & Buttons.MASK
+        changed = bits ^ self._bits
+        if changed:
+            self._bits = bits
+            self._notify_callbacks(ButtonEvent(changed & bits, changed & ~bits, bits))
 
 
 class LEDs(object):
@@ -417,6 +470,16 @@ class Speaker(object):
 class IRCam(object):
     """
     Represents the infrared camera of the Wiimote.
+    The blobs are tracked across reports: every blob gets an `id` which
+    stays the same as long as the blob is seen and increases for every new
+    blob, so the consumers can keep their assignment of blobs to LEDs.
+    A blob which is missing for at most `MAX_MISSING` reports is predicted
+    from its last position and velocity and flagged as `predicted`.
+    The state is a structured NumPy array with one record per blob
+    (see STATE_TYPE) which is overwritten in place with every report;
+    only the records whose `valid` flag is set hold a blob.
+    MODE_BASIC (reports 0x36/0x37, no blob sizes), MODE_EXTENDED (0x33)
+    and MODE_FULL (the interleaved reports 0x3e/0x3f) are decoded.
     """
 
     MODE_BASIC = 1
@@ -434,24 +497,41 @@ class IRCam(object):
     ]
 
     SUPPORTED_REPORTS = [0x33, 0x36, 0x37, 0x3e, 0x3f]
+    # data reporting mode with accelerometer and IR data for every IR mode
+    REPORT_MODES = {MODE_BASIC: 0x37, MODE_EXTENDED: 0x33, MODE_FULL: 0x3e}
+
+    STATE_TYPE = np.dtype([('id', 'i4'), ('x', 'i4'), ('y', 'i4'), ('size', 'i4'), ('valid', '?'),
+                           ('predicted', '?')])
+
+    MAX_BLOBS = 4
+    MAX_MISSING = 5  # reports a blob may be missing before its track is dropped
+    MAX_DISTANCE = 100  # camera pixels a blob may move between two reports
 
     def __init__(self, wiimote):
         self.wiimote = wiimote
         self._com = wiimote._com
-        self._state = []
+        self._tracks = []
+        self._state = np.zeros(self.MAX_BLOBS, dtype=self.STATE_TYPE)
+        self._next_id = 0
+        # preallocated slots for the decoded blobs (x, y, size) of one report
+        self._blobs = [[0, 0, 0] for _ in range(self.MAX_BLOBS)]
+        self._num_blobs = 0
+        # set by the first half (0x3e) of an interleaved report pair until its second half (0x3f) arrives
+        self._first_half = False
+        self._blob_matched = [False] * self.MAX_BLOBS
         self._callbacks = []
         self._mode = self.MODE_EXTENDED
         self._sensitivity = 3
         self.set_mode_sensitivity(self._mode, self._sensitivity)
 
     def __len__(self):
-        return len(self._state)
+        return len(self._tracks)
 
     def __repr__(self):
-        return repr(self._state)
+        return repr(self._state[self._state['valid']])
 
     def __getitem__(self, slot):
-        if 0 <= slot < len(self._state):
+        if 0 <= slot < len(self._tracks):
             return self._state[slot]
         else:
             raise IndexError("list index out of range")
@@ -470,12 +550,13 @@ class IRCam(object):
             raise TypeError("wrong mode or sensitivity level given")
         self._mode = mode
         self._sensitivity = sensitivity
-        self._com.set_report_mode(0x33)  # todo: adjust for other modes!!
+        self._first_half = False
+        self._com.set_report_mode(self.REPORT_MODES[mode])
         self._com._send(0x13, 0x04)
         self._com._send(0x1a, 0x04)
         self.wiimote.memory.write(0xb00030, 0x08, eeprom=False)
-        self.wiimote.memory.write(0xb00000, self.SENSITIVITY_BLOCKS[mode][0], eeprom=False)
-        self.wiimote.memory.write(0xb0001a, self.SENSITIVITY_BLOCKS[mode][1], eeprom=False)
+        self.wiimote.memory.write(0xb00000, self.SENSITIVITY_BLOCKS[sensitivity][0], eeprom=False)
+        self.wiimote.memory.write(0xb0001a, self.SENSITIVITY_BLOCKS[sensitivity][1], eeprom=False)
         self.wiimote.memory.write(0xb00033, mode, eeprom=False)
         self.wiimote.memory.write(0xb00030, 0x08, eeprom=False)
 
@@ -499,23 +580,173 @@ class IRCam(object):
             self._callbacks.remove(func)
 
     def _notify_callbacks(self):
-        for callback in self._callbacks:
-            callback(self._state)
+        if self._callbacks:
+            self.wiimote.dispatcher.post('ir', self._callbacks, self._state.copy())
 
     def handle_report(self, report):
         assert(report[0] in self.SUPPORTED_REPORTS)
-        # only extended mode for now!
-        ir_data = report[6:]
-        self._state = []
-        for ir_obj in range(4):
-            data = ir_data[ir_obj*3:(ir_obj+1)*3]
-            x = data[0] + ((data[2] & 0b00110000) << 4)
-            y = data[1] + ((data[2] & 0b11000000) << 2)
-            size = data[2] & 0b00001111
-            if size != 0:
-                self._state.append({'id': ir_obj, 'x': x, 'y': y, 'size': size})
+        rpt_type = report[0]
+        if rpt_type == 0x33:
+            self._num_blobs = 0
+            for offset in range(6, 18, 3):
+                self._decode_extended(report, offset)
+        elif rpt_type == 0x36 or rpt_type == 0x37:
+            self._num_blobs = 0
+            offset = 3 if rpt_type == 0x36 else 6
+            self._decode_basic(report, offset)
+            self._decode_basic(report, offset + 5)
+        elif rpt_type == 0x3e:
+            # first half of an interleaved report pair: blobs 0 and 1
+            self._num_blobs = 0
+            self._decode_extended(report, 4)
+            self._decode_extended(report, 13)
+            self._first_half = True
+            return
+        else:
+            # 0x3f, second half: blobs 2 and 3. Without its first half (lost,
+            # or the first report after switching to MODE_FULL) it is dropped
+            if not self._first_half:
+                return
+            self._first_half = False
+            self._decode_extended(report, 4)
+            self._decode_extended(report, 13)
+        self._track()
+        self._write_state()
         self._notify_callbacks()
 
+    def _add_blob(self, x, y, size):
+        if self._num_blobs >= len(self._blobs):
+            return
+        blob = self._blobs[self._num_blobs]
+        blob[0] = x
+        blob[1] = y
+        blob[2] = size
+        self._num_blobs += 1
+
+    def _decode_extended(self, report, offset):
+        """
+        One blob in extended mode, also the first three of the nine bytes of
+        a blob in full mode: X and Y LSBs, then Y MSBs, X MSBs and size.
+        """
+        flags = report[offset + 2]
+        x = report[offset] + ((flags & 0b00110000) << 4)
+        y = report[offset + 1] + ((flags & 0b11000000) << 2)
+        size = flags & 0b00001111
+        if size != 0 and not x == y == 1023:
+            self._add_blob(x, y, size)
+
+    def _decode_basic(self, report, offset):
+        """
+        Two blobs in basic mode packed into five bytes: X1, Y1, the MSBs of
+        both blobs, X2, Y2. Basic mode has no blob sizes, size is set to 0.
+        """
+        msbs = report[offset + 2]
+        x = report[offset] + ((msbs & 0b00110000) << 4)
+        y = report[offset + 1] + ((msbs & 0b11000000) << 2)
+        if not x == y == 1023:
+            self._add_blob(x, y, 0)
+        x = report[offset + 3] + ((msbs & 0b00000011) << 8)
+        y = report[offset + 4] + ((msbs & 0b00001100) << 6)
+        if not x == y == 1023:
+            self._add_blob(x, y, 0)
+
+    def _write_state(self):
+        """
+        Copy the tracks into the records of the state array, ordered by id.
+        """
+        state = self._state
+        for slot in range(self.MAX_BLOBS):
+            record = state[slot]
+            if slot < len(self._tracks):
+                track = self._tracks[slot]
+                record['id'] = track['id']
+                record['x'] = track['x']
+                record['y'] = track['y']
+                record['size'] = track['size']
+                record['valid'] = True
+                record['predicted'] = track['predicted']
+            else:
+                record['valid'] = False
+                record['predicted'] = False
+
+    def _track(self):
+        """
+        Associate the decoded blobs with the tracks by nearest neighbour:
+        the closest pair of predicted track position and blob is matched
+        first. Unmatched tracks are predicted or dropped, unmatched blobs
+        start new tracks. The tracks are updated in place and kept ordered
+        by id.
+        """
+        tracks = self._tracks
+        blobs = self._blobs
+        num_blobs = self._num_blobs
+        blob_matched = self._blob_matched
+        for b in range(num_blobs):
+            blob_matched[b] = False
+        for track in tracks:
+            track['matched'] = False
+
+        max_distance = self.MAX_DISTANCE ** 2
+        while True:
+            best_track = None
+            best_blob = 0
+            best_distance = max_distance
+            for track in tracks:
+                if track['matched']:
+                    continue
+                px = track['x'] + track['vx']
+                py = track['y'] + track['vy']
+                for b in range(num_blobs):
+                    if blob_matched[b]:
+                        continue
+                    blob = blobs[b]
+                    distance = (blob[0] - px) ** 2 + (blob[1] - py) ** 2
+                    if distance < best_distance or (best_track is None and distance == best_distance):
+                        best_track, best_blob, best_distance = track, b, distance
+            if best_track is None:
+                break
+            x, y, size = blobs[best_blob]
+            blob_matched[best_blob] = True
+            best_track['matched'] = True
+            best_track['vx'] = x - best_track['x']
+            best_track['vy'] = y - best_track['y']
+            best_track['x'] = x
+            best_track['y'] = y
+            best_track['size'] = size
+            best_track['missing'] = 0
+            best_track['predicted'] = False
+
+        i = 0
+        while i < len(tracks):
+            track = tracks[i]
+            if not track['matched']:
+                track['missing'] += 1
+                if track['missing'] > self.MAX_MISSING:
+                    del tracks[i]
+                    continue
+                track['x'] += track['vx']
+                track['y'] += track['vy']
+                track['predicted'] = True
+            i += 1
+
+        for b in range(num_blobs):
+            if blob_matched[b]:
+                continue
+            # a new blob replaces the predicted track which has been missing longest
+            if len(tracks) >= self.MAX_BLOBS:
+                oldest = None
+                for track in tracks:
+                    if track['missing'] > 0 and (oldest is None or track['missing'] > oldest['missing']):
+                        oldest = track
+                if oldest is None:
+                    continue
+                tracks.remove(oldest)
+            x, y, size = blobs[b]
+            # new ids are the largest, so the tracks stay ordered by id
+            tracks.append({'id': self._next_id, 'x': x, 'y': y, 'size': size, 'predicted': False,
+                           'vx': 0, 'vy': 0, 'missing': 0, 'matched': True})
+            self._next_id += 1
+
 
 class Memory(object):
 
@@ -584,6 +815,207 @@ class Memory(object):
             self._request_in_progress = False
 
 
+class ReportStats(object):
+    """
+    Report rate and inter-arrival jitter of the received reports.
+    The intervals are summed up for one second at a time; afterwards
+    `rate` (reports per second), `mean_interval` and `jitter` (standard
+    deviation of the intervals, both in milliseconds) describe that second.
+    """
+
+    def __init__(self, period=1.0):
+        self.period = period
+        self.reports = 0
+        self.errors = 0
+        self.rate = 0.0
+        self.mean_interval = 0.0
+        self.jitter = 0.0
+        self._last = None
+        self._start = None
+        self._count = 0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    def record(self, now):
+        """
+        Count a report received at the monotonic time `now` (seconds).
+        """
+        self.reports += 1
+        if self._last is None:
+            self._last = self._start = now
+            return
+        interval = now - self._last
+        self._last = now
+        self._count += 1
+        self._sum += interval
+        self._sum_sq += interval * interval
+        elapsed = now - self._start
+        if elapsed >= self.period:
+            mean = self._sum / self._count
+            self.rate = self._count / elapsed
+            self.mean_interval = mean * 1000
+            self.jitter = math.sqrt(max(self._sum_sq / self._count - mean * mean, 0.0)) * 1000
+            self._start = now
+            self._count = 0
+            self._sum = self._sum_sq = 0.0
+
+    def as_dict(self):
+        return {'reports': self.reports, 'errors': self.errors, 'rate_hz': self.rate,
+                'mean_interval_ms': self.mean_interval, 'jitter_ms': self.jitter}
+
+
+class CallbackDispatcher(object):
+    """
+    Calls the callbacks of the sensors outside of the thread which receives
+    the reports, so a slow callback does not delay the reception.
+    The sensors post a copy of their state into a bounded queue. The queue
+    is processed by a worker thread (`threaded=True`) or by calling
+    `process_pending()`, e.g. from a Qt timer, so that the callbacks run in
+    the GUI thread.
+    If the queue is full, the oldest sensor state is dropped (`DROP_OLDEST`).
+    With `COALESCE_LATEST` a new state of a sensor additionally replaces its
+    state which is still waiting in the queue, so only the latest state of
+    each sensor is delivered. Entries posted with `coalesce=False` (button
+    events) are never coalesced: if the queue holds only button events, a
+    new sensor state is dropped instead of one of them, and only a new
+    button event drops the oldest button event.
+    """
+
+    DROP_OLDEST = 'drop-oldest'
+    COALESCE_LATEST = 'coalesce-latest'
+
+    def __init__(self, maxsize=64, policy=COALESCE_LATEST, threaded=True):
+        if policy not in (self.DROP_OLDEST, self.COALESCE_LATEST):
+            raise ValueError("unknown overflow policy '%s'" % policy)
+        self.maxsize = maxsize
+        self.policy = policy
+        self.threaded = threaded
+        self.posted = 0
+        self.dispatched = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+        self._queue = collections.deque()
+        self._waiting = {}  # source -> its entry in the queue, for coalescing
+        self._condition = threading.Condition()
+        self._worker = None
+        self._running = False
+        if threaded:
+            self.start()
+
+    @property
+    def depth(self):
+        return len(self._queue)
+
+    def stats(self):
+        return {'depth': len(self._queue), 'max_depth': self.max_depth, 'posted': self.posted,
+                'dispatched': self.dispatched, 'dropped': self.dropped, 'coalesced': self.coalesced}
+
+    def post(self, source, callbacks, state, coalesce=True):
+        """
+        Queue `state` for the `callbacks` of the sensor `source`.
+        """
+        with self._condition:
+            self.posted += 1
+            if coalesce and self.policy == self.COALESCE_LATEST:
+                entry = self._waiting.get(source)
+                if entry is not None:
+                    entry[2] = state
+                    self.coalesced += 1
+                    return
+            if len(self._queue) >= self.maxsize and not self._drop_one(coalesce):
+                self.dropped += 1
+                return
+            entry = [source, callbacks, state, coalesce]
+            self._queue.append(entry)
+            if coalesce:
+                self._waiting[source] = entry
+            if len(self._queue) > self.max_depth:
+                self.max_depth = len(self._queue)
+            self._condition.notify()
+
+    def _drop_one(self, coalesce):
+        """
+        Drop the oldest sensor state to make room for a new entry, or the
+        oldest button event if the new entry is a button event as well.
+        Return False if the new entry has to be dropped instead.
+        """
+        victim = None
+        for entry in self._queue:
+            if entry[3]:
+                victim = entry
+                break
+        if victim is None:
+            if coalesce:
+                return False
+            victim = self._queue[0]
+        self._queue.remove(victim)
+        if self._waiting.get(victim[0]) is victim:
+            del self._waiting[victim[0]]
+        self.dropped += 1
+        return True
+
+    def _pop(self):
+        entry = self._queue.popleft()
+        if self._waiting.get(entry[0]) is entry:
+            del self._waiting[entry[0]]
+        return entry
+
+    def _dispatch(self, entry):
+        for callback in list(entry[1]):
+            try:
+                callback(entry[2])
+            except Exception:
+                traceback.print_exc()
+        self.dispatched += 1
+
+    def process_pending(self, limit=None):
+        """
+        Call the callbacks of the queued entries (at most `limit`) in the
+        calling thread and return how many entries were processed.
+        """
+        count = 0
+        while limit is None or count < limit:
+            with self._condition:
+                if not self._queue:
+                    break
+                entry = self._pop()
+            self._dispatch(entry)
+            count += 1
+        return count
+
+    def start(self):
+        """
+        Start the worker thread which processes the queue.
+        """
+        if self._worker is not None:
+            return
+        self._running = True
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def stop(self):
+        """
+        Stop the worker thread, queued entries stay in the queue.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join()
+        self._worker = None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running and not self._queue:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                entry = self._pop()
+            self._dispatch(entry)
+
+
 class CommunicationHandler(threading.Thread):
 
     MODE_DEFAULT = 0x30
@@ -592,6 +1024,9 @@ class CommunicationHandler(threading.Thread):
 
     RPT_STATUS_REQ = 0x15
 
+    POLL_TIMEOUT = 1.0  # seconds select waits before `running` is checked again
+    ERROR_BACKOFF_MAX = 0.5  # longest pause in seconds after repeated BluetoothErrors
+
     def __init__(self, wiimote):
         threading.Thread.__init__(self)
         self.daemon = True
@@ -600,6 +1035,9 @@ class CommunicationHandler(threading.Thread):
         self.btaddr = wiimote.btaddr
         self.model = wiimote.model
         self.reporting_mode = self.MODE_DEFAULT
+        self.stats = ReportStats()
+        self._error_backoff = 0.0
+        self._dispatch = ((),) * 256  # filled by build_dispatch_table() once the sensors exist
         self._controlsocket = bluetooth.BluetoothSocket(bluetooth.L2CAP)
         self._controlsocket.connect((self.btaddr, 17))
         self._datasocket = bluetooth.BluetoothSocket(bluetooth.L2CAP)
@@ -628,19 +1066,40 @@ class CommunicationHandler(threading.Thread):
         self._sendsocket.send(data_str)
 
     def run(self):
+        """
+        Wait with select() until reports arrive and handle all pending
+        reports in one burst. After a BluetoothError the loop pauses with an
+        exponential backoff instead of calling recv() again right away.
+        """
         self.running = True
+        while self.running:
+            try:
+                readable, _, _ = select.select([self._datasocket], [], [], self.POLL_TIMEOUT)
+            except (OSError, ValueError):  # socket closed
+                break
+            if readable:
+                self._receive_pending()
+        self._dispose()
+
+    def _receive_pending(self):
         while self.running:
             try:
                 data = self._datasocket.recv(32)
             except bluetooth.BluetoothError:
                 _debug("BluetoothError while waiting for data")
-                continue
+                self.stats.errors += 1
+                self._error_backoff = min(max(2 * self._error_backoff, 0.001), self.ERROR_BACKOFF_MAX)
+                time.sleep(self._error_backoff)
+                return
+            self._error_backoff = 0.0
             if len(data) < 2:  # disconnect!
                 self.running = False
-            else:
-                self._handle(data)
-            time.sleep(0.001)  # Wiimote: 100 Hz, check ten times as often
-        self._dispose()
+                return
+            self.stats.record(time.monotonic())
+            self._handle(data)
+            # more reports queued?
+            if not select.select([self._datasocket], [], [], 0)[0]:
+                return
 
     def _dispose(self):
         self._datasocket.close()
@@ -651,18 +1110,29 @@ class CommunicationHandler(threading.Thread):
         self.reporting_mode = mode
         self._send(0x12, 0x00, mode)
 
+    def build_dispatch_table(self):
+        """
+        Precompute for every report ID the handlers of the sensors which
+        read it, so _handle() needs one table lookup per report.
+        """
+        wiimote = self.wiimote
+        table = []
+        for rpt_type in range(256):
+            # all reports include button data
+            handlers = [wiimote.buttons.handle_report]
+            for sensor in (wiimote.accelerometer, wiimote.memory, wiimote.ir):
+                if rpt_type in sensor.SUPPORTED_REPORTS:
+                    handlers.append(sensor.handle_report)
+            table.append(tuple(handlers))
+        self._dispatch = tuple(table)
+
     def _handle(self, bytes_read):
-        _debug("received " + str(bytes_read))
+        if DEBUG:
+            _debug("received " + str(bytes_read))
         # assert(bytes_read[0] == self._CMD_SET_REPORT + 1)
-        rpt_type = bytes_read[1]
-        # all reports include button data
-        self.wiimote.buttons.handle_report(bytes_read[1:])
-        if rpt_type in Accelerometer.SUPPORTED_REPORTS:
-            self.wiimote.accelerometer.handle_report(bytes_read[1:])
-        if rpt_type in Memory.SUPPORTED_REPORTS:
-            self.wiimote.memory.handle_report(bytes_read[1:])
-        if rpt_type in IRCam.SUPPORTED_REPORTS:
-            self.wiimote.ir.handle_report(bytes_read[1:])
+        report = memoryview(bytes_read)[1:]
+        for handler in self._dispatch[report[0]]:
+            handler(report)
 
     def set_rumble(self, state):
         self.rumble = state
@@ -673,10 +1143,11 @@ class CommunicationHandler(threading.Thread):
 class WiiMote(object):
 
     # instance methods
-    def __init__(self, btaddr, model):
+    def __init__(self, btaddr, model, dispatcher=None):
         self.btaddr = btaddr
         self.model = model
         self.connected = False
+        self.dispatcher = dispatcher if dispatcher is not None else CallbackDispatcher()
         self._com = CommunicationHandler(self)
         self._leds = LEDs(self)
         self.accelerometer = Accelerometer(self)
@@ -685,6 +1156,7 @@ class WiiMote(object):
         self.speaker = Speaker(self)
         self.memory = Memory(self)
         self.ir = IRCam(self)
+        self._com.build_dispatch_table()
         """
         Initializations before this point may not read from memory as
         this would block forever (until the CommunicationHandler is started).
@@ -696,6 +1168,7 @@ class WiiMote(object):
 
     def disconnect(self):
         self._com.running = False
+        self.dispatcher.stop()
 
     def _get_capabilities(self):
         return None
@@ -712,6 +1185,13 @@ class WiiMote(object):
     def rumble(self, length=0.5):
         self.rumbler.rumble(length)
 
+    def get_report_stats(self):
+        """
+        Report rate and inter-arrival jitter of the last second and the
+        number of received reports and receive errors, see ReportStats.
+        """
+        return self._com.stats.as_dict()
+
     def get_leds(self):
         return self._leds
 